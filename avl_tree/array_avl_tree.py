@@ -0,0 +1,364 @@
+"""
+Array-Backed AVL Tree Implementation
+
+An AVL tree whose nodes are not Python objects but integer handles into a
+pool of parallel typed arrays: keys, left child, right child, height and
+subtree size. A node costs about 33 bytes instead of the ~200 of a TreeNode
+object, and deleted slots go on a free list (threaded through the left child
+array) so they are reused by later insertions instead of growing the pool.
+
+Handle 0 is the shared empty node with height 0 and size 0, so the balancing
+code needs no None checks.
+"""
+
+from array import array
+
+
+class ArrayAVLTree:
+    """
+    AVL tree over a struct-of-arrays node pool.
+
+    Supports insertion, deletion, search, order statistics and lazy range
+    scans like AVLTree, but not its join-based split, join, union,
+    intersection or difference. Keys are stored as 64-bit integers by
+    default; pass typecode='d' for floating point keys.
+    """
+
+    def __init__(self, typecode='q'):
+        self.root = 0
+        self.keys = array(typecode, [0])
+        self.left = array('q', [0])
+        self.right = array('q', [0])
+        self.heights = array('b', [0])
+        self.sizes = array('q', [0])
+        self._free = 0  # head of the free list, 0 when empty
+
+    @classmethod
+    def from_sorted(cls, iterable, typecode='q'):
+        """
+        Build a perfectly balanced tree from strictly increasing keys in O(n).
+
+        Raises ValueError if the keys are not strictly increasing.
+        """
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError("from_sorted() requires strictly increasing values")
+
+        tree = cls(typecode)
+        tree.root = tree._build_balanced(values, 0, len(values) - 1)
+        return tree
+
+    def _build_balanced(self, values, start, end):
+        """Build a balanced subtree from values[start:end + 1] and return its handle."""
+        if start > end:
+            return 0
+
+        mid = (start + end) // 2
+        node = self._new_node(values[mid])
+        self.left[node] = self._build_balanced(values, start, mid - 1)
+        self.right[node] = self._build_balanced(values, mid + 1, end)
+        self._update_height(node)
+        return node
+
+    def _new_node(self, key):
+        """Allocate a leaf for key, reusing a freed slot if there is one."""
+        node = self._free
+        if node:
+            # Write the key first: if the array rejects it, the slot stays free
+            self.keys[node] = key
+            self._free = self.left[node]
+            self.left[node] = 0
+            self.right[node] = 0
+            self.heights[node] = 1
+            self.sizes[node] = 1
+            return node
+
+        self.keys.append(key)
+        self.left.append(0)
+        self.right.append(0)
+        self.heights.append(1)
+        self.sizes.append(1)
+        return len(self.keys) - 1
+
+    def _release(self, node):
+        """Put a detached node on the free list."""
+        self.left[node] = self._free
+        self.right[node] = 0
+        self._free = node
+
+    def _update_height(self, node):
+        """Update the height and subtree size of a node."""
+        heights = self.heights
+        sizes = self.sizes
+        left = self.left[node]
+        right = self.right[node]
+        heights[node] = 1 + max(heights[left], heights[right])
+        sizes[node] = 1 + sizes[left] + sizes[right]
+
+    def _get_balance(self, node):
+        """Get the balance factor of a node."""
+        return self.heights[self.left[node]] - self.heights[self.right[node]]
+
+    def _rotate_right(self, z):
+        """Perform right rotation."""
+        y = self.left[z]
+        self.left[z] = self.right[y]
+        self.right[y] = z
+        self._update_height(z)
+        self._update_height(y)
+        return y
+
+    def _rotate_left(self, z):
+        """Perform left rotation."""
+        y = self.right[z]
+        self.right[z] = self.left[y]
+        self.left[y] = z
+        self._update_height(z)
+        self._update_height(y)
+        return y
+
+    def _rebalance(self, node):
+        """Update the height of node and restore the AVL property with rotations."""
+        self._update_height(node)
+        balance = self._get_balance(node)
+
+        if balance > 1:
+            if self._get_balance(self.left[node]) < 0:
+                self.left[node] = self._rotate_left(self.left[node])
+            return self._rotate_right(node)
+
+        if balance < -1:
+            if self._get_balance(self.right[node]) > 0:
+                self.right[node] = self._rotate_right(self.right[node])
+            return self._rotate_left(node)
+
+        return node
+
+    def insert(self, value):
+        """Insert a value into the tree; duplicates are ignored."""
+        self.root = self._insert_recursive(self.root, value)
+
+    def _insert_recursive(self, node, value):
+        """Helper method for recursive insertion with balancing."""
+        if not node:
+            return self._new_node(value)
+
+        key = self.keys[node]
+        if value < key:
+            self.left[node] = self._insert_recursive(self.left[node], value)
+        elif value > key:
+            self.right[node] = self._insert_recursive(self.right[node], value)
+        else:
+            return node
+
+        return self._rebalance(node)
+
+    def insert_many(self, values):
+        """Insert a batch of values one by one."""
+        for value in values:
+            self.insert(value)
+
+    def delete_many(self, values):
+        """Delete a batch of values one by one; missing values are ignored."""
+        for value in values:
+            self.delete(value)
+
+    def delete(self, value):
+        """Delete a value from the tree and recycle its slot."""
+        self.root = self._delete_recursive(self.root, value)
+
+    def _delete_recursive(self, node, value):
+        """Helper method for recursive deletion with balancing."""
+        if not node:
+            return node
+
+        key = self.keys[node]
+        if value < key:
+            self.left[node] = self._delete_recursive(self.left[node], value)
+        elif value > key:
+            self.right[node] = self._delete_recursive(self.right[node], value)
+        else:
+            left = self.left[node]
+            right = self.right[node]
+            if not left or not right:
+                self._release(node)
+                return left or right
+
+            # Node with two children: take over the successor's key
+            successor = right
+            while self.left[successor]:
+                successor = self.left[successor]
+            self.keys[node] = self.keys[successor]
+            self.right[node] = self._delete_recursive(right, self.keys[successor])
+
+        return self._rebalance(node)
+
+    def _find_node(self, value):
+        """Return the handle holding value, or 0."""
+        keys = self.keys
+        left = self.left
+        right = self.right
+        node = self.root
+        while node:
+            key = keys[node]
+            if value < key:
+                node = left[node]
+            elif value > key:
+                node = right[node]
+            else:
+                return node
+        return 0
+
+    def search(self, value):
+        """Search for a value in the tree."""
+        return self._find_node(value) != 0
+
+    def __len__(self):
+        """Number of values in the tree, in O(1)."""
+        return self.sizes[self.root]
+
+    def _count_less(self, value, inclusive=False):
+        """Count values less than (or, if inclusive, equal to) value."""
+        keys = self.keys
+        sizes = self.sizes
+        count = 0
+        node = self.root
+        while node:
+            key = keys[node]
+            if value < key or (value == key and not inclusive):
+                node = self.left[node]
+            else:
+                count += 1 + sizes[self.left[node]]
+                node = self.right[node]
+        return count
+
+    def rank(self, value):
+        """Number of values in the tree smaller than value, in O(log n)."""
+        return self._count_less(value)
+
+    def select(self, k):
+        """
+        Return the k-th smallest value (k = 0 is the minimum), in O(log n).
+
+        Returns None if k is out of range.
+        """
+        if not 0 <= k < len(self):
+            return None
+
+        node = self.root
+        while node:
+            left_size = self.sizes[self.left[node]]
+            if k < left_size:
+                node = self.left[node]
+            elif k == left_size:
+                return self.keys[node]
+            else:
+                k -= left_size + 1
+                node = self.right[node]
+
+    def count_range(self, lo, hi):
+        """Number of values v with lo <= v <= hi, in O(log n)."""
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo)
+
+    def __iter__(self):
+        """Iterate over the values in ascending order."""
+        return self.irange()
+
+    def __reversed__(self):
+        """Iterate over the values in descending order."""
+        return self.irange(reverse=True)
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield the values v with lo <= v <= hi in sorted order.
+
+        Either bound may be None for an open end. Producing k values costs
+        O(log n + k).
+        """
+        keys = self.keys
+        left = self.left
+        right = self.right
+        stack = []
+        if not reverse:
+            # Push the path to the first value >= lo
+            node = self.root
+            while node:
+                if lo is None or keys[node] >= lo:
+                    stack.append(node)
+                    node = left[node]
+                else:
+                    node = right[node]
+
+            while stack:
+                node = stack.pop()
+                key = keys[node]
+                if hi is not None and key > hi:
+                    return
+                yield key
+                node = right[node]
+                while node:
+                    stack.append(node)
+                    node = left[node]
+        else:
+            # Push the path to the last value <= hi
+            node = self.root
+            while node:
+                if hi is None or keys[node] <= hi:
+                    stack.append(node)
+                    node = right[node]
+                else:
+                    node = left[node]
+
+            while stack:
+                node = stack.pop()
+                key = keys[node]
+                if lo is not None and key < lo:
+                    return
+                yield key
+                node = left[node]
+                while node:
+                    stack.append(node)
+                    node = right[node]
+
+    def inorder_traversal(self):
+        """Inorder traversal (Left -> Root -> Right)."""
+        return list(self.irange())
+
+    def is_balanced(self):
+        """Check if the tree is balanced (AVL property)."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not node:
+                continue
+            if abs(self._get_balance(node)) > 1:
+                return False
+            stack.append(self.left[node])
+            stack.append(self.right[node])
+        return True
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = ArrayAVLTree()
+
+    values = [10, 20, 30, 40, 50, 25]
+    print("Inserting values:", values)
+    for val in values:
+        tree.insert(val)
+
+    print("\nArray-Backed AVL Tree Operations:")
+    print(f"Inorder traversal: {tree.inorder_traversal()}")
+    print(f"Is balanced: {tree.is_balanced()}")
+    print(f"Search 25: {tree.search(25)}")
+    print(f"Rank of 30: {tree.rank(30)}")  # 3 values are smaller
+    print(f"Lazy range [15, 40]: {list(tree.irange(15, 40))}")
+
+    print("\nDeleting 40, then inserting 45...")
+    tree.delete(40)
+    tree.insert(45)  # reuses the slot freed by the delete
+    print(f"Inorder traversal: {tree.inorder_traversal()}")
+    print(f"Allocated slots: {len(tree.keys) - 1}")  # still 6
@@ -14,6 +14,7 @@ class TreeNode:
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1  # number of nodes in this subtree
 
 
 class AVLTree:
@@ -22,6 +23,39 @@ class AVLTree:
     def __init__(self):
         self.root = None
     
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Build a perfectly balanced AVL tree from strictly increasing values in O(n).
+        
+        No comparisons or rotations are needed beyond checking the order.
+        Raises ValueError if the values are not strictly increasing.
+        """
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError("from_sorted() requires strictly increasing values")
+        
+        tree = cls()
+        tree.root = tree._build_balanced(values, 0, len(values) - 1)
+        return tree
+    
+    def _build_balanced(self, values, start, end):
+        """Build a balanced subtree from values[start:end + 1] with correct heights."""
+        if start > end:
+            return None
+        
+        mid = (start + end) // 2
+        node = self._new_node(values[mid])
+        node.left = self._build_balanced(values, start, mid - 1)
+        node.right = self._build_balanced(values, mid + 1, end)
+        self._update_height(node)
+        return node
+    
+    def _new_node(self, value):
+        """Create a node; subclasses override this to store extra fields."""
+        return TreeNode(value)
+    
     def _get_height(self, node):
         """Get the height of a node."""
         if not node:
@@ -34,11 +68,18 @@ class AVLTree:
             return 0
         return self._get_height(node.left) - self._get_height(node.right)
     
+    def _get_size(self, node):
+        """Get the number of nodes in the subtree rooted at node."""
+        if not node:
+            return 0
+        return node.size
+    
     def _update_height(self, node):
-        """Update the height of a node."""
+        """Update the height and subtree size of a node."""
         if node:
             node.height = 1 + max(self._get_height(node.left), 
                                   self._get_height(node.right))
+            node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
     
     def _rotate_right(self, z):
         """Perform right rotation."""
@@ -78,7 +119,7 @@ class AVLTree:
         """Helper method for recursive insertion with balancing."""
         # Standard BST insertion
         if not node:
-            return TreeNode(value)
+            return self._new_node(value)
         
         if value < node.value:
             node.left = self._insert_recursive(node.left, value)
@@ -114,6 +155,31 @@ class AVLTree:
         
         return node
     
+    def insert_many(self, values):
+        """
+        Insert a batch of values.
+        
+        The batch is sorted once, built into a balanced tree in linear time
+        and merged in with a single union, which costs O(m log(n/m + 1))
+        instead of m separate descents and rebalances.
+        """
+        batch = self._sorted_unique(values)
+        self.root = self._union(self.root, self._build_balanced(batch, 0, len(batch) - 1))
+    
+    def delete_many(self, values):
+        """Delete a batch of values with a single difference; missing values are ignored."""
+        batch = self._sorted_unique(values)
+        self.root = self._difference(self.root, self._build_balanced(batch, 0, len(batch) - 1))
+    
+    def _sorted_unique(self, values):
+        """Sort values and drop duplicates."""
+        batch = sorted(values)
+        unique = batch[:1]
+        for value in batch[1:]:
+            if unique[-1] < value:
+                unique.append(value)
+        return unique
+    
     def delete(self, value):
         """Delete a value from the AVL tree."""
         self.root = self._delete_recursive(self.root, value)
@@ -140,6 +206,15 @@ class AVLTree:
             node.value = min_node.value
             node.right = self._delete_recursive(node.right, min_node.value)
         
+        return self._rebalance(node)
+    
+    def _rebalance(self, node):
+        """
+        Update the height of node and restore the AVL property with rotations.
+        
+        Works whenever the children of node are valid AVL trees whose heights
+        differ by at most two. Returns the new root of the subtree.
+        """
         # Update height
         self._update_height(node)
         
@@ -173,6 +248,13 @@ class AVLTree:
             current = current.left
         return current
     
+    def _find_max(self, node):
+        """Find the node with maximum value in a subtree."""
+        current = node
+        while current.right:
+            current = current.right
+        return current
+    
     def search(self, value):
         """Search for a value in the AVL tree."""
         return self._search_recursive(self.root, value)
@@ -189,6 +271,265 @@ class AVLTree:
         else:
             return self._search_recursive(node.right, value)
     
+    def _join(self, left, node, right):
+        """
+        Join two subtrees around node, where left < node.value < right.
+        
+        Walks down the spine of the taller tree until the heights match,
+        so the cost is O(|height(left) - height(right)| + 1).
+        """
+        left_height = self._get_height(left)
+        right_height = self._get_height(right)
+        
+        if left_height > right_height + 1:
+            left.right = self._join(left.right, node, right)
+            return self._rebalance(left)
+        
+        if right_height > left_height + 1:
+            right.left = self._join(left, node, right.left)
+            return self._rebalance(right)
+        
+        node.left = left
+        node.right = right
+        self._update_height(node)
+        return node
+    
+    def _join_pair(self, left, right):
+        """Join two subtrees where every value of left is less than right."""
+        if not left:
+            return right
+        left, last = self._split_last(left)
+        return self._join(left, last, right)
+    
+    def _split_last(self, node):
+        """Detach the maximum node of a subtree; returns (rest, max_node)."""
+        if not node.right:
+            return node.left, node
+        rest, last = self._split_last(node.right)
+        return self._join(node.left, node, rest), last
+    
+    def _split(self, node, key):
+        """Split a subtree into (values < key, key was present, values > key)."""
+        if not node:
+            return None, False, None
+        
+        if key < node.value:
+            left, found, right = self._split(node.left, key)
+            return left, found, self._join(right, node, node.right)
+        
+        if key > node.value:
+            left, found, right = self._split(node.right, key)
+            return self._join(node.left, node, left), found, right
+        
+        return node.left, True, node.right
+    
+    def _union(self, a, b):
+        """Union of two subtrees, reusing their nodes."""
+        if not a:
+            return b
+        if not b:
+            return a
+        
+        left, _, right = self._split(a, b.value)
+        b_left, b_right = b.left, b.right
+        return self._join(self._union(left, b_left), b,
+                          self._union(right, b_right))
+    
+    def _intersection(self, a, b):
+        """Intersection of two subtrees, reusing their nodes."""
+        if not a or not b:
+            return None
+        
+        left, found, right = self._split(a, b.value)
+        b_left, b_right = b.left, b.right
+        left = self._intersection(left, b_left)
+        right = self._intersection(right, b_right)
+        if found:
+            return self._join(left, b, right)
+        return self._join_pair(left, right)
+    
+    def _difference(self, a, b):
+        """Values of subtree a that are not in subtree b, reusing a's nodes."""
+        if not a:
+            return None
+        if not b:
+            return a
+        
+        left, _, right = self._split(a, b.value)
+        return self._join_pair(self._difference(left, b.left),
+                               self._difference(right, b.right))
+    
+    def split(self, key):
+        """
+        Split the tree into (smaller, found, larger) in O(log n).
+        
+        smaller and larger are new AVL trees holding the values below and
+        above key; found tells whether key itself was present. This tree is
+        left empty, since its nodes now belong to the two halves.
+        """
+        left, found, right = self._split(self.root, key)
+        self.root = None
+        
+        smaller = type(self)()
+        smaller.root = left
+        larger = type(self)()
+        larger.root = right
+        return smaller, found, larger
+    
+    @classmethod
+    def join(cls, left, key, right):
+        """
+        Return a new tree holding left's values, key and right's values.
+        
+        Every value in left must be less than key and every value in right
+        greater; otherwise ValueError is raised. Runs in O(log n) and leaves
+        left and right empty.
+        """
+        if left.root and left._find_max(left.root).value >= key:
+            raise ValueError("join() requires max(left) < key")
+        if right.root and not key < right._find_min(right.root).value:
+            raise ValueError("join() requires key < min(right)")
+        
+        tree = cls()
+        tree.root = tree._join(left.root, tree._new_node(key), right.root)
+        left.root = None
+        right.root = None
+        return tree
+    
+    def union(self, other):
+        """
+        Add every value of other to this tree, in O(m log(n/m + 1)).
+        
+        The nodes of other are reused, so other is left empty.
+        """
+        self.root = self._union(self.root, other.root)
+        other.root = None
+    
+    def intersection(self, other):
+        """
+        Keep only the values also present in other, in O(m log(n/m + 1)).
+        
+        The nodes of other are reused, so other is left empty.
+        """
+        self.root = self._intersection(self.root, other.root)
+        other.root = None
+    
+    def difference(self, other):
+        """
+        Remove every value of other from this tree, in O(m log(n/m + 1)).
+        
+        other is left empty.
+        """
+        self.root = self._difference(self.root, other.root)
+        other.root = None
+    
+    def __len__(self):
+        """Number of values in the tree, in O(1)."""
+        return self._get_size(self.root)
+    
+    def _count_less(self, value, inclusive=False):
+        """Count values less than (or, if inclusive, equal to) value."""
+        count = 0
+        node = self.root
+        while node:
+            if value < node.value or (value == node.value and not inclusive):
+                node = node.left
+            else:
+                count += 1 + self._get_size(node.left)
+                node = node.right
+        return count
+    
+    def rank(self, value):
+        """Number of values in the tree smaller than value, in O(log n)."""
+        return self._count_less(value)
+    
+    def select(self, k):
+        """
+        Return the k-th smallest value (k = 0 is the minimum), in O(log n).
+        
+        Returns None if k is out of range.
+        """
+        if not 0 <= k < len(self):
+            return None
+        
+        node = self.root
+        while node:
+            left_size = self._get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+    
+    def count_range(self, lo, hi):
+        """Number of values v with lo <= v <= hi, in O(log n)."""
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo)
+    
+    def __iter__(self):
+        """Iterate over the values in ascending order."""
+        return self.irange()
+    
+    def __reversed__(self):
+        """Iterate over the values in descending order."""
+        return self.irange(reverse=True)
+    
+    def irange(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield the values v with lo <= v <= hi in sorted order.
+        
+        Either bound may be None for an open end. The generator seeks the
+        first value in O(log n) and keeps an explicit stack of at most
+        O(log n) nodes, so producing k values costs O(log n + k).
+        """
+        for node in self._iter_nodes(lo, hi, reverse):
+            yield node.value
+    
+    def _iter_nodes(self, lo=None, hi=None, reverse=False):
+        """Lazily yield the nodes with lo <= node.value <= hi in sorted order."""
+        stack = []
+        if not reverse:
+            # Push the path to the first value >= lo
+            node = self.root
+            while node:
+                if lo is None or node.value >= lo:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            
+            while stack:
+                node = stack.pop()
+                if hi is not None and node.value > hi:
+                    return
+                yield node
+                node = node.right
+                while node:
+                    stack.append(node)
+                    node = node.left
+        else:
+            # Push the path to the last value <= hi
+            node = self.root
+            while node:
+                if hi is None or node.value <= hi:
+                    stack.append(node)
+                    node = node.right
+                else:
+                    node = node.left
+            
+            while stack:
+                node = stack.pop()
+                if lo is not None and node.value < lo:
+                    return
+                yield node
+                node = node.left
+                while node:
+                    stack.append(node)
+                    node = node.right
+    
     def inorder_traversal(self, node=None, result=None):
         """Inorder traversal (Left -> Root -> Right)."""
         if result is None:
@@ -233,6 +574,19 @@ if __name__ == "__main__":
     print(f"Is balanced: {avl.is_balanced()}")
     print(f"Search 25: {avl.search(25)}")
     print(f"Search 100: {avl.search(100)}")
+    print(f"Size: {len(avl)}")
+    print(f"Rank of 30: {avl.rank(30)}")  # 3 values are smaller
+    print(f"Select 0 (minimum): {avl.select(0)}")
+    print(f"Values in [15, 40]: {avl.count_range(15, 40)}")  # 20, 25, 30, 40
+    print(f"Lazy range [15, 40]: {list(avl.irange(15, 40))}")
+    
+    # Set operations
+    other = AVLTree.from_sorted([5, 25, 45])
+    avl.union(other)
+    print(f"\nAfter union with [5, 25, 45]: {avl.inorder_traversal()}")
+    smaller, found, larger = avl.split(30)
+    print(f"Split at 30: {smaller.inorder_traversal()}, {found}, {larger.inorder_traversal()}")
+    avl = AVLTree.join(smaller, 30, larger)
     
     # Delete a value
     print(f"\nDeleting 40...")
@@ -0,0 +1,213 @@
+"""
+AVL Tree Map Implementation
+
+A sorted mapping built on AVLTree. Each node stores its value alongside the
+key, so a lookup is a single descent and no parallel dict is needed. Keys are
+kept in ascending order: iteration, keys(), values() and items() all walk the
+tree in order, and every AVLTree operation (rank, select, irange, split, ...)
+works on the keys.
+"""
+
+from avl_tree import AVLTree, TreeNode
+
+
+_MISSING = object()
+
+
+class MapNode(TreeNode):
+    """Node in an AVL tree map; value is the key, payload the mapped value."""
+
+    def __init__(self, key, payload=None):
+        super().__init__(key)
+        self.payload = payload
+
+
+class AVLTreeMap(AVLTree):
+    """Sorted key/value mapping backed by an AVL tree."""
+
+    @classmethod
+    def from_sorted(cls, items):
+        """
+        Build a balanced map from (key, value) pairs with strictly increasing keys in O(n).
+
+        Raises ValueError if the keys are not strictly increasing.
+        """
+        items = list(items)
+        tree = super().from_sorted(key for key, _ in items)
+        for node, (_, payload) in zip(tree._iter_nodes(), items):
+            node.payload = payload
+        return tree
+
+    def _new_node(self, key):
+        """Create a node with no value attached yet."""
+        return MapNode(key)
+
+    def _find_node(self, key):
+        """Return the node holding key, or None."""
+        node = self.root
+        while node:
+            if key < node.value:
+                node = node.left
+            elif key > node.value:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def _put(self, node, key, payload, replace, found):
+        """
+        Insert key into a subtree in one descent and return the new subtree root.
+
+        An existing node only has its payload overwritten when replace is
+        true. The node holding key is appended to found either way.
+        """
+        if not node:
+            node = MapNode(key, payload)
+            found.append(node)
+            return node
+
+        if key < node.value:
+            node.left = self._put(node.left, key, payload, replace, found)
+        elif key > node.value:
+            node.right = self._put(node.right, key, payload, replace, found)
+        else:
+            if replace:
+                node.payload = payload
+            found.append(node)
+            return node
+
+        return self._rebalance(node)
+
+    def _delete_recursive(self, node, key, popped=None):
+        """
+        Delete key from a subtree, appending its payload to popped if given.
+
+        A node with two children is replaced by joining its subtrees rather
+        than by copying the successor's key, so payloads stay on their nodes.
+        """
+        if not node:
+            return node
+
+        if key < node.value:
+            node.left = self._delete_recursive(node.left, key, popped)
+        elif key > node.value:
+            node.right = self._delete_recursive(node.right, key, popped)
+        else:
+            if popped is not None:
+                popped.append(node.payload)
+            return self._join_pair(node.left, node.right)
+
+        return self._rebalance(node)
+
+    def insert_many(self, keys):
+        """
+        Add a batch of keys with no value; keys already present keep their values.
+
+        Like insert(), but merged in with a single union.
+        """
+        batch = self._sorted_unique(keys)
+        # _union keeps its second operand's node for a shared key
+        self.root = self._union(self._build_balanced(batch, 0, len(batch) - 1), self.root)
+
+    def union(self, other):
+        """
+        Add every item of other, in O(m log(n/m + 1)).
+
+        For a key in both maps the value from other wins, as in dict.update().
+        The nodes of other are reused, so other is left empty.
+        """
+        super().union(other)
+
+    def intersection(self, other):
+        """
+        Keep only the keys also present in other, in O(m log(n/m + 1)).
+
+        The kept keys keep their values from this map. other is left empty.
+        """
+        # _intersection keeps its second operand's node for a shared key
+        self.root = self._intersection(other.root, self.root)
+        other.root = None
+
+    def __getitem__(self, key):
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.payload
+
+    def __setitem__(self, key, value):
+        self.root = self._put(self.root, key, value, True, [])
+
+    def __delitem__(self, key):
+        popped = []
+        self.root = self._delete_recursive(self.root, key, popped)
+        if not popped:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self._find_node(key) is not None
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if key is missing."""
+        node = self._find_node(key)
+        if node is None:
+            return default
+        return node.payload
+
+    def pop(self, key, default=_MISSING):
+        """
+        Remove key and return its value.
+
+        Returns default if key is missing, or raises KeyError if no default
+        was given.
+        """
+        popped = []
+        self.root = self._delete_recursive(self.root, key, popped)
+        if popped:
+            return popped[0]
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def setdefault(self, key, default=None):
+        """Return the value for key, inserting default first if key is missing."""
+        found = []
+        self.root = self._put(self.root, key, default, False, found)
+        return found[0].payload
+
+    def keys(self):
+        """Iterate over the keys in ascending order."""
+        return self.irange()
+
+    def values(self):
+        """Iterate over the values in ascending key order."""
+        for node in self._iter_nodes():
+            yield node.payload
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield (key, value) pairs with lo <= key <= hi in key order.
+
+        Either bound may be None for an open end, as in irange().
+        """
+        for node in self._iter_nodes(lo, hi, reverse):
+            yield node.value, node.payload
+
+
+# Example usage
+if __name__ == "__main__":
+    prices = AVLTreeMap()
+
+    prices["pear"] = 3
+    prices["apple"] = 5
+    prices["fig"] = 8
+    prices["apple"] = 4  # updated in place
+
+    print("AVL Tree Map Operations:")
+    print(f"Items: {list(prices.items())}")
+    print(f"prices['fig']: {prices['fig']}")
+    print(f"get('kiwi', 0): {prices.get('kiwi', 0)}")
+    print(f"setdefault('kiwi', 2): {prices.setdefault('kiwi', 2)}")
+    print(f"Items from 'b' to 'l': {list(prices.items('b', 'l'))}")
+    print(f"pop('pear'): {prices.pop('pear')}")
+    print(f"Keys: {list(prices.keys())}")
+    print(f"Size: {len(prices)}")
@@ -0,0 +1,129 @@
+"""
+Benchmarks for the AVL Tree implementation
+
+Run with:
+    python avl_tree/benchmark_avl_tree.py
+"""
+
+import sys
+import os
+import random
+import time
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from avl_tree import AVLTree
+from array_avl_tree import ArrayAVLTree
+from interval_tree import IntervalTree
+
+
+def _timed(func):
+    """Run func once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _report(label, baseline, candidate):
+    """Print baseline vs candidate timings and the speedup."""
+    print(f"  {label:<28} {baseline * 1000:9.1f} ms -> {candidate * 1000:9.1f} ms"
+          f"  ({baseline / candidate:5.1f}x)")
+
+
+def _naive_set_operation(op, a, b):
+    """Dump both trees, combine the lists and re-insert into a new tree."""
+    left = set(a.inorder_traversal())
+    right = set(b.inorder_traversal())
+    result = AVLTree()
+    for value in sorted(getattr(left, op)(right)):
+        result.insert(value)
+    return result
+
+
+def bench_set_operations(n=100_000, sizes=(100, 10_000, 100_000)):
+    """Compare join-based set operations against dumping and rebuilding."""
+    random.seed(0)
+    universe = range(10 * n)
+    base = sorted(random.sample(universe, n))
+
+    print(f"\nSet operations, n={n}")
+    for m in sizes:
+        other = sorted(random.sample(universe, m))
+        for op in ('union', 'intersection', 'difference'):
+            # Both variants start from freshly built trees, built untimed
+            a, b = AVLTree.from_sorted(base), AVLTree.from_sorted(other)
+            naive = _timed(lambda: _naive_set_operation(op, a, b))
+
+            a, b = AVLTree.from_sorted(base), AVLTree.from_sorted(other)
+            joined = _timed(lambda: getattr(a, op)(b))
+            _report(f"{op} m={m}", naive, joined)
+
+
+def bench_batches(n=100_000, sizes=(1_000, 10_000, 100_000)):
+    """Compare insert_many/delete_many against loops of single operations."""
+    random.seed(0)
+    universe = range(10 * n)
+    base = sorted(random.sample(universe, n))
+
+    print(f"\nBatch insert/delete, n={n}")
+    for m in sizes:
+        batch = sorted(random.sample(universe, m))
+
+        tree = AVLTree.from_sorted(base)
+        single = _timed(lambda: [tree.insert(value) for value in batch])
+        tree = AVLTree.from_sorted(base)
+        batched = _timed(lambda: tree.insert_many(batch))
+        _report(f"insert m={m}", single, batched)
+
+        single = _timed(lambda: [tree.delete(value) for value in batch])
+        tree = AVLTree.from_sorted(base)
+        tree.insert_many(batch)
+        batched = _timed(lambda: tree.delete_many(batch))
+        _report(f"delete m={m}", single, batched)
+
+
+def bench_array_backed(n=200_000):
+    """Compare memory per key and throughput of AVLTree and ArrayAVLTree."""
+    random.seed(0)
+    values = random.sample(range(10 * n), n)
+
+    print(f"\nObject nodes vs array-backed nodes, n={n}")
+    for cls in (AVLTree, ArrayAVLTree):
+        # tracemalloc slows allocation down, so time a separate build
+        tracemalloc.start()
+        tree = cls.from_sorted(sorted(values))
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+
+        tree = cls()
+        insert = _timed(lambda: [tree.insert(value) for value in values])
+        search = _timed(lambda: [tree.search(value) for value in values])
+        print(f"  {cls.__name__:<14} {memory / n:6.1f} bytes/key"
+              f"  insert {insert * 1000:7.1f} ms  search {search * 1000:7.1f} ms")
+
+
+def bench_interval_queries(n=100_000, queries=1_000):
+    """Compare interval tree point queries against a linear scan."""
+    random.seed(0)
+    intervals = []
+    for i in range(n):
+        lo = random.randrange(10 * n)
+        intervals.append((lo, lo + random.randrange(100), i))
+    points = [random.randrange(10 * n) for _ in range(queries)]
+
+    tree = IntervalTree()
+    for lo, hi, payload in intervals:
+        tree.insert(lo, hi, payload)
+
+    print(f"\nInterval point queries, n={n}, {queries} queries")
+    scan = _timed(lambda: [[iv for iv in intervals if iv[0] <= p <= iv[1]] for p in points])
+    indexed = _timed(lambda: [list(tree.overlapping(p)) for p in points])
+    _report("overlapping(point)", scan, indexed)
+
+
+if __name__ == "__main__":
+    bench_set_operations()
+    bench_batches()
+    bench_array_backed()
+    bench_interval_queries()
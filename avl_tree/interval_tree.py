@@ -0,0 +1,189 @@
+"""
+Interval Tree Implementation
+
+An AVL tree of closed intervals [lo, hi] keyed by (lo, hi) and augmented with
+the largest endpoint in each subtree. The augmentation lives in
+_update_height, which every insertion, deletion and rotation already calls,
+so it stays correct through rebalancing. Overlap queries skip any subtree
+whose largest endpoint lies before the query, and stop once intervals start
+after it.
+
+Several payloads may be stored for the same interval; they share one node.
+IntervalTree wraps the AVL tree rather than subclassing it, so the key-only
+set API (insert_many, join, union, ...) is not exposed.
+"""
+
+from avl_tree import AVLTree, TreeNode
+
+
+_MISSING = object()
+
+
+class IntervalNode(TreeNode):
+    """Node in an interval tree; value is the (lo, hi) key."""
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.payloads = []
+        self.max_end = key[1]  # largest hi in this subtree
+
+
+class _IntervalAVLTree(AVLTree):
+    """AVL tree of IntervalNodes that keeps max_end up to date."""
+
+    def _new_node(self, key):
+        """Create a node with no payloads yet."""
+        return IntervalNode(key)
+
+    def _update_height(self, node):
+        """Update the height, subtree size and largest endpoint of a node."""
+        if node:
+            super()._update_height(node)
+            max_end = node.value[1]
+            if node.left and node.left.max_end > max_end:
+                max_end = node.left.max_end
+            if node.right and node.right.max_end > max_end:
+                max_end = node.right.max_end
+            node.max_end = max_end
+
+    def _insert_interval(self, node, key, payload):
+        """Helper method for recursive insertion with balancing."""
+        if not node:
+            node = self._new_node(key)
+            node.payloads.append(payload)
+            return node
+
+        if key < node.value:
+            node.left = self._insert_interval(node.left, key, payload)
+        elif key > node.value:
+            node.right = self._insert_interval(node.right, key, payload)
+        else:
+            node.payloads.append(payload)
+            return node
+
+        return self._rebalance(node)
+
+    def _delete_recursive(self, node, key, payload=_MISSING):
+        """
+        Remove payload (or every payload) of key from a subtree.
+
+        An emptied node with two children is replaced by joining its
+        subtrees rather than by copying the successor's key, so payloads
+        stay on their nodes.
+        """
+        if not node:
+            return node
+
+        if key < node.value:
+            node.left = self._delete_recursive(node.left, key, payload)
+        elif key > node.value:
+            node.right = self._delete_recursive(node.right, key, payload)
+        else:
+            if payload is not _MISSING:
+                try:
+                    node.payloads.remove(payload)
+                except ValueError:
+                    pass
+                if node.payloads:
+                    return node
+            return self._join_pair(node.left, node.right)
+
+        return self._rebalance(node)
+
+
+class IntervalTree:
+    """Interval tree over closed intervals with lazy overlap queries."""
+
+    def __init__(self):
+        self._tree = _IntervalAVLTree()
+
+    @property
+    def root(self):
+        """Root IntervalNode of the underlying AVL tree, or None."""
+        return self._tree.root
+
+    def insert(self, lo, hi, payload=None):
+        """
+        Add the interval [lo, hi] with payload, in O(log n).
+
+        Raises ValueError if lo > hi.
+        """
+        if hi < lo:
+            raise ValueError("interval requires lo <= hi")
+        tree = self._tree
+        tree.root = tree._insert_interval(tree.root, (lo, hi), payload)
+
+    def remove(self, lo, hi, payload=_MISSING):
+        """
+        Remove one payload stored for [lo, hi], or the whole interval if no payload is given.
+
+        Missing intervals and payloads are ignored.
+        """
+        tree = self._tree
+        tree.root = tree._delete_recursive(tree.root, (lo, hi), payload)
+
+    def __len__(self):
+        """Number of distinct intervals, in O(1)."""
+        return len(self._tree)
+
+    def __iter__(self):
+        """Iterate over the distinct (lo, hi) intervals in ascending order."""
+        return iter(self._tree)
+
+    def is_balanced(self):
+        """Check if the tree is balanced (AVL property)."""
+        return self._tree.is_balanced()
+
+    def overlapping(self, lo, hi=None):
+        """
+        Lazily yield (lo, hi, payload) for every stored interval overlapping [lo, hi].
+
+        With a single argument, yields the intervals containing the point lo.
+        Results come in (lo, hi) order. Subtrees ending before the query are
+        skipped and the scan stops at the first interval starting after it,
+        so reporting k intervals visits O((k + 1) log n) nodes at worst.
+        """
+        if hi is None:
+            hi = lo
+        if hi < lo:
+            return
+
+        stack = []
+        node = self.root
+        while True:
+            # Descend left only into subtrees that can reach lo
+            while node and node.max_end >= lo:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+
+            node = stack.pop()
+            start, end = node.value
+            if start > hi:
+                return
+            if end >= lo:
+                for payload in node.payloads:
+                    yield start, end, payload
+            node = node.right
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = IntervalTree()
+
+    meetings = [(9, 10, "standup"), (10, 12, "review"), (13, 14, "lunch"),
+                (11, 15, "workshop"), (16, 17, "retro")]
+    print("Inserting intervals:", meetings)
+    for lo, hi, name in meetings:
+        tree.insert(lo, hi, name)
+
+    print("\nInterval Tree Operations:")
+    print(f"Intervals: {list(tree)}")
+    print(f"Containing 11: {list(tree.overlapping(11))}")
+    print(f"Overlapping [12, 13]: {list(tree.overlapping(12, 13))}")
+
+    print("\nRemoving the workshop...")
+    tree.remove(11, 15, "workshop")
+    print(f"Overlapping [12, 13]: {list(tree.overlapping(12, 13))}")
+    print(f"Is balanced: {tree.is_balanced()}")
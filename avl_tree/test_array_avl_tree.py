@@ -0,0 +1,131 @@
+"""
+Tests for Array-Backed AVL Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from array_avl_tree import ArrayAVLTree
+
+
+def test_insert_search_delete():
+    tree = ArrayAVLTree()
+    for val in [10, 20, 30, 40, 50, 25, 25]:
+        tree.insert(val)
+
+    assert tree.inorder_traversal() == [10, 20, 25, 30, 40, 50]
+    assert tree.is_balanced() == True
+    assert tree.search(25) == True
+    assert tree.search(35) == False
+
+    tree.delete(30)  # node with two children
+    tree.delete(99)  # missing, ignored
+    assert tree.inorder_traversal() == [10, 20, 25, 40, 50]
+    assert len(tree) == 5
+
+
+def test_empty_tree():
+    tree = ArrayAVLTree()
+    assert len(tree) == 0
+    assert tree.search(1) == False
+    assert tree.inorder_traversal() == []
+    assert tree.select(0) is None
+    assert tree.is_balanced() == True
+
+
+def test_free_list_reuses_slots():
+    tree = ArrayAVLTree()
+    for val in range(100):
+        tree.insert(val)
+    slots = len(tree.keys)
+
+    for val in range(0, 100, 2):
+        tree.delete(val)
+    for val in range(1000, 1050):
+        tree.insert(val)
+
+    assert len(tree.keys) == slots
+    assert len(tree) == 100
+    assert tree.is_balanced() == True
+
+
+def test_rejected_key_keeps_free_slot():
+    tree = ArrayAVLTree()
+    tree.insert_many([1, 2, 3])
+    tree.delete(2)
+    free = tree._free
+    assert free
+
+    try:
+        tree.insert(2.5)  # a float does not fit the 'q' key array
+        assert False, "expected TypeError"
+    except TypeError:
+        pass
+
+    assert tree._free == free
+    slots = len(tree.keys)
+    tree.insert(4)
+    assert len(tree.keys) == slots
+    assert tree.inorder_traversal() == [1, 3, 4]
+
+
+def test_order_statistics_and_irange():
+    tree = ArrayAVLTree.from_sorted(range(0, 100, 10))
+
+    assert tree.rank(35) == 4
+    assert tree.select(3) == 30
+    assert tree.count_range(15, 55) == 4
+    assert list(tree.irange(15, 55)) == [20, 30, 40, 50]
+    assert list(tree.irange(15, 55, reverse=True)) == [50, 40, 30, 20]
+    assert list(reversed(tree))[:2] == [90, 80]
+
+    try:
+        ArrayAVLTree.from_sorted([2, 1])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_float_keys():
+    tree = ArrayAVLTree(typecode='d')
+    tree.insert_many([2.5, 0.5, 1.5])
+    assert list(tree) == [0.5, 1.5, 2.5]
+
+
+def test_random_operations_match_set():
+    random.seed(22)
+    tree = ArrayAVLTree()
+    values = set()
+
+    for _ in range(3000):
+        val = random.randrange(500)
+        if random.random() < 0.6:
+            tree.insert(val)
+            values.add(val)
+        else:
+            tree.delete(val)
+            values.discard(val)
+
+    assert tree.inorder_traversal() == sorted(values)
+    assert len(tree) == len(values)
+    assert tree.is_balanced() == True
+    # Slots in the tree plus slots on the free list account for the whole pool
+    free = 0
+    node = tree._free
+    while node:
+        free += 1
+        node = tree.left[node]
+    assert len(tree) + free == len(tree.keys) - 1
+
+
+if __name__ == "__main__":
+    test_insert_search_delete()
+    test_empty_tree()
+    test_free_list_reuses_slots()
+    test_rejected_key_keeps_free_slot()
+    test_order_statistics_and_irange()
+    test_float_keys()
+    test_random_operations_match_set()
+    print("All Array-Backed AVL Tree tests passed!")
@@ -4,6 +4,7 @@ Tests for AVL Tree implementation
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from avl_tree import AVLTree
@@ -89,6 +90,234 @@ def test_duplicate_values():
     assert avl.inorder_traversal() == [10]
 
 
+def test_from_sorted():
+    for n in range(0, 70):
+        avl = AVLTree.from_sorted(range(n))
+        
+        assert avl.inorder_traversal() == list(range(n))
+        assert avl.is_balanced() == True
+        # Heights are stored correctly and minimal
+        assert avl._get_height(avl.root) == n.bit_length()
+    
+    # The tree stays usable afterwards
+    avl = AVLTree.from_sorted([10, 20, 30, 40, 50])
+    avl.insert(25)
+    avl.delete(10)
+    assert avl.inorder_traversal() == [20, 25, 30, 40, 50]
+    assert avl.is_balanced() == True
+    
+    try:
+        AVLTree.from_sorted([1, 1, 2])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def _check_sizes(node):
+    """Verify every stored subtree size; returns the real size."""
+    if not node:
+        return 0
+    size = 1 + _check_sizes(node.left) + _check_sizes(node.right)
+    assert node.size == size
+    return size
+
+
+def test_order_statistics():
+    avl = AVLTree()
+    for val in [30, 20, 40, 10, 25, 35, 50]:
+        avl.insert(val)
+    
+    assert len(avl) == 7
+    assert avl.rank(10) == 0
+    assert avl.rank(30) == 3
+    assert avl.rank(33) == 4  # values need not be present
+    assert avl.rank(100) == 7
+    assert [avl.select(k) for k in range(7)] == [10, 20, 25, 30, 35, 40, 50]
+    assert avl.select(7) is None
+    assert avl.select(-1) is None
+    assert avl.count_range(20, 40) == 5
+    assert avl.count_range(21, 34) == 2
+    assert avl.count_range(40, 20) == 0
+    
+    assert len(AVLTree()) == 0
+
+
+def test_sizes_maintained_through_rotations():
+    random.seed(17)
+    avl = AVLTree()
+    values = set()
+    
+    for _ in range(500):
+        val = random.randrange(100)
+        if random.random() < 0.6:
+            avl.insert(val)
+            values.add(val)
+        else:
+            avl.delete(val)
+            values.discard(val)
+        
+        assert len(avl) == len(values)
+        _check_sizes(avl.root)
+    
+    ordered = sorted(values)
+    for k, val in enumerate(ordered):
+        assert avl.select(k) == val
+        assert avl.rank(val) == k
+    
+    avl = AVLTree.from_sorted(range(20))
+    _check_sizes(avl.root)
+    assert avl.select(13) == 13
+
+
+def test_iteration():
+    avl = AVLTree()
+    for val in [30, 20, 40, 10, 25, 35, 50]:
+        avl.insert(val)
+    
+    assert list(avl) == [10, 20, 25, 30, 35, 40, 50]
+    assert list(reversed(avl)) == [50, 40, 35, 30, 25, 20, 10]
+    assert list(AVLTree()) == []
+
+
+def test_irange():
+    avl = AVLTree()
+    for val in [30, 20, 40, 10, 25, 35, 50]:
+        avl.insert(val)
+    
+    assert list(avl.irange(20, 40)) == [20, 25, 30, 35, 40]
+    assert list(avl.irange(21, 39)) == [25, 30, 35]
+    assert list(avl.irange(hi=25)) == [10, 20, 25]
+    assert list(avl.irange(lo=36)) == [40, 50]
+    assert list(avl.irange(41, 49)) == []
+    assert list(avl.irange(40, 20)) == []
+    assert list(avl.irange(20, 40, reverse=True)) == [40, 35, 30, 25, 20]
+    assert list(avl.irange(lo=36, reverse=True)) == [50, 40]
+    
+    # Lazy: only the requested prefix is produced
+    values = avl.irange(lo=15)
+    assert next(values) == 20
+    assert next(values) == 25
+
+
+def test_irange_matches_naive():
+    random.seed(18)
+    values = random.sample(range(1000), 300)
+    avl = AVLTree()
+    for val in values:
+        avl.insert(val)
+    values.sort()
+    
+    for _ in range(100):
+        lo = random.randrange(-10, 1010)
+        hi = random.randrange(-10, 1010)
+        expected = [v for v in values if lo <= v <= hi]
+        assert list(avl.irange(lo, hi)) == expected
+        assert list(avl.irange(lo, hi, reverse=True)) == expected[::-1]
+
+
+def _check_heights(node):
+    """Verify stored heights and the AVL property; returns the real height."""
+    if not node:
+        return 0
+    left = _check_heights(node.left)
+    right = _check_heights(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_split_and_join():
+    avl = AVLTree.from_sorted(range(0, 100, 2))
+    
+    smaller, found, larger = avl.split(40)
+    assert found == True
+    assert smaller.inorder_traversal() == list(range(0, 40, 2))
+    assert larger.inorder_traversal() == list(range(42, 100, 2))
+    assert avl.root is None
+    _check_heights(smaller.root)
+    _check_heights(larger.root)
+    
+    smaller, found, larger = AVLTree.join(smaller, 40, larger).split(41)
+    assert found == False
+    assert len(smaller) == 21 and len(larger) == 29
+    
+    joined = AVLTree.join(smaller, 41, larger)
+    assert 41 in joined.inorder_traversal()
+    _check_heights(joined.root)
+    _check_sizes(joined.root)
+    
+    # Very different heights
+    joined = AVLTree.join(AVLTree.from_sorted(range(1000)), 5000, AVLTree())
+    _check_heights(joined.root)
+    assert joined.select(1000) == 5000
+    
+    try:
+        AVLTree.join(AVLTree.from_sorted([1, 5]), 3, AVLTree())
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_set_operations_match_naive():
+    random.seed(19)
+    for _ in range(30):
+        a = set(random.sample(range(500), random.randrange(0, 200)))
+        b = set(random.sample(range(500), random.randrange(0, 200)))
+        
+        for op, expected in (('union', a | b), ('intersection', a & b), ('difference', a - b)):
+            tree = AVLTree.from_sorted(sorted(a))
+            other = AVLTree()
+            for val in b:
+                other.insert(val)
+            
+            getattr(tree, op)(other)
+            assert tree.inorder_traversal() == sorted(expected)
+            assert other.root is None
+            assert len(tree) == len(expected)
+            _check_heights(tree.root)
+            _check_sizes(tree.root)
+            
+            # The result is a working AVL tree
+            tree.insert(1000)
+            tree.delete(1000)
+            assert tree.is_balanced() == True
+
+
+def test_insert_many_and_delete_many():
+    avl = AVLTree()
+    avl.insert_many([5, 3, 9, 3, 1])
+    assert avl.inorder_traversal() == [1, 3, 5, 9]
+    
+    avl.insert_many([])
+    avl.insert_many([4, 9, 10])
+    assert avl.inorder_traversal() == [1, 3, 4, 5, 9, 10]
+    
+    avl.delete_many([3, 10, 42, 3])
+    assert avl.inorder_traversal() == [1, 4, 5, 9]
+    assert avl.is_balanced() == True
+
+
+def test_batches_match_naive():
+    random.seed(20)
+    avl = AVLTree()
+    values = set()
+    
+    for _ in range(40):
+        batch = [random.randrange(2000) for _ in range(random.randrange(1, 200))]
+        if random.random() < 0.6:
+            avl.insert_many(batch)
+            values.update(batch)
+        else:
+            avl.delete_many(batch)
+            values.difference_update(batch)
+        
+        assert len(avl) == len(values)
+        _check_heights(avl.root)
+        _check_sizes(avl.root)
+    
+    assert avl.inorder_traversal() == sorted(values)
+
+
 if __name__ == "__main__":
     test_insert()
     test_balance()
@@ -97,4 +326,14 @@ if __name__ == "__main__":
     test_search()
     test_empty_tree()
     test_duplicate_values()
+    test_from_sorted()
+    test_order_statistics()
+    test_sizes_maintained_through_rotations()
+    test_iteration()
+    test_irange()
+    test_irange_matches_naive()
+    test_split_and_join()
+    test_set_operations_match_naive()
+    test_insert_many_and_delete_many()
+    test_batches_match_naive()
     print("All AVL Tree tests passed!")
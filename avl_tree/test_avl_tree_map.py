@@ -0,0 +1,134 @@
+"""
+Tests for AVL Tree Map implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from avl_tree_map import AVLTreeMap
+
+
+def test_set_and_get():
+    tree = AVLTreeMap()
+    tree[3] = "c"
+    tree[1] = "a"
+    tree[2] = "b"
+    tree[1] = "A"  # overwrite in place
+
+    assert len(tree) == 3
+    assert tree[1] == "A"
+    assert tree.get(2) == "b"
+    assert tree.get(9) is None
+    assert tree.get(9, "x") == "x"
+    assert 3 in tree
+    assert 9 not in tree
+
+    try:
+        tree[9]
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+
+
+def test_pop_and_delitem():
+    tree = AVLTreeMap.from_sorted((k, k * 10) for k in range(7))
+
+    assert tree.pop(3) == 30  # node with two children
+    assert tree.pop(3, None) is None
+    del tree[0]
+    assert list(tree.items()) == [(1, 10), (2, 20), (4, 40), (5, 50), (6, 60)]
+    assert tree.is_balanced() == True
+
+    for missing in (lambda: tree.pop(3), lambda: tree.__delitem__(3)):
+        try:
+            missing()
+            assert False, "expected KeyError"
+        except KeyError:
+            pass
+
+
+def test_setdefault():
+    tree = AVLTreeMap()
+    assert tree.setdefault("x", []) == []
+    tree.setdefault("x", []).append(1)
+    tree.setdefault("x", "ignored").append(2)
+    assert tree["x"] == [1, 2]
+    assert len(tree) == 1
+
+
+def test_ordered_views():
+    tree = AVLTreeMap()
+    for key in [5, 1, 4, 2, 3]:
+        tree[key] = str(key)
+
+    assert list(tree) == [1, 2, 3, 4, 5]
+    assert list(tree.keys()) == [1, 2, 3, 4, 5]
+    assert list(tree.values()) == ["1", "2", "3", "4", "5"]
+    assert list(tree.items(2, 4)) == [(2, "2"), (3, "3"), (4, "4")]
+    assert list(tree.items(reverse=True))[0] == (5, "5")
+    assert tree.select(1) == 2
+    assert tree.rank(4) == 3
+
+
+def test_from_sorted():
+    tree = AVLTreeMap.from_sorted([(1, "a"), (2, "b"), (3, "c")])
+    assert list(tree.items()) == [(1, "a"), (2, "b"), (3, "c")]
+
+    try:
+        AVLTreeMap.from_sorted([(2, "b"), (1, "a")])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_batch_and_set_operations_keep_values():
+    tree = AVLTreeMap()
+    tree["a"] = 1
+    tree["b"] = 2
+    tree.insert_many(["a", "c"])
+    tree.insert("b")
+    assert list(tree.items()) == [("a", 1), ("b", 2), ("c", None)]
+
+    tree.union(AVLTreeMap.from_sorted([("b", 20), ("d", 40)]))
+    assert list(tree.items()) == [("a", 1), ("b", 20), ("c", None), ("d", 40)]
+
+    tree.intersection(AVLTreeMap.from_sorted([("a", 10), ("d", 0), ("e", 5)]))
+    assert list(tree.items()) == [("a", 1), ("d", 40)]
+
+    tree.difference(AVLTreeMap.from_sorted([("d", 0)]))
+    assert list(tree.items()) == [("a", 1)]
+    assert tree.is_balanced() == True
+
+
+def test_random_operations_match_dict():
+    random.seed(21)
+    tree = AVLTreeMap()
+    expected = {}
+
+    for i in range(3000):
+        key = random.randrange(200)
+        op = random.random()
+        if op < 0.5:
+            tree[key] = i
+            expected[key] = i
+        elif op < 0.8:
+            assert tree.pop(key, None) == expected.pop(key, None)
+        else:
+            assert tree.setdefault(key, i) == expected.setdefault(key, i)
+
+    assert list(tree.items()) == sorted(expected.items())
+    assert len(tree) == len(expected)
+    assert tree.is_balanced() == True
+
+
+if __name__ == "__main__":
+    test_set_and_get()
+    test_pop_and_delitem()
+    test_setdefault()
+    test_ordered_views()
+    test_from_sorted()
+    test_batch_and_set_operations_keep_values()
+    test_random_operations_match_dict()
+    print("All AVL Tree Map tests passed!")
@@ -0,0 +1,125 @@
+"""
+Tests for Interval Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from interval_tree import IntervalTree
+
+
+def _check_max_end(node):
+    """Recompute max_end bottom-up and compare with the stored values."""
+    if not node:
+        return float('-inf')
+    expected = max(node.value[1], _check_max_end(node.left), _check_max_end(node.right))
+    assert node.max_end == expected
+    return expected
+
+
+def test_point_and_range_queries():
+    tree = IntervalTree()
+    tree.insert(9, 10, "standup")
+    tree.insert(10, 12, "review")
+    tree.insert(13, 14, "lunch")
+    tree.insert(11, 15, "workshop")
+
+    assert list(tree.overlapping(11)) == [(10, 12, "review"), (11, 15, "workshop")]
+    assert list(tree.overlapping(10)) == [(9, 10, "standup"), (10, 12, "review")]
+    assert list(tree.overlapping(12, 13)) == [(10, 12, "review"), (11, 15, "workshop"),
+                                              (13, 14, "lunch")]
+    assert list(tree.overlapping(20)) == []
+    assert list(tree.overlapping(14, 12)) == []
+    assert list(tree) == [(9, 10), (10, 12), (11, 15), (13, 14)]
+
+
+def test_shared_interval_payloads():
+    tree = IntervalTree()
+    tree.insert(1, 5, "a")
+    tree.insert(1, 5, "b")
+    assert len(tree) == 1
+    assert list(tree.overlapping(3)) == [(1, 5, "a"), (1, 5, "b")]
+
+    tree.remove(1, 5, "a")
+    assert list(tree.overlapping(3)) == [(1, 5, "b")]
+    tree.remove(1, 5, "missing")
+    assert len(tree) == 1
+    tree.remove(1, 5, "b")
+    assert len(tree) == 0
+
+
+def test_remove_whole_interval():
+    tree = IntervalTree()
+    for lo in range(10):
+        tree.insert(lo, lo + 2, lo)
+
+    tree.remove(4, 6)
+    tree.remove(42, 43)  # missing, ignored
+    assert [payload for _, _, payload in tree.overlapping(5)] == [3, 5]
+    assert tree.is_balanced() == True
+    _check_max_end(tree.root)
+
+
+def test_invalid_interval():
+    tree = IntervalTree()
+    try:
+        tree.insert(5, 1)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_overlapping_is_lazy():
+    tree = IntervalTree()
+    for lo in range(1000):
+        tree.insert(lo, lo + 1000)
+
+    results = tree.overlapping(500)
+    assert next(results) == (0, 1000, None)
+
+
+def test_random_queries_match_naive():
+    random.seed(23)
+    tree = IntervalTree()
+    intervals = []
+
+    for i in range(1500):
+        if intervals and random.random() < 0.3:
+            lo, hi, payload = intervals.pop(random.randrange(len(intervals)))
+            tree.remove(lo, hi, payload)
+        else:
+            lo = random.randrange(1000)
+            hi = lo + random.randrange(50)
+            tree.insert(lo, hi, i)
+            intervals.append((lo, hi, i))
+
+        if i % 100 == 0:
+            _check_max_end(tree.root)
+            assert tree.is_balanced() == True
+
+    for _ in range(200):
+        lo = random.randrange(-10, 1060)
+        hi = lo + random.randrange(30)
+        expected = sorted(iv for iv in intervals if iv[0] <= hi and iv[1] >= lo)
+        assert sorted(tree.overlapping(lo, hi)) == expected
+
+
+
+def test_set_api_not_exposed():
+    tree = IntervalTree()
+    for name in ('insert_many', 'delete_many', 'from_sorted', 'join', 'union',
+                 'intersection', 'difference', 'split', 'delete'):
+        assert not hasattr(tree, name)
+
+
+if __name__ == "__main__":
+    test_point_and_range_queries()
+    test_shared_interval_payloads()
+    test_remove_whole_interval()
+    test_invalid_interval()
+    test_overlapping_is_lazy()
+    test_random_queries_match_naive()
+    test_set_api_not_exposed()
+    print("All Interval Tree tests passed!")
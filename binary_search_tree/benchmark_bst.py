@@ -0,0 +1,136 @@
+"""
+Benchmarks for the Binary Search Tree implementation
+
+Run with:
+    python binary_search_tree/benchmark_bst.py
+"""
+
+import sys
+import os
+import random
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bst import BinarySearchTree, TreeNode
+from scapegoat_tree import ScapegoatTree
+
+
+class RecursiveBST:
+    """The previous recursive insert/search/delete, kept as a baseline."""
+
+    def __init__(self):
+        self.root = None
+
+    def insert(self, value):
+        if not self.root:
+            self.root = TreeNode(value)
+        else:
+            self._insert_recursive(self.root, value)
+
+    def _insert_recursive(self, node, value):
+        if value < node.value:
+            if node.left is None:
+                node.left = TreeNode(value)
+            else:
+                self._insert_recursive(node.left, value)
+        else:
+            if node.right is None:
+                node.right = TreeNode(value)
+            else:
+                self._insert_recursive(node.right, value)
+
+    def search(self, value):
+        return self._search_recursive(self.root, value)
+
+    def _search_recursive(self, node, value):
+        if node is None:
+            return False
+        if node.value == value:
+            return True
+        elif value < node.value:
+            return self._search_recursive(node.left, value)
+        else:
+            return self._search_recursive(node.right, value)
+
+    def delete(self, value):
+        self.root = self._delete_recursive(self.root, value)
+
+    def _delete_recursive(self, node, value):
+        if node is None:
+            return None
+        if value < node.value:
+            node.left = self._delete_recursive(node.left, value)
+        elif value > node.value:
+            node.right = self._delete_recursive(node.right, value)
+        else:
+            if node.left is None:
+                return node.right
+            elif node.right is None:
+                return node.left
+            min_node = node.right
+            while min_node.left:
+                min_node = min_node.left
+            node.value = min_node.value
+            node.right = self._delete_recursive(node.right, min_node.value)
+        return node
+
+
+def _ops_per_second(func, values):
+    """Apply func to every value and return the throughput."""
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def bench_recursive_vs_iterative(label, values):
+    """Compare insert, search and delete throughput on the given key order."""
+    print(f"\n{label}, n={len(values)} (ops/sec)")
+    lookups = list(values)
+    random.shuffle(lookups)
+
+    results = {}
+    for cls in (RecursiveBST, BinarySearchTree):
+        tree = cls()
+        results[cls] = (
+            _ops_per_second(tree.insert, values),
+            _ops_per_second(tree.search, lookups),
+            _ops_per_second(tree.delete, lookups),
+        )
+
+    for i, op in enumerate(("insert", "search", "delete")):
+        recursive = results[RecursiveBST][i]
+        iterative = results[BinarySearchTree][i]
+        print(f"  {op:<8} {recursive:12,.0f} -> {iterative:12,.0f}  ({iterative / recursive:4.1f}x)")
+
+
+def bench_scapegoat(label, values):
+    """Compare plain and scapegoat BST throughput on the given key order."""
+    print(f"\n{label}, n={len(values)} (ops/sec)")
+    lookups = list(values)
+    random.shuffle(lookups)
+
+    for cls in (BinarySearchTree, ScapegoatTree):
+        tree = cls()
+        insert = _ops_per_second(tree.insert, values)
+        search = _ops_per_second(tree.search, lookups)
+        print(f"  {cls.__name__:<17} insert {insert:12,.0f}  search {search:12,.0f}"
+              f"  height {tree.height()}")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    random_values = random.sample(range(10 ** 9), 100_000)
+    bench_recursive_vs_iterative("Random keys", random_values)
+
+    # The recursive version cannot go deeper than the recursion limit
+    depth = sys.getrecursionlimit() - 100
+    bench_recursive_vs_iterative("Sorted keys", list(range(depth)))
+
+    tree = BinarySearchTree()
+    for value in range(10 ** 4):
+        tree.insert(value)
+    print(f"\nIterative BST with 10^4 sorted keys: height {tree.height()}, no RecursionError")
+
+    bench_scapegoat("Scapegoat, sorted keys", list(range(5_000)))
+    bench_scapegoat("Scapegoat, random keys", random_values)
@@ -4,6 +4,10 @@ Binary Search Tree (BST) Implementation
 A Binary Search Tree is a binary tree where for each node:
 - All values in the left subtree are less than the node's value
 - All values in the right subtree are greater than the node's value
+
+All operations are loops rather than recursion, so a degenerate tree (for
+example one built from presorted input) costs O(n) time but never hits
+Python's recursion limit.
 """
 
 class TreeNode:
@@ -21,68 +25,97 @@ class BinarySearchTree:
     def __init__(self):
         self.root = None
     
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Build a perfectly balanced BST from strictly increasing values in O(n).
+        
+        Raises ValueError if the values are not strictly increasing.
+        """
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError("from_sorted() requires strictly increasing values")
+        
+        tree = cls()
+        tree.root = tree._build_balanced(values, 0, len(values) - 1)
+        return tree
+    
+    def _build_balanced(self, values, start, end):
+        """Build a balanced subtree from values[start:end + 1] (recursion depth is O(log n))."""
+        if start > end:
+            return None
+        
+        mid = (start + end) // 2
+        node = TreeNode(values[mid])
+        node.left = self._build_balanced(values, start, mid - 1)
+        node.right = self._build_balanced(values, mid + 1, end)
+        return node
+    
     def insert(self, value):
         """Insert a value into the BST."""
+        new_node = TreeNode(value)
         if not self.root:
-            self.root = TreeNode(value)
-        else:
-            self._insert_recursive(self.root, value)
-    
-    def _insert_recursive(self, node, value):
-        """Helper method for recursive insertion."""
-        if value < node.value:
-            if node.left is None:
-                node.left = TreeNode(value)
-            else:
-                self._insert_recursive(node.left, value)
-        else:
-            if node.right is None:
-                node.right = TreeNode(value)
+            self.root = new_node
+            return
+        
+        current = self.root
+        while True:
+            if value < current.value:
+                if current.left is None:
+                    current.left = new_node
+                    return
+                current = current.left
             else:
-                self._insert_recursive(node.right, value)
+                if current.right is None:
+                    current.right = new_node
+                    return
+                current = current.right
     
     def search(self, value):
         """Search for a value in the BST. Returns True if found, False otherwise."""
-        return self._search_recursive(self.root, value)
+        current = self.root
+        while current is not None:
+            if current.value == value:
+                return True
+            elif value < current.value:
+                current = current.left
+            else:
+                current = current.right
+        return False
     
-    def _search_recursive(self, node, value):
-        """Helper method for recursive search."""
+    def delete(self, value):
+        """Delete a value from the BST. Returns True if the value was found."""
+        # Find the node and its parent
+        parent = None
+        node = self.root
+        while node is not None and node.value != value:
+            parent = node
+            node = node.left if value < node.value else node.right
+        
         if node is None:
             return False
         
-        if node.value == value:
-            return True
-        elif value < node.value:
-            return self._search_recursive(node.left, value)
-        else:
-            return self._search_recursive(node.right, value)
-    
-    def delete(self, value):
-        """Delete a value from the BST."""
-        self.root = self._delete_recursive(self.root, value)
-    
-    def _delete_recursive(self, node, value):
-        """Helper method for recursive deletion."""
-        if node is None:
-            return None
+        # Node with two children: copy the inorder successor up, then
+        # remove the successor, which has no left child
+        if node.left is not None and node.right is not None:
+            successor_parent = node
+            successor = node.right
+            while successor.left is not None:
+                successor_parent = successor
+                successor = successor.left
+            node.value = successor.value
+            parent, node = successor_parent, successor
         
-        if value < node.value:
-            node.left = self._delete_recursive(node.left, value)
-        elif value > node.value:
-            node.right = self._delete_recursive(node.right, value)
+        # Node with only one child or no child
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            # Node with only one child or no child
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            
-            # Node with two children: get inorder successor
-            min_node = self._find_min(node.right)
-            node.value = min_node.value
-            node.right = self._delete_recursive(node.right, min_node.value)
-        
-        return node
+            parent.right = child
+        return True
     
     def _find_min(self, node):
         """Find the node with minimum value in a subtree."""
@@ -107,48 +140,58 @@ class BinarySearchTree:
             current = current.right
         return current.value
     
-    def inorder_traversal(self, node=None, result=None):
+    def inorder_traversal(self):
         """
         Inorder traversal (Left -> Root -> Right).
         Returns sorted list of values.
         """
-        if result is None:
-            result = []
-            node = self.root
-        
-        if node:
-            self.inorder_traversal(node.left, result)
-            result.append(node.value)
-            self.inorder_traversal(node.right, result)
-        
+        result = []
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current.value)
+            current = current.right
         return result
     
-    def height(self, node=None, _initial_call=True):
-        """Calculate the height of the BST."""
-        if _initial_call and node is None:
+    def height(self, node=None):
+        """Calculate the height of the BST (or of the subtree rooted at node)."""
+        if node is None:
             node = self.root
-        
         if not node:
             return 0
         
-        left_height = self.height(node.left, False)
-        right_height = self.height(node.right, False)
-        
-        return max(left_height, right_height) + 1
-    
-    def is_valid_bst(self, node=None, min_val=float('-inf'), max_val=float('inf'), _initial_call=True):
+        # Count levels breadth-first
+        height = 0
+        level = [node]
+        while level:
+            height += 1
+            next_level = []
+            for current in level:
+                if current.left:
+                    next_level.append(current.left)
+                if current.right:
+                    next_level.append(current.right)
+            level = next_level
+        return height
+    
+    def is_valid_bst(self):
         """Check if the tree is a valid BST."""
-        if _initial_call and node is None:
-            node = self.root
-        
-        if not node:
-            return True
-        
-        if node.value <= min_val or node.value >= max_val:
-            return False
-        
-        return (self.is_valid_bst(node.left, min_val, node.value, False) and
-                self.is_valid_bst(node.right, node.value, max_val, False))
+        stack = [(self.root, float('-inf'), float('inf'))]
+        while stack:
+            node, min_val, max_val = stack.pop()
+            if not node:
+                continue
+            
+            if node.value <= min_val or node.value >= max_val:
+                return False
+            
+            stack.append((node.left, min_val, node.value))
+            stack.append((node.right, node.value, max_val))
+        return True
 
 
 # Example usage
@@ -0,0 +1,152 @@
+"""
+Scapegoat Tree Implementation
+
+A Binary Search Tree that stays balanced without any per-node metadata: the
+nodes are plain BST nodes and the tree only tracks its current size and the
+largest size since the last full rebuild.
+
+When an insertion lands deeper than log_{1/alpha}(size), some ancestor on its
+path (the scapegoat) has a child holding more than an alpha fraction of its
+subtree. That subtree alone is flattened and rebuilt perfectly balanced in
+linear time. When deletions shrink the tree below alpha * max_size, the whole
+tree is rebuilt. Both rebuilds are paid for by the operations that caused
+them, so insert, search and delete run in O(log n) amortized time.
+"""
+
+import math
+
+from bst import BinarySearchTree, TreeNode
+
+
+class ScapegoatTree(BinarySearchTree):
+    """Binary Search Tree with amortized O(log n) operations via partial rebuilds."""
+
+    def __init__(self, alpha=2 / 3):
+        """alpha (between 0.5 and 1) trades rebuild frequency for tree height."""
+        if not 0.5 < alpha < 1:
+            raise ValueError("alpha must be between 0.5 and 1")
+
+        super().__init__()
+        self.alpha = alpha
+        self.size = 0
+        self.max_size = 0
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Build a perfectly balanced tree from strictly increasing values in O(n).
+
+        Raises ValueError if the values are not strictly increasing.
+        """
+        values = list(iterable)
+        tree = super().from_sorted(values)
+        tree.size = tree.max_size = len(values)
+        return tree
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, value):
+        """Insert a value, rebuilding the scapegoat subtree if the new node is too deep."""
+        new_node = TreeNode(value)
+        self.size += 1
+        self.max_size = max(self.max_size, self.size)
+        if not self.root:
+            self.root = new_node
+            return
+
+        path = []
+        current = self.root
+        while current:
+            path.append(current)
+            current = current.left if value < current.value else current.right
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        # The new node sits at depth len(path)
+        if len(path) > math.log(self.size, 1 / self.alpha):
+            self._rebuild_scapegoat(path, new_node)
+
+    def _rebuild_scapegoat(self, path, node):
+        """Walk up from node to the first alpha-unbalanced ancestor and rebuild it."""
+        size = 1
+        for i in range(len(path) - 1, -1, -1):
+            parent = path[i]
+            sibling = parent.right if parent.left is node else parent.left
+            parent_size = size + 1 + self._count(sibling)
+            if size > self.alpha * parent_size:
+                rebuilt = self._rebuild(parent)
+                if i == 0:
+                    self.root = rebuilt
+                elif path[i - 1].left is parent:
+                    path[i - 1].left = rebuilt
+                else:
+                    path[i - 1].right = rebuilt
+                return
+            node, size = parent, parent_size
+
+    def delete(self, value):
+        """
+        Delete a value. Returns True if the value was found.
+
+        Rebuilds the whole tree once deletions have shrunk it below
+        alpha times its largest size.
+        """
+        if not super().delete(value):
+            return False
+
+        self.size -= 1
+        if self.size < self.alpha * self.max_size:
+            self.root = self._rebuild(self.root)
+            self.max_size = self.size
+        return True
+
+    def _count(self, node):
+        """Count the nodes of a subtree."""
+        count = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node:
+                count += 1
+                stack.append(node.left)
+                stack.append(node.right)
+        return count
+
+    def _rebuild(self, node):
+        """Flatten a subtree in order and rebuild it perfectly balanced, in O(size)."""
+        values = []
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            values.append(node.value)
+            node = node.right
+        return self._build_balanced(values, 0, len(values) - 1)
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = ScapegoatTree()
+
+    # Sorted input would turn a plain BST into a linked list
+    for val in range(1, 1025):
+        tree.insert(val)
+
+    print("Scapegoat Tree Operations:")
+    print(f"Size: {len(tree)}")
+    print(f"Height after 1024 sorted inserts: {tree.height()}")  # a plain BST: 1024
+    print(f"Search 512: {tree.search(512)}")
+    print(f"Is valid BST: {tree.is_valid_bst()}")
+
+    print(f"\nDeleting 1 to 600...")
+    for val in range(1, 601):
+        tree.delete(val)
+    print(f"Size: {len(tree)}")
+    print(f"Height: {tree.height()}")
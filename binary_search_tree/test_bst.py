@@ -4,6 +4,7 @@ Tests for Binary Search Tree implementation
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from bst import BinarySearchTree
@@ -104,6 +105,81 @@ def test_empty_tree():
     assert bst.is_valid_bst() == True
 
 
+def test_delete_root():
+    bst = BinarySearchTree()
+    for val in [50, 30, 70, 60, 80]:
+        bst.insert(val)
+    
+    assert bst.delete(50) == True
+    assert bst.root.value == 60
+    assert bst.inorder_traversal() == [30, 60, 70, 80]
+    
+    assert bst.delete(100) == False  # missing value is a no-op
+    for val in [30, 60, 70, 80]:
+        bst.delete(val)
+    assert bst.root is None
+
+
+def test_deep_skewed_tree():
+    # Presorted input degenerates into a linked list deeper than the
+    # recursion limit; every operation must still work
+    bst = BinarySearchTree()
+    n = sys.getrecursionlimit() * 2
+    for val in range(n):
+        bst.insert(val)
+    
+    assert bst.height() == n
+    assert bst.search(n - 1) == True
+    assert bst.inorder_traversal() == list(range(n))
+    assert bst.is_valid_bst() == True
+    
+    bst.delete(n - 1)
+    bst.delete(0)
+    assert bst.search(n - 1) == False
+    assert bst.find_min() == 1
+    assert bst.height() == n - 2
+
+
+def test_random_operations_match_set():
+    random.seed(15)
+    bst = BinarySearchTree()
+    values = set()
+    
+    for _ in range(1000):
+        val = random.randrange(200)
+        if random.random() < 0.6:
+            if val not in values:
+                bst.insert(val)
+                values.add(val)
+        else:
+            bst.delete(val)
+            values.discard(val)
+        assert bst.search(val) == (val in values)
+    
+    assert bst.inorder_traversal() == sorted(values)
+    assert bst.is_valid_bst() == True
+
+
+def test_from_sorted():
+    bst = BinarySearchTree.from_sorted(range(1, 16))
+    
+    assert bst.root.value == 8
+    assert bst.height() == 4  # perfectly balanced
+    assert bst.inorder_traversal() == list(range(1, 16))
+    assert bst.is_valid_bst() == True
+    
+    bst.insert(20)
+    assert bst.search(20) == True
+    
+    assert BinarySearchTree.from_sorted([]).root is None
+    
+    try:
+        BinarySearchTree.from_sorted([1, 3, 2])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
 if __name__ == "__main__":
     test_insert_and_search()
     test_inorder_traversal()
@@ -112,4 +188,8 @@ if __name__ == "__main__":
     test_height()
     test_is_valid_bst()
     test_empty_tree()
+    test_delete_root()
+    test_deep_skewed_tree()
+    test_random_operations_match_set()
+    test_from_sorted()
     print("All BST tests passed!")
@@ -0,0 +1,99 @@
+"""
+Tests for Scapegoat Tree implementation
+"""
+
+import sys
+import os
+import math
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scapegoat_tree import ScapegoatTree
+
+
+def _height_bound(tree):
+    """Largest height allowed by the alpha-height invariant."""
+    return math.floor(math.log(max(tree.max_size, 1), 1 / tree.alpha)) + 1
+
+
+def test_insert_search_delete():
+    tree = ScapegoatTree()
+    for val in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(val)
+
+    assert len(tree) == 7
+    assert tree.search(40) == True
+    assert tree.search(45) == False
+    assert tree.delete(30) == True
+    assert tree.delete(30) == False
+    assert len(tree) == 6
+    assert tree.inorder_traversal() == [20, 40, 50, 60, 70, 80]
+    assert tree.is_valid_bst() == True
+
+
+def test_sorted_inserts_stay_shallow():
+    tree = ScapegoatTree()
+    n = 5000
+    for val in range(n):
+        tree.insert(val)
+
+    assert tree.height() <= _height_bound(tree)
+    assert tree.inorder_traversal() == list(range(n))
+
+    tree = ScapegoatTree()
+    for val in range(n, 0, -1):
+        tree.insert(val)
+    assert tree.height() <= _height_bound(tree)
+
+
+def test_deletes_trigger_full_rebuild():
+    tree = ScapegoatTree.from_sorted(range(100))
+    assert len(tree) == 100
+    assert tree.max_size == 100
+
+    for val in range(40):
+        tree.delete(val)
+    # Dropping below alpha * max_size rebuilt the tree and reset max_size
+    assert tree.max_size < 100
+    assert tree.inorder_traversal() == list(range(40, 100))
+    assert tree.height() <= _height_bound(tree)
+
+
+def test_invalid_alpha():
+    for alpha in (0.5, 1, 2):
+        try:
+            ScapegoatTree(alpha)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+def test_random_operations_match_set():
+    random.seed(24)
+    tree = ScapegoatTree(alpha=0.6)
+    values = set()
+
+    for i in range(4000):
+        val = random.randrange(1000)
+        if val in values and random.random() < 0.5:
+            assert tree.delete(val) == True
+            values.discard(val)
+        elif val not in values:
+            tree.insert(val)
+            values.add(val)
+
+        if i % 500 == 0:
+            assert tree.height() <= _height_bound(tree)
+
+    assert len(tree) == len(values)
+    assert tree.inorder_traversal() == sorted(values)
+    assert tree.is_valid_bst() == True
+
+
+if __name__ == "__main__":
+    test_insert_search_delete()
+    test_sorted_inserts_stay_shallow()
+    test_deletes_trigger_full_rebuild()
+    test_invalid_alpha()
+    test_random_operations_match_set()
+    print("All Scapegoat Tree tests passed!")
@@ -32,9 +32,51 @@ class RedBlackTree:
         self.NIL = TreeNode(None, Color.BLACK)
         self.root = self.NIL
     
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Build a balanced Red-Black Tree from strictly increasing values in O(n).
+        
+        Every level but the last is full, so coloring the nodes on the last
+        level red (when it is not the root) and all others black gives every
+        root-to-leaf path the same number of black nodes.
+        Raises ValueError if the values are not strictly increasing.
+        """
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if not values[i - 1] < values[i]:
+                raise ValueError("from_sorted() requires strictly increasing values")
+        
+        tree = cls()
+        if values:
+            red_depth = len(values).bit_length() - 1
+            tree.root = tree._build_balanced(values, 0, len(values) - 1, 0, red_depth)
+            tree.root.parent = None
+        return tree
+    
+    def _build_balanced(self, values, start, end, depth, red_depth):
+        """Build a balanced, colored subtree from values[start:end + 1]."""
+        if start > end:
+            return self.NIL
+        
+        mid = (start + end) // 2
+        color = Color.RED if depth == red_depth and depth > 0 else Color.BLACK
+        node = self._new_node(values[mid], color)
+        node.left = self._build_balanced(values, start, mid - 1, depth + 1, red_depth)
+        node.right = self._build_balanced(values, mid + 1, end, depth + 1, red_depth)
+        if node.left != self.NIL:
+            node.left.parent = node
+        if node.right != self.NIL:
+            node.right.parent = node
+        return node
+    
+    def _new_node(self, value, color=Color.RED):
+        """Create a node; subclasses override this to store extra fields."""
+        return TreeNode(value, color)
+    
     def insert(self, value):
         """Insert a value into the Red-Black Tree."""
-        new_node = TreeNode(value)
+        new_node = self._new_node(value)
         new_node.left = self.NIL
         new_node.right = self.NIL
         
@@ -145,6 +187,133 @@ class RedBlackTree:
         x.right = y
         y.parent = x
     
+    def delete(self, value):
+        """Delete one occurrence of value from the tree; missing values are ignored."""
+        node = self._find_node(value)
+        if node != self.NIL:
+            self._delete_node(node)
+    
+    def _find_node(self, value):
+        """Return the node holding value, or NIL if it is not in the tree."""
+        node = self.root
+        while node != self.NIL:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                node = node.right
+            else:
+                return node
+        return node
+    
+    def _transplant(self, u, v):
+        """Replace the subtree rooted at u with the subtree rooted at v."""
+        if u.parent is None:
+            self.root = v
+        elif u == u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        # Set even when v is NIL, so _fix_delete can walk up from it
+        v.parent = u.parent
+    
+    def _delete_node(self, node):
+        """
+        Unlink node from the tree and restore the Red-Black properties.
+        
+        A node with two children is replaced by its successor node itself
+        rather than by a copy of its value, so nodes never change identity.
+        """
+        removed_color = node.color
+        if node.left == self.NIL:
+            x = node.right
+            self._transplant(node, node.right)
+        elif node.right == self.NIL:
+            x = node.left
+            self._transplant(node, node.left)
+        else:
+            successor = node.right
+            while successor.left != self.NIL:
+                successor = successor.left
+            removed_color = successor.color
+            x = successor.right
+            
+            if successor.parent == node:
+                x.parent = successor
+            else:
+                self._transplant(successor, successor.right)
+                successor.right = node.right
+                successor.right.parent = successor
+            
+            self._transplant(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.color = node.color
+        
+        if removed_color == Color.BLACK:
+            self._fix_delete(x)
+    
+    def _fix_delete(self, x):
+        """Fix Red-Black Tree properties after deletion."""
+        while x != self.root and x.color == Color.BLACK:
+            if x == x.parent.left:
+                sibling = x.parent.right
+                
+                if sibling.color == Color.RED:
+                    # Case 1: Sibling is red
+                    sibling.color = Color.BLACK
+                    x.parent.color = Color.RED
+                    self._rotate_left(x.parent)
+                    sibling = x.parent.right
+                
+                if sibling.left.color == Color.BLACK and sibling.right.color == Color.BLACK:
+                    # Case 2: Sibling has two black children
+                    sibling.color = Color.RED
+                    x = x.parent
+                else:
+                    if sibling.right.color == Color.BLACK:
+                        # Case 3: Sibling's far child is black
+                        sibling.left.color = Color.BLACK
+                        sibling.color = Color.RED
+                        self._rotate_right(sibling)
+                        sibling = x.parent.right
+                    
+                    # Case 4: Sibling's far child is red
+                    sibling.color = x.parent.color
+                    x.parent.color = Color.BLACK
+                    sibling.right.color = Color.BLACK
+                    self._rotate_left(x.parent)
+                    x = self.root
+            else:
+                sibling = x.parent.left
+                
+                if sibling.color == Color.RED:
+                    # Case 1: Sibling is red
+                    sibling.color = Color.BLACK
+                    x.parent.color = Color.RED
+                    self._rotate_right(x.parent)
+                    sibling = x.parent.left
+                
+                if sibling.left.color == Color.BLACK and sibling.right.color == Color.BLACK:
+                    # Case 2: Sibling has two black children
+                    sibling.color = Color.RED
+                    x = x.parent
+                else:
+                    if sibling.left.color == Color.BLACK:
+                        # Case 3: Sibling's far child is black
+                        sibling.right.color = Color.BLACK
+                        sibling.color = Color.RED
+                        self._rotate_left(sibling)
+                        sibling = x.parent.left
+                    
+                    # Case 4: Sibling's far child is red
+                    sibling.color = x.parent.color
+                    x.parent.color = Color.BLACK
+                    sibling.left.color = Color.BLACK
+                    self._rotate_right(x.parent)
+                    x = self.root
+        
+        x.color = Color.BLACK
+    
     def search(self, value):
         """Search for a value in the tree."""
         return self._search_recursive(self.root, value)
@@ -161,6 +330,67 @@ class RedBlackTree:
         else:
             return self._search_recursive(node.right, value)
     
+    def __iter__(self):
+        """Iterate over the values in ascending order."""
+        return self.irange()
+    
+    def __reversed__(self):
+        """Iterate over the values in descending order."""
+        return self.irange(reverse=True)
+    
+    def irange(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield the values v with lo <= v <= hi in sorted order.
+        
+        Either bound may be None for an open end. The generator seeks the
+        first value in O(log n) and keeps an explicit stack of at most
+        O(log n) nodes, so producing k values costs O(log n + k).
+        """
+        for node in self._iter_nodes(lo, hi, reverse):
+            yield node.value
+    
+    def _iter_nodes(self, lo=None, hi=None, reverse=False):
+        """Lazily yield the nodes with lo <= node.value <= hi in sorted order."""
+        stack = []
+        if not reverse:
+            # Push the path to the first value >= lo
+            node = self.root
+            while node != self.NIL:
+                if lo is None or node.value >= lo:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            
+            while stack:
+                node = stack.pop()
+                if hi is not None and node.value > hi:
+                    return
+                yield node
+                node = node.right
+                while node != self.NIL:
+                    stack.append(node)
+                    node = node.left
+        else:
+            # Push the path to the last value <= hi
+            node = self.root
+            while node != self.NIL:
+                if hi is None or node.value <= hi:
+                    stack.append(node)
+                    node = node.right
+                else:
+                    node = node.left
+            
+            while stack:
+                node = stack.pop()
+                if lo is not None and node.value < lo:
+                    return
+                yield node
+                node = node.left
+                while node != self.NIL:
+                    stack.append(node)
+                    node = node.right
+    
     def inorder_traversal(self, node=None, result=None):
         """Inorder traversal (Left -> Root -> Right)."""
         if result is None:
@@ -212,4 +442,10 @@ if __name__ == "__main__":
     print(f"Inorder traversal: {rbt.inorder_traversal()}")
     print(f"Search 15: {rbt.search(15)}")
     print(f"Search 100: {rbt.search(100)}")
+    print(f"Lazy range [5, 20], descending: {list(rbt.irange(5, 20, reverse=True))}")
+    print(f"Is valid Red-Black Tree: {rbt.is_valid_red_black_tree()}")
+    
+    print("\nDeleting 20...")
+    rbt.delete(20)
+    print(f"Inorder traversal: {rbt.inorder_traversal()}")
     print(f"Is valid Red-Black Tree: {rbt.is_valid_red_black_tree()}")
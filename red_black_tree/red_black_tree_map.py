@@ -0,0 +1,175 @@
+"""
+Red-Black Tree Map Implementation
+
+A sorted mapping built on RedBlackTree. Each node stores its value alongside
+the key, so a lookup is a single descent and no parallel dict is needed. Keys
+are unique and kept in ascending order: iteration, keys(), values() and
+items() all walk the tree in order.
+"""
+
+from red_black_tree import RedBlackTree, TreeNode, Color
+
+
+_MISSING = object()
+
+
+class MapNode(TreeNode):
+    """Node in a Red-Black tree map; value is the key, payload the mapped value."""
+
+    def __init__(self, key, color=Color.RED, payload=None):
+        super().__init__(key, color)
+        self.payload = payload
+
+
+class RedBlackTreeMap(RedBlackTree):
+    """Sorted key/value mapping backed by a Red-Black Tree."""
+
+    def __init__(self):
+        super().__init__()
+        self._size = 0
+
+    @classmethod
+    def from_sorted(cls, items):
+        """
+        Build a balanced map from (key, value) pairs with strictly increasing keys in O(n).
+
+        Raises ValueError if the keys are not strictly increasing.
+        """
+        items = list(items)
+        tree = super().from_sorted(key for key, _ in items)
+        for node, (_, payload) in zip(tree._iter_nodes(), items):
+            node.payload = payload
+        tree._size = len(items)
+        return tree
+
+    def _new_node(self, key, color=Color.RED):
+        """Create a node with no value attached yet."""
+        return MapNode(key, color)
+
+    def _put(self, key, payload, replace):
+        """
+        Find or insert the node for key in one descent and return it.
+
+        An existing node only has its payload overwritten when replace is true.
+        """
+        parent = None
+        node = self.root
+        while node != self.NIL:
+            parent = node
+            if key < node.value:
+                node = node.left
+            elif key > node.value:
+                node = node.right
+            else:
+                if replace:
+                    node.payload = payload
+                return node
+
+        node = MapNode(key, payload=payload)
+        node.left = self.NIL
+        node.right = self.NIL
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif key < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self._size += 1
+        self._fix_insert(node)
+        return node
+
+    def insert(self, key):
+        """Add key with no value if it is not already present."""
+        self._put(key, None, False)
+
+    def _delete_node(self, node):
+        """Unlink node and keep the size up to date."""
+        super()._delete_node(node)
+        self._size -= 1
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        node = self._find_node(key)
+        if node == self.NIL:
+            raise KeyError(key)
+        return node.payload
+
+    def __setitem__(self, key, value):
+        self._put(key, value, True)
+
+    def __delitem__(self, key):
+        node = self._find_node(key)
+        if node == self.NIL:
+            raise KeyError(key)
+        self._delete_node(node)
+
+    def __contains__(self, key):
+        return self._find_node(key) != self.NIL
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if key is missing."""
+        node = self._find_node(key)
+        if node == self.NIL:
+            return default
+        return node.payload
+
+    def pop(self, key, default=_MISSING):
+        """
+        Remove key and return its value.
+
+        Returns default if key is missing, or raises KeyError if no default
+        was given.
+        """
+        node = self._find_node(key)
+        if node == self.NIL:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._delete_node(node)
+        return node.payload
+
+    def setdefault(self, key, default=None):
+        """Return the value for key, inserting default first if key is missing."""
+        return self._put(key, default, False).payload
+
+    def keys(self):
+        """Iterate over the keys in ascending order."""
+        return self.irange()
+
+    def values(self):
+        """Iterate over the values in ascending key order."""
+        for node in self._iter_nodes():
+            yield node.payload
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield (key, value) pairs with lo <= key <= hi in key order.
+
+        Either bound may be None for an open end, as in irange().
+        """
+        for node in self._iter_nodes(lo, hi, reverse):
+            yield node.value, node.payload
+
+
+# Example usage
+if __name__ == "__main__":
+    prices = RedBlackTreeMap()
+
+    prices["pear"] = 3
+    prices["apple"] = 5
+    prices["fig"] = 8
+    prices["apple"] = 4  # updated in place
+
+    print("Red-Black Tree Map Operations:")
+    print(f"Items: {list(prices.items())}")
+    print(f"prices['fig']: {prices['fig']}")
+    print(f"get('kiwi', 0): {prices.get('kiwi', 0)}")
+    print(f"setdefault('kiwi', 2): {prices.setdefault('kiwi', 2)}")
+    print(f"pop('pear'): {prices.pop('pear')}")
+    print(f"Keys: {list(prices.keys())}")
+    print(f"Size: {len(prices)}")
+    print(f"Is valid Red-Black Tree: {prices.is_valid_red_black_tree()}")
@@ -4,6 +4,7 @@ Tests for Red-Black Tree implementation
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from red_black_tree import RedBlackTree, Color
@@ -71,6 +72,113 @@ def test_empty_tree():
     assert rbt.is_valid_red_black_tree() == True
 
 
+def test_from_sorted():
+    for n in range(0, 70):
+        rbt = RedBlackTree.from_sorted(range(n))
+        
+        assert rbt.inorder_traversal() == list(range(n))
+        assert rbt.is_valid_red_black_tree() == True
+        if n:
+            assert rbt.root.parent is None
+    
+    # Parent pointers are set, so inserts rebalance correctly afterwards
+    rbt = RedBlackTree.from_sorted(range(0, 100, 10))
+    for val in [5, 15, 25, 35, 95, 96, 97]:
+        rbt.insert(val)
+    assert rbt.is_valid_red_black_tree() == True
+    assert rbt.inorder_traversal() == sorted(list(range(0, 100, 10)) + [5, 15, 25, 35, 95, 96, 97])
+    
+    try:
+        RedBlackTree.from_sorted([2, 1])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_iteration():
+    rbt = RedBlackTree()
+    for val in [30, 20, 40, 10, 25, 35, 50]:
+        rbt.insert(val)
+    
+    assert list(rbt) == [10, 20, 25, 30, 35, 40, 50]
+    assert list(reversed(rbt)) == [50, 40, 35, 30, 25, 20, 10]
+    assert list(RedBlackTree()) == []
+
+
+def test_irange():
+    rbt = RedBlackTree()
+    for val in [30, 20, 40, 10, 25, 35, 50]:
+        rbt.insert(val)
+    
+    assert list(rbt.irange(20, 40)) == [20, 25, 30, 35, 40]
+    assert list(rbt.irange(21, 39)) == [25, 30, 35]
+    assert list(rbt.irange(hi=25)) == [10, 20, 25]
+    assert list(rbt.irange(lo=36)) == [40, 50]
+    assert list(rbt.irange(41, 49)) == []
+    assert list(rbt.irange(40, 20)) == []
+    assert list(rbt.irange(20, 40, reverse=True)) == [40, 35, 30, 25, 20]
+    assert list(rbt.irange(lo=36, reverse=True)) == [50, 40]
+    
+    # Lazy: only the requested prefix is produced
+    values = rbt.irange(lo=15)
+    assert next(values) == 20
+    assert next(values) == 25
+
+
+def test_irange_matches_naive():
+    random.seed(18)
+    values = random.sample(range(1000), 300)
+    rbt = RedBlackTree()
+    for val in values:
+        rbt.insert(val)
+    values.sort()
+    
+    for _ in range(100):
+        lo = random.randrange(-10, 1010)
+        hi = random.randrange(-10, 1010)
+        expected = [v for v in values if lo <= v <= hi]
+        assert list(rbt.irange(lo, hi)) == expected
+        assert list(rbt.irange(lo, hi, reverse=True)) == expected[::-1]
+
+
+def test_delete():
+    rbt = RedBlackTree()
+    for val in [10, 20, 30, 15, 25, 5, 1]:
+        rbt.insert(val)
+    
+    rbt.delete(20)  # two children
+    rbt.delete(1)   # leaf
+    rbt.delete(99)  # missing, ignored
+    assert rbt.inorder_traversal() == [5, 10, 15, 25, 30]
+    assert rbt.is_valid_red_black_tree() == True
+    
+    for val in [5, 10, 15, 25, 30]:
+        rbt.delete(val)
+    assert rbt.root == rbt.NIL
+    assert rbt.inorder_traversal() == []
+
+
+def test_random_delete_matches_set():
+    random.seed(21)
+    rbt = RedBlackTree()
+    values = set()
+    
+    for _ in range(2000):
+        val = random.randrange(300)
+        if val in values:
+            rbt.delete(val)
+            values.discard(val)
+        else:
+            rbt.insert(val)
+            values.add(val)
+        assert rbt.root.parent is None
+        if len(values) % 50 == 0:
+            assert rbt.is_valid_red_black_tree() == True
+    
+    assert rbt.inorder_traversal() == sorted(values)
+    assert rbt.is_valid_red_black_tree() == True
+
+
 if __name__ == "__main__":
     test_insert_and_search()
     test_inorder_traversal()
@@ -78,4 +186,10 @@ if __name__ == "__main__":
     test_is_valid_red_black_tree()
     test_sequential_insertion()
     test_empty_tree()
+    test_from_sorted()
+    test_iteration()
+    test_irange()
+    test_irange_matches_naive()
+    test_delete()
+    test_random_delete_matches_set()
     print("All Red-Black Tree tests passed!")
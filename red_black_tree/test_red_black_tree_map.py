@@ -0,0 +1,114 @@
+"""
+Tests for Red-Black Tree Map implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from red_black_tree_map import RedBlackTreeMap
+
+
+def test_set_and_get():
+    tree = RedBlackTreeMap()
+    tree[3] = "c"
+    tree[1] = "a"
+    tree[2] = "b"
+    tree[1] = "A"  # overwrite in place
+    tree.insert(2)  # already present, value kept
+
+    assert len(tree) == 3
+    assert tree[1] == "A"
+    assert tree.get(2) == "b"
+    assert tree.get(9) is None
+    assert tree.get(9, "x") == "x"
+    assert 3 in tree
+    assert 9 not in tree
+
+    try:
+        tree[9]
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+
+
+def test_pop_and_delitem():
+    tree = RedBlackTreeMap.from_sorted((k, k * 10) for k in range(7))
+
+    assert tree.pop(3) == 30  # node with two children
+    assert tree.pop(3, None) is None
+    del tree[0]
+    assert list(tree.items()) == [(1, 10), (2, 20), (4, 40), (5, 50), (6, 60)]
+    assert tree.is_valid_red_black_tree() == True
+
+    for missing in (lambda: tree.pop(3), lambda: tree.__delitem__(3)):
+        try:
+            missing()
+            assert False, "expected KeyError"
+        except KeyError:
+            pass
+
+
+def test_setdefault():
+    tree = RedBlackTreeMap()
+    assert tree.setdefault("x", []) == []
+    tree.setdefault("x", []).append(1)
+    tree.setdefault("x", "ignored").append(2)
+    assert tree["x"] == [1, 2]
+    assert len(tree) == 1
+
+
+def test_ordered_views():
+    tree = RedBlackTreeMap()
+    for key in [5, 1, 4, 2, 3]:
+        tree[key] = str(key)
+
+    assert list(tree) == [1, 2, 3, 4, 5]
+    assert list(tree.keys()) == [1, 2, 3, 4, 5]
+    assert list(tree.values()) == ["1", "2", "3", "4", "5"]
+    assert list(tree.items(2, 4)) == [(2, "2"), (3, "3"), (4, "4")]
+    assert list(tree.items(reverse=True))[0] == (5, "5")
+    assert list(tree.irange(2, 3)) == [2, 3]
+
+
+def test_from_sorted():
+    tree = RedBlackTreeMap.from_sorted([(1, "a"), (2, "b"), (3, "c")])
+    assert list(tree.items()) == [(1, "a"), (2, "b"), (3, "c")]
+
+    try:
+        RedBlackTreeMap.from_sorted([(2, "b"), (1, "a")])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_random_operations_match_dict():
+    random.seed(21)
+    tree = RedBlackTreeMap()
+    expected = {}
+
+    for i in range(3000):
+        key = random.randrange(200)
+        op = random.random()
+        if op < 0.5:
+            tree[key] = i
+            expected[key] = i
+        elif op < 0.8:
+            assert tree.pop(key, None) == expected.pop(key, None)
+        else:
+            assert tree.setdefault(key, i) == expected.setdefault(key, i)
+
+    assert list(tree.items()) == sorted(expected.items())
+    assert len(tree) == len(expected)
+    assert tree.is_valid_red_black_tree() == True
+
+
+if __name__ == "__main__":
+    test_set_and_get()
+    test_pop_and_delitem()
+    test_setdefault()
+    test_ordered_views()
+    test_from_sorted()
+    test_random_operations_match_dict()
+    print("All Red-Black Tree Map tests passed!")
@@ -0,0 +1,202 @@
+"""
+Benchmarks for the Segment Tree implementations
+
+Run with:
+    python segment_tree/benchmark_segment_tree.py
+"""
+
+import sys
+import os
+import math
+import random
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from segment_tree import SegmentTree, SegmentTreeMin
+from iterative_segment_tree import IterativeSegmentTree, IterativeSegmentTreeMin
+from monoid_segment_tree import MonoidSegmentTree
+from sparse_table import SparseTable
+from sliding_window_segment_tree import SlidingWindowSegmentTree
+
+
+def _timed(func):
+    """Run func once and return the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _report(label, baseline, candidate):
+    """Print baseline vs candidate timings and the speedup."""
+    print(f"  {label:<24} {baseline * 1000:9.1f} ms -> {candidate * 1000:9.1f} ms"
+          f"  ({baseline / candidate:5.1f}x)")
+
+
+def bench_recursive_vs_iterative(n=100_000, ops=100_000):
+    """Compare the recursive and iterative engines on build, query and update."""
+    random.seed(0)
+    arr = [random.randint(0, 1000) for _ in range(n)]
+    ranges = []
+    for _ in range(ops):
+        left = random.randrange(n)
+        ranges.append((left, random.randrange(left, n)))
+    updates = [(random.randrange(n), random.randint(0, 1000)) for _ in range(ops)]
+
+    for name, recursive_cls, iterative_cls in (
+        ("sum", SegmentTree, IterativeSegmentTree),
+        ("min", SegmentTreeMin, IterativeSegmentTreeMin),
+    ):
+        print(f"\nRange {name}, n={n}, ops={ops}")
+        trees = {}
+
+        def build(cls):
+            trees[cls] = cls(arr)
+
+        def query(cls):
+            tree = trees[cls]
+            for left, right in ranges:
+                tree.query(left, right)
+
+        def update(cls):
+            tree = trees[cls]
+            for index, value in updates:
+                tree.update(index, value)
+
+        for label, step in (("build", build), ("query", query), ("update", update)):
+            _report(label,
+                    _timed(lambda: step(recursive_cls)),
+                    _timed(lambda: step(iterative_cls)))
+
+
+def bench_monoid_fast_paths(n=100_000, ops=100_000):
+    """Compare built-in fast paths against the same monoid as a Python lambda."""
+    random.seed(0)
+    arr = [random.randint(1, 1 << 30) for _ in range(n)]
+    ranges = []
+    for _ in range(ops):
+        left = random.randrange(n)
+        ranges.append((left, random.randrange(left, n)))
+    updates = [(random.randrange(n), random.randint(1, 1 << 30)) for _ in range(ops)]
+
+    generic = {
+        'sum': (lambda a, b: a + b, 0),
+        'min': (lambda a, b: a if a <= b else b, float('inf')),
+        'max': (lambda a, b: a if a >= b else b, float('-inf')),
+        'gcd': (lambda a, b: math.gcd(a, b), 0),
+        'xor': (lambda a, b: a ^ b, 0),
+    }
+
+    print(f"\nMonoid segment tree, lambda -> fast path, n={n}, ops={ops}")
+    for name, (combine, identity) in generic.items():
+        trees = {}
+
+        def build(key):
+            if key == 'fast':
+                trees[key] = MonoidSegmentTree(arr, name)
+            else:
+                trees[key] = MonoidSegmentTree(arr, combine, identity)
+
+        def query(key):
+            tree = trees[key]
+            for left, right in ranges:
+                tree.query(left, right)
+
+        def update(key):
+            tree = trees[key]
+            for index, value in updates:
+                tree.update(index, value)
+
+        for label, step in ((f"{name} build", build), (f"{name} query", query),
+                            (f"{name} update", update)):
+            _report(label,
+                    _timed(lambda: step('generic')),
+                    _timed(lambda: step('fast')))
+
+
+def bench_batched(n=100_000, batch=100_000):
+    """Compare query_many/update_many against a loop of single calls."""
+    random.seed(0)
+    arr = [random.randint(0, 1000) for _ in range(n)]
+    lefts = [random.randrange(n) for _ in range(batch)]
+    rights = [random.randrange(left, n) for left in lefts]
+    indices = [random.randrange(n) for _ in range(batch)]
+    values = [random.randint(0, 1000) for _ in range(batch)]
+
+    print(f"\nBatched operations, n={n}, batch={batch}")
+    for name, cls in (("sum", IterativeSegmentTree), ("min", IterativeSegmentTreeMin)):
+        tree = cls(arr)
+
+        def single_queries():
+            for left, right in zip(lefts, rights):
+                tree.query(left, right)
+
+        def single_updates():
+            for index, value in zip(indices, values):
+                tree.update(index, value)
+
+        _report(f"{name} query_many",
+                _timed(single_queries),
+                _timed(lambda: tree.query_many(lefts, rights)))
+        _report(f"{name} update_many",
+                _timed(single_updates),
+                _timed(lambda: tree.update_many(indices, values)))
+
+
+def bench_sparse_table(n=100_000, ops=100_000):
+    """Compare static range-min queries on SegmentTreeMin and SparseTable."""
+    random.seed(0)
+    arr = [random.randint(0, 1000) for _ in range(n)]
+    ranges = []
+    for _ in range(ops):
+        left = random.randrange(n)
+        ranges.append((left, random.randrange(left, n)))
+
+    print(f"\nStatic range min, n={n}, ops={ops}")
+    trees = {}
+
+    def build(cls):
+        trees[cls] = cls(arr)
+
+    def query(cls):
+        tree = trees[cls]
+        for left, right in ranges:
+            tree.query(left, right)
+
+    for label, step in (("build", build), ("query", query)):
+        _report(label,
+                _timed(lambda: step(SegmentTreeMin)),
+                _timed(lambda: step(SparseTable)))
+
+
+def bench_sliding_window(samples=1_000_000, capacity=4096):
+    """Measure push and rolling-query throughput of SlidingWindowSegmentTree."""
+    random.seed(0)
+    stream = [random.randint(0, 1000) for _ in range(samples)]
+
+    print(f"\nSliding window, samples={samples}, capacity={capacity}")
+    for name in ('sum', 'min', 'max'):
+        window = SlidingWindowSegmentTree(capacity, name)
+        push = window.push
+
+        def push_all():
+            for sample in stream:
+                push(sample)
+
+        def push_and_query():
+            query = window.query
+            for sample in stream:
+                push(sample)
+                query()
+
+        elapsed = _timed(push_all)
+        print(f"  {name} push               {samples / elapsed / 1e6:6.2f} M samples/s")
+        elapsed = _timed(push_and_query)
+        print(f"  {name} push + query       {samples / elapsed / 1e6:6.2f} M samples/s")
+
+
+if __name__ == "__main__":
+    bench_recursive_vs_iterative()
+    bench_monoid_fast_paths()
+    bench_batched()
+    bench_sparse_table()
+    bench_sliding_window()
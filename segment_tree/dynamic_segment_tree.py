@@ -0,0 +1,145 @@
+"""
+Dynamic Segment Tree Implementation
+
+A segment tree over a huge index range (for example timestamps or 64-bit IDs)
+that only creates nodes along the paths that are actually updated. Nodes live
+in a pool of parallel typed arrays (left child, right child, sum) addressed by
+integer handles, so memory grows with O(updates * log range) instead of with
+the size of the range, and no coordinate compression is needed up front.
+"""
+
+from array import array
+
+
+class DynamicSegmentTree:
+    """
+    Range sum segment tree over [low, high] with lazily created nodes.
+
+    Values are stored as 64-bit integers by default; pass typecode='d' for
+    floating point values.
+    """
+
+    def __init__(self, low=0, high=2 ** 63 - 1, typecode='q'):
+        if low > high:
+            raise ValueError("low must not be greater than high")
+
+        self.low = low
+        self.high = high
+        # Handle 0 is the shared empty node; handle 1 is the root
+        self.left = array('q', [0, 0])
+        self.right = array('q', [0, 0])
+        self.sums = array(typecode, [0, 0])
+
+    def __len__(self):
+        """Number of allocated nodes, excluding the empty sentinel."""
+        return len(self.sums) - 1
+
+    def _new_node(self):
+        """Allocate an empty node and return its handle."""
+        self.left.append(0)
+        self.right.append(0)
+        self.sums.append(0)
+        return len(self.sums) - 1
+
+    def _path_to(self, index):
+        """Return the node handles from the root down to index's leaf, creating them."""
+        left = self.left
+        right = self.right
+        path = [1]
+        node = 1
+        start = self.low
+        end = self.high
+        while start < end:
+            mid = (start + end) // 2
+            if index <= mid:
+                child = left[node]
+                if not child:
+                    child = left[node] = self._new_node()
+                end = mid
+            else:
+                child = right[node]
+                if not child:
+                    child = right[node] = self._new_node()
+                start = mid + 1
+            path.append(child)
+            node = child
+        return path
+
+    def add(self, index, delta):
+        """
+        Add delta to the value at index.
+
+        A delta the typecode cannot hold raises TypeError or OverflowError
+        and leaves the tree unchanged.
+        """
+        if not self.low <= index <= self.high:
+            return
+
+        path = self._path_to(index)
+        sums = self.sums
+        # Stage the new sums first, so nothing is written if one is rejected
+        staged = array(sums.typecode, [sums[node] + delta for node in path])
+        for node, total in zip(path, staged):
+            sums[node] = total
+
+    def update(self, index, value):
+        """
+        Update value at index.
+
+        A value the typecode cannot hold raises TypeError or OverflowError
+        and leaves the tree unchanged.
+        """
+        if not self.low <= index <= self.high:
+            return
+
+        path = self._path_to(index)
+        sums = self.sums
+        left = self.left
+        right = self.right
+        # Stage the new leaf-to-root sums first, so nothing is written if one
+        # is rejected
+        staged = array(sums.typecode, [value])
+        for i in range(len(path) - 2, -1, -1):
+            node = path[i]
+            sibling = right[node] if left[node] == path[i + 1] else left[node]
+            staged.append(staged[-1] + sums[sibling])
+        for node, total in zip(reversed(path), staged):
+            sums[node] = total
+
+    def query(self, left, right):
+        """Query sum in range [left, right]."""
+        left = max(left, self.low)
+        right = min(right, self.high)
+        if left > right:
+            return 0
+
+        sums = self.sums
+        left_child = self.left
+        right_child = self.right
+        result = 0
+        stack = [(1, self.low, self.high)]
+        while stack:
+            node, start, end = stack.pop()
+            if not node or right < start or left > end:
+                continue
+            if left <= start and end <= right:
+                result += sums[node]
+                continue
+            mid = (start + end) // 2
+            stack.append((left_child[node], start, mid))
+            stack.append((right_child[node], mid + 1, end))
+        return result
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = DynamicSegmentTree()
+
+    print("Dynamic Segment Tree Operations:")
+    tree.update(1_700_000_000_000, 5)
+    tree.update(1_700_000_050_000, 7)
+    tree.add(9_000_000_000_000_000_000, 3)
+
+    print(f"Sum over all timestamps: {tree.query(0, 2 ** 63 - 1)}")  # 15
+    print(f"Sum of [1.7e12, 1.7e12 + 1e4]: {tree.query(1_700_000_000_000, 1_700_000_010_000)}")  # 5
+    print(f"Allocated nodes: {len(tree)}")
@@ -0,0 +1,111 @@
+"""
+Fenwick Tree (Binary Indexed Tree) Implementation
+
+A Fenwick tree stores partial sums in a single array of n + 1 cells. Node i
+(1-based) holds the sum of the i & -i elements ending at position i, which
+makes prefix sums and point updates O(log n) with a fraction of the memory of
+a segment tree. query/update mirror SegmentTree so the two can be swapped for
+point-update / range-sum workloads.
+"""
+
+class FenwickTree:
+    """Fenwick tree for prefix and range sum queries."""
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        # 1-based: tree[0] is unused
+        self.tree = [0]
+        self.tree.extend(arr)
+        self._build()
+
+    def _build(self):
+        """Build in place in O(n) by pushing each node into its parent."""
+        tree = self.tree
+        n = self.n
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+    def add(self, index, delta):
+        """Add delta to the value at index."""
+        if not 0 <= index < self.n:
+            return
+
+        tree = self.tree
+        n = self.n
+        i = index + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index):
+        """Sum of the values in range [0, index]."""
+        tree = self.tree
+        i = min(index + 1, self.n)
+        result = 0
+        while i > 0:
+            result += tree[i]
+            i -= i & -i
+        return result
+
+    def range_sum(self, left, right):
+        """Sum of the values in range [left, right]."""
+        if not 0 <= left <= right < self.n:
+            return 0
+        return self.prefix_sum(right) - self.prefix_sum(left - 1)
+
+    def lower_bound(self, k):
+        """
+        Find the smallest index whose prefix sum is at least k.
+
+        Requires all values to be non-negative. Returns n when the total sum
+        is smaller than k.
+        """
+        if k <= 0:
+            return 0
+
+        tree = self.tree
+        n = self.n
+        position = 0
+        step = 1
+        while step * 2 <= n:
+            step *= 2
+
+        # Descend from the largest power of two, keeping the prefix below k
+        while step:
+            nxt = position + step
+            if nxt <= n and tree[nxt] < k:
+                position = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return position
+
+    def query(self, left, right):
+        """Query sum in range [left, right] (same as SegmentTree.query)."""
+        return self.range_sum(left, right)
+
+    def update(self, index, value):
+        """Set the value at index (same as SegmentTree.update)."""
+        if 0 <= index < self.n:
+            self.add(index, value - self.range_sum(index, index))
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+    fenwick = FenwickTree(arr)
+
+    print("Fenwick Tree Operations:")
+    print(f"Array: {arr}")
+    print(f"Prefix sum [0, 3]: {fenwick.prefix_sum(3)}")  # 1 + 3 + 5 + 7 = 16
+    print(f"Sum of range [1, 3]: {fenwick.range_sum(1, 3)}")  # 3 + 5 + 7 = 15
+    print(f"First index with prefix sum >= 10: {fenwick.lower_bound(10)}")  # 3
+
+    print("\nAdding 4 to index 0...")
+    fenwick.add(0, 4)
+    print(f"Sum of range [0, 5]: {fenwick.query(0, 5)}")  # 40
+
+    print("\nUpdating index 2 to 6...")
+    fenwick.update(2, 6)
+    print(f"Sum of range [1, 3]: {fenwick.query(1, 3)}")  # 3 + 6 + 7 = 16
@@ -0,0 +1,135 @@
+"""
+2D Fenwick Tree Implementation
+
+A two-dimensional Fenwick tree for point updates and rectangle sums on a
+grid, e.g. heatmap counts. All (width + 1) * (height + 1) cells live in one
+flat typed array instead of a tree of trees, and both operations cost
+O(log width * log height).
+"""
+
+from array import array
+
+
+class FenwickTree2D:
+    """2D Fenwick tree over a width x height grid, indexed as (x, y)."""
+
+    def __init__(self, width, height, grid=None, typecode='q'):
+        """
+        Create an all-zero grid, or build from grid[x][y] in O(width * height).
+
+        Values are 64-bit integers by default; pass typecode='d' for floats.
+        Raises ValueError if grid is not width rows of height values.
+        """
+        self.width = width
+        self.height = height
+        # Row stride of the flat, 1-based array
+        self.stride = height + 1
+        self.tree = array(typecode, [0]) * ((width + 1) * self.stride)
+        if grid is not None:
+            self._build(grid)
+
+    def _build(self, grid):
+        """Copy grid in and push every cell into its parents along y, then x."""
+        tree = self.tree
+        stride = self.stride
+        width = self.width
+        height = self.height
+        # A slice assignment of the wrong length would resize the flat array
+        # and shift every later cell, so check the shape first
+        if len(grid) != width:
+            raise ValueError(f"grid must have {width} rows, got {len(grid)}")
+        for x in range(width):
+            values = array(tree.typecode, grid[x])
+            if len(values) != height:
+                raise ValueError(f"grid row {x} must have {height} values, got {len(values)}")
+            row = (x + 1) * stride
+            tree[row + 1:row + 1 + height] = values
+
+        for x in range(1, width + 1):
+            row = x * stride
+            for y in range(1, height + 1):
+                parent = y + (y & -y)
+                if parent <= height:
+                    tree[row + parent] += tree[row + y]
+
+        for x in range(1, width + 1):
+            parent = x + (x & -x)
+            if parent <= width:
+                row = x * stride
+                parent_row = parent * stride
+                for y in range(1, height + 1):
+                    tree[parent_row + y] += tree[row + y]
+
+    def update(self, x, y, delta):
+        """Add delta to cell (x, y)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+
+        tree = self.tree
+        stride = self.stride
+        width = self.width
+        height = self.height
+        i = x + 1
+        while i <= width:
+            row = i * stride
+            j = y + 1
+            while j <= height:
+                tree[row + j] += delta
+                j += j & -j
+            i += i & -i
+
+    def prefix_sum(self, x, y):
+        """Sum of the cells in rectangle (0, 0)-(x, y), inclusive."""
+        tree = self.tree
+        stride = self.stride
+        result = 0
+        i = min(x + 1, self.width)
+        while i > 0:
+            row = i * stride
+            j = min(y + 1, self.height)
+            while j > 0:
+                result += tree[row + j]
+                j -= j & -j
+            i -= i & -i
+        return result
+
+    def rect_sum(self, x1, y1, x2, y2):
+        """Sum of the cells in rectangle (x1, y1)-(x2, y2), inclusive."""
+        if not (0 <= x1 <= x2 < self.width and 0 <= y1 <= y2 < self.height):
+            return 0
+        return (self.prefix_sum(x2, y2) - self.prefix_sum(x1 - 1, y2)
+                - self.prefix_sum(x2, y1 - 1) + self.prefix_sum(x1 - 1, y1 - 1))
+
+    def update_many(self, xs, ys, deltas):
+        """Apply a batch of point updates."""
+        if not len(xs) == len(ys) == len(deltas):
+            raise ValueError("Batch arguments must have the same length")
+        update = self.update
+        for x, y, delta in zip(xs, ys, deltas):
+            update(x, y, delta)
+
+    def rect_sum_many(self, x1s, y1s, x2s, y2s):
+        """Answer a batch of rectangle sums; returns a list."""
+        if not len(x1s) == len(y1s) == len(x2s) == len(y2s):
+            raise ValueError("Batch arguments must have the same length")
+        rect_sum = self.rect_sum
+        return [rect_sum(x1, y1, x2, y2) for x1, y1, x2, y2 in zip(x1s, y1s, x2s, y2s)]
+
+
+# Example usage
+if __name__ == "__main__":
+    grid = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9],
+    ]
+    fenwick = FenwickTree2D(3, 3, grid)
+
+    print("2D Fenwick Tree Operations:")
+    print(f"Grid: {grid}")
+    print(f"Sum of (0, 0)-(1, 1): {fenwick.rect_sum(0, 0, 1, 1)}")  # 1 + 2 + 4 + 5 = 12
+    print(f"Sum of (1, 1)-(2, 2): {fenwick.rect_sum(1, 1, 2, 2)}")  # 5 + 6 + 8 + 9 = 28
+
+    print("\nAdding 10 to (1, 1)...")
+    fenwick.update(1, 1, 10)
+    print(f"Sum of whole grid: {fenwick.rect_sum(0, 0, 2, 2)}")  # 45 + 10 = 55
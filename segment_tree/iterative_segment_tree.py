@@ -0,0 +1,406 @@
+"""
+Iterative Segment Tree Implementation
+
+A bottom-up segment tree stored in a flat typed array of 2n cells. The leaves
+live at indices [n, 2n) and node i has children 2i and 2i + 1, so the build is
+a single O(n) loop and queries and updates walk the tree with plain loops
+instead of recursive calls. Compared to the recursive SegmentTree the node
+array is half the size and holds machine numbers instead of Python objects.
+"""
+
+import numbers
+from array import array
+from itertools import accumulate
+
+
+def _typecode(values):
+    """
+    Pick the array typecode for values: 'q' for integers, 'd' otherwise.
+
+    Any numbers.Integral counts as an integer, so NumPy integer scalars of
+    every width keep exact integer storage. The int check comes first because
+    the ABC check is much slower.
+    """
+    for value in values:
+        if not (isinstance(value, int) or isinstance(value, numbers.Integral)):
+            return 'd'
+    return 'q'
+
+
+def _buffer_typecode(arr):
+    """
+    Return the typecode matching arr's buffer if its bytes can be copied as-is.
+
+    This lets array.array('q'/'d') and one-dimensional int64/float64 NumPy
+    arrays be loaded without creating a Python object per element.
+    """
+    try:
+        view = memoryview(arr)
+    except TypeError:
+        return None
+    if view.ndim != 1 or not view.c_contiguous or view.itemsize != 8:
+        return None
+    if view.format in ('q', 'l', '<q', '<l', '=q', '=l'):
+        return 'q'
+    if view.format in ('d', '<d', '=d'):
+        return 'd'
+    return None
+
+
+def _node_array(arr):
+    """Allocate a 2n node array with the leaves copied into [n, 2n)."""
+    typecode = _buffer_typecode(arr)
+    if typecode is not None:
+        tree = array(typecode, [0]) * len(arr)
+        tree.frombytes(memoryview(arr).cast('B'))
+        return tree
+
+    typecode = _typecode(arr)
+    tree = array(typecode, [0]) * len(arr)
+    try:
+        # iter() so that arrays of another typecode are accepted too
+        tree.extend(iter(arr))
+    except OverflowError:
+        # Integers beyond 64 bits: fall back to a list of Python numbers
+        return [0] * len(arr) + list(arr)
+    return tree
+
+
+def _widen(tree, error):
+    """
+    Return a copy of tree that can hold the value whose write raised error.
+
+    A float in an integer array widens it to 'd'; a number too large for the
+    array widens it to a list of Python numbers, which holds any int exactly.
+    Any other error is re-raised.
+    """
+    if isinstance(tree, array):
+        if isinstance(error, TypeError) and tree.typecode == 'q':
+            return array('d', tree)
+        if isinstance(error, OverflowError):
+            return list(tree)
+    raise error
+
+
+def _check_batch(first, second):
+    """Validate that two batch arguments have the same length."""
+    if len(first) != len(second):
+        raise ValueError("Batch arguments must have the same length")
+
+
+class IterativeSegmentTree:
+    """Iterative segment tree for range sum queries."""
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        self.tree = _node_array(arr)
+        self._build()
+
+    def _build(self):
+        """Fill the internal nodes from the leaves in O(n)."""
+        tree = self.tree
+        try:
+            for i in range(self.n - 1, 0, -1):
+                tree[i] = tree[2 * i] + tree[2 * i + 1]
+        except OverflowError as error:
+            # A sum does not fit in 64 bits: widen and build again
+            self.tree = _widen(tree, error)
+            self._build()
+
+    def update(self, index, value):
+        """Update value at index."""
+        if not 0 <= index < self.n:
+            return
+
+        try:
+            self._update_path(index + self.n, value)
+        except (TypeError, OverflowError) as error:
+            # The value or a sum does not fit the storage: widen it and redo
+            # the whole path, so no ancestor written before the error is stale
+            self.tree = _widen(self.tree, error)
+            self.update(index, value)
+
+    def _update_path(self, i, value):
+        """Write leaf i and recompute its ancestors."""
+        tree = self.tree
+        tree[i] = value
+        while i > 1:
+            tree[i >> 1] = tree[i] + tree[i ^ 1]
+            i >>= 1
+
+    def query(self, left, right):
+        """Query sum in range [left, right]."""
+        if not 0 <= left <= right < self.n:
+            return 0
+
+        tree = self.tree
+        result = 0
+        left += self.n
+        right += self.n + 1
+        while left < right:
+            if left & 1:
+                result += tree[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                result += tree[right]
+            left >>= 1
+            right >>= 1
+        return result
+
+    def update_many(self, indices, values):
+        """
+        Update a batch of positions at once.
+
+        Leaves are written first and the ancestors are then recomputed level
+        by level, so a node shared by several updated leaves is combined once.
+        Later entries win when an index repeats.
+        """
+        _check_batch(indices, values)
+        try:
+            self._update_batch(indices, values)
+        except (TypeError, OverflowError) as error:
+            # Widen and redo the whole batch, so no node is left stale
+            self.tree = _widen(self.tree, error)
+            self.update_many(indices, values)
+
+    def _update_batch(self, indices, values):
+        """Write a batch of leaves, then recompute their ancestors level by level."""
+        tree = self.tree
+        n = self.n
+        dirty = set()
+        for index, value in zip(indices, values):
+            if 0 <= index < n:
+                i = index + n
+                tree[i] = value
+                dirty.add(i >> 1)
+
+        while dirty:
+            parents = set()
+            for i in dirty:
+                if i:
+                    tree[i] = tree[2 * i] + tree[2 * i + 1]
+                    parents.add(i >> 1)
+            dirty = parents
+
+    def query_many(self, lefts, rights):
+        """
+        Query sums for a batch of ranges [lefts[k], rights[k]]; returns a list.
+
+        A batch of at least n / 16 ranges over integer values is answered from
+        prefix sums of the leaves, built once in O(n) at C speed, so each
+        range costs O(1) instead of a tree walk. Smaller batches and float
+        trees (where prefix differences would round differently from query())
+        walk the tree once per range, the same as calling query() in a loop.
+        """
+        _check_batch(lefts, rights)
+        tree = self.tree
+        n = self.n
+        if 16 * len(lefts) >= n and not (isinstance(tree, array) and tree.typecode == 'd'):
+            prefix = list(accumulate(tree[n:], initial=0))
+            return [prefix[right + 1] - prefix[left] if 0 <= left <= right < n else 0
+                    for left, right in zip(lefts, rights)]
+
+        results = []
+        append = results.append
+        for left, right in zip(lefts, rights):
+            result = 0
+            if 0 <= left <= right < n:
+                left += n
+                right += n + 1
+                while left < right:
+                    if left & 1:
+                        result += tree[left]
+                        left += 1
+                    if right & 1:
+                        right -= 1
+                        result += tree[right]
+                    left >>= 1
+                    right >>= 1
+            append(result)
+        return results
+
+
+class IterativeSegmentTreeMin:
+    """Iterative segment tree for range minimum queries."""
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        self.tree = _node_array(arr)
+        self._build()
+
+    def _build(self):
+        """Fill the internal nodes from the leaves in O(n)."""
+        tree = self.tree
+        for i in range(self.n - 1, 0, -1):
+            a = tree[2 * i]
+            b = tree[2 * i + 1]
+            tree[i] = a if a <= b else b
+
+    def update(self, index, value):
+        """Update value at index."""
+        if not 0 <= index < self.n:
+            return
+
+        try:
+            self._update_path(index + self.n, value)
+        except (TypeError, OverflowError) as error:
+            # The value does not fit the storage: widen it and redo the path
+            self.tree = _widen(self.tree, error)
+            self.update(index, value)
+
+    def _update_path(self, i, value):
+        """Write leaf i and recompute its ancestors."""
+        tree = self.tree
+        tree[i] = value
+        while i > 1:
+            a = tree[i]
+            b = tree[i ^ 1]
+            tree[i >> 1] = a if a <= b else b
+            i >>= 1
+
+    def query(self, left, right):
+        """Query minimum in range [left, right]."""
+        if not 0 <= left <= right < self.n:
+            return float('inf')
+
+        tree = self.tree
+        result = float('inf')
+        left += self.n
+        right += self.n + 1
+        while left < right:
+            if left & 1:
+                if tree[left] < result:
+                    result = tree[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                if tree[right] < result:
+                    result = tree[right]
+            left >>= 1
+            right >>= 1
+        return result
+
+    def update_many(self, indices, values):
+        """
+        Update a batch of positions at once.
+
+        Leaves are written first and the ancestors are then recomputed level
+        by level, so a node shared by several updated leaves is combined once.
+        Later entries win when an index repeats.
+        """
+        _check_batch(indices, values)
+        try:
+            self._update_batch(indices, values)
+        except (TypeError, OverflowError) as error:
+            # Widen and redo the whole batch, so no node is left stale
+            self.tree = _widen(self.tree, error)
+            self.update_many(indices, values)
+
+    def _update_batch(self, indices, values):
+        """Write a batch of leaves, then recompute their ancestors level by level."""
+        tree = self.tree
+        n = self.n
+        dirty = set()
+        for index, value in zip(indices, values):
+            if 0 <= index < n:
+                i = index + n
+                tree[i] = value
+                dirty.add(i >> 1)
+
+        while dirty:
+            parents = set()
+            for i in dirty:
+                if i:
+                    a = tree[2 * i]
+                    b = tree[2 * i + 1]
+                    tree[i] = a if a <= b else b
+                    parents.add(i >> 1)
+            dirty = parents
+
+    def query_many(self, lefts, rights):
+        """
+        Query minimums for a batch of ranges [lefts[k], rights[k]]; returns a list.
+
+        A batch of at least n ranges is answered from a sparse table of the
+        leaves: the O(n log n) build runs at C speed and each range is then
+        two lookups. The build only just pays for itself at that size, so the
+        gain is modest. Smaller batches walk the tree once per range, the same
+        as calling query() in a loop.
+        """
+        _check_batch(lefts, rights)
+        tree = self.tree
+        n = self.n
+        inf = float('inf')
+        if n and len(lefts) >= n:
+            table = self.freeze().table
+            results = []
+            append = results.append
+            for left, right in zip(lefts, rights):
+                if 0 <= left <= right < n:
+                    k = (right - left + 1).bit_length() - 1
+                    row = table[k]
+                    a = row[left]
+                    b = row[right - (1 << k) + 1]
+                    append(a if a <= b else b)
+                else:
+                    append(inf)
+            return results
+
+        results = []
+        append = results.append
+        for left, right in zip(lefts, rights):
+            result = inf
+            if 0 <= left <= right < n:
+                left += n
+                right += n + 1
+                while left < right:
+                    if left & 1:
+                        if tree[left] < result:
+                            result = tree[left]
+                        left += 1
+                    if right & 1:
+                        right -= 1
+                        if tree[right] < result:
+                            result = tree[right]
+                    left >>= 1
+                    right >>= 1
+            append(result)
+        return results
+
+    def freeze(self):
+        """Snapshot the current values into a SparseTable with O(1) queries."""
+        from sparse_table import SparseTable
+
+        return SparseTable(self.tree[self.n:], 'min')
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+    seg_tree = IterativeSegmentTree(arr)
+
+    print("Iterative Segment Tree (Range Sum) Operations:")
+    print(f"Array: {arr}")
+    print(f"Sum of range [1, 3]: {seg_tree.query(1, 3)}")  # 3 + 5 + 7 = 15
+    print(f"Sum of range [0, 5]: {seg_tree.query(0, 5)}")  # 36
+
+    print("\nUpdating index 2 to 6...")
+    seg_tree.update(2, 6)
+    print(f"Sum of range [1, 3]: {seg_tree.query(1, 3)}")  # 3 + 6 + 7 = 16
+
+    print("\nBatched updates and queries...")
+    seg_tree.update_many([0, 5], [2, 10])
+    print(f"Sums of [0, 1], [4, 5]: {seg_tree.query_many([0, 4], [1, 5])}")  # [5, 19]
+
+    print("\n\nIterative Segment Tree (Range Min) Operations:")
+    arr2 = [4, 2, 6, 1, 8, 5]
+    seg_tree_min = IterativeSegmentTreeMin(arr2)
+
+    print(f"Array: {arr2}")
+    print(f"Min of range [0, 2]: {seg_tree_min.query(0, 2)}")  # min(4, 2, 6) = 2
+    print(f"Min of range [2, 5]: {seg_tree_min.query(2, 5)}")  # min(6, 1, 8, 5) = 1
+
+    print("\nUpdating index 3 to 9...")
+    seg_tree_min.update(3, 9)
+    print(f"Min of range [2, 5]: {seg_tree_min.query(2, 5)}")  # min(6, 9, 8, 5) = 5
@@ -0,0 +1,101 @@
+"""
+Merge Sort Tree Implementation
+
+A merge sort tree is a segment tree whose nodes store the sorted values of
+their range, each as a contiguous typed array. A range [left, right] is
+covered by O(log n) nodes, and binary searching each one answers "how many
+values are less than x" in O(log^2 n). Binary searching over the values of
+the whole array on top of that gives the k-th smallest value of a range in
+O(log^3 n). The tree uses O(n log n) memory and is static.
+"""
+
+import numbers
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class MergeSortTree:
+    """Static range order-statistics queries."""
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        # Any numbers.Integral (NumPy integer scalars too) keeps exact integer
+        # storage; the int check comes first because the ABC check is slower
+        self.typecode = 'q' if all(isinstance(value, int) or isinstance(value, numbers.Integral)
+                                   for value in arr) else 'd'
+        self.size = 1
+        while self.size < self.n:
+            self.size *= 2
+
+        empty = array(self.typecode)
+        self.tree = [empty] * (2 * self.size)
+        for i, value in enumerate(arr):
+            self.tree[self.size + i] = array(self.typecode, [value])
+        self._build()
+
+    def _build(self):
+        """Merge children into parents, level by level."""
+        tree = self.tree
+        typecode = self.typecode
+        for i in range(self.size - 1, 0, -1):
+            # Timsort detects the two sorted runs and merges them in linear time
+            tree[i] = array(typecode, sorted(tree[2 * i] + tree[2 * i + 1]))
+
+    def _nodes(self, left, right):
+        """Yield the sorted arrays of the nodes covering [left, right]."""
+        tree = self.tree
+        left += self.size
+        right += self.size + 1
+        while left < right:
+            if left & 1:
+                yield tree[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                yield tree[right]
+            left >>= 1
+            right >>= 1
+
+    def count_less(self, left, right, x):
+        """Count the values in range [left, right] that are less than x."""
+        if not 0 <= left <= right < self.n:
+            return 0
+        return sum(bisect_left(node, x) for node in self._nodes(left, right))
+
+    def count_less_equal(self, left, right, x):
+        """Count the values in range [left, right] that are at most x."""
+        if not 0 <= left <= right < self.n:
+            return 0
+        return sum(bisect_right(node, x) for node in self._nodes(left, right))
+
+    def kth_smallest(self, left, right, k):
+        """
+        Return the k-th smallest value in range [left, right] (k = 0 is the minimum).
+
+        Returns None for an invalid range or k.
+        """
+        if not 0 <= left <= right < self.n or not 0 <= k <= right - left:
+            return None
+
+        # Smallest value v of the whole array with more than k values <= v in range
+        values = self.tree[1]
+        low, high = 0, self.n - 1
+        while low < high:
+            mid = (low + high) // 2
+            if self.count_less_equal(left, right, values[mid]) > k:
+                high = mid
+            else:
+                low = mid + 1
+        return values[low]
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [5, 1, 4, 2, 8, 3, 7]
+    tree = MergeSortTree(arr)
+
+    print("Merge Sort Tree Operations:")
+    print(f"Array: {arr}")
+    print(f"Values < 5 in [0, 4]: {tree.count_less(0, 4, 5)}")  # 1, 4, 2 -> 3
+    print(f"Smallest in [2, 6]: {tree.kth_smallest(2, 6, 0)}")  # 2
+    print(f"3rd smallest in [2, 6]: {tree.kth_smallest(2, 6, 2)}")  # 4
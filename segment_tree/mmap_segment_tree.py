@@ -0,0 +1,183 @@
+"""
+Memory-Mapped Segment Tree Implementation
+
+A range sum segment tree whose node array lives in a memory-mapped file of
+fixed-width 8-byte cells, for arrays larger than RAM. It uses the same
+bottom-up 2n layout as IterativeSegmentTree (leaves at [n, 2n), node i has
+children 2i and 2i + 1), so a query or update touches O(log n) cells and
+therefore only O(log n) pages. The file is self-describing: reopening it maps
+it again without a rebuild.
+
+File layout: a 32-byte header (magic, typecode, n) followed by 2n cells.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+
+
+class MmapSegmentTree:
+    """File-backed segment tree for range sum queries."""
+
+    MAGIC = b'SEGTREE1'
+    HEADER = struct.Struct('<8sc7xq8x')
+    # Leaves are streamed to disk in chunks of this many values
+    CHUNK = 1 << 16
+
+    def __init__(self, path, readonly=False):
+        """Open an existing tree file created with MmapSegmentTree.create()."""
+        self.path = path
+        self.readonly = readonly
+        self._file = open(path, 'rb' if readonly else 'r+b')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, typecode, self.n = self.HEADER.unpack_from(self._mmap)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"{path!r} is not a segment tree file")
+        self.typecode = typecode.decode()
+        self.tree = memoryview(self._mmap)[self.HEADER.size:].cast(self.typecode)
+
+    @classmethod
+    def create(cls, path, values, n=None, typecode='q'):
+        """
+        Build a tree file at path from values and open it.
+
+        values may be any iterable, such as a generator reading from another
+        file; it is consumed once, in chunks. Pass n when values has no len().
+        """
+        if typecode not in ('q', 'd'):
+            raise ValueError("typecode must be 'q' or 'd'")
+        if n is None:
+            n = len(values)
+
+        tree = None
+        try:
+            with open(path, 'wb') as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, typecode.encode(), n))
+                # Reserve the internal nodes [0, n); they are filled in after the leaves
+                f.truncate(cls.HEADER.size + 8 * n)
+                f.seek(0, os.SEEK_END)
+
+                count = 0
+                chunk = array(typecode)
+                for value in values:
+                    chunk.append(value)
+                    if len(chunk) == cls.CHUNK:
+                        chunk.tofile(f)
+                        count += len(chunk)
+                        del chunk[:]
+                chunk.tofile(f)
+                count += len(chunk)
+
+            if count != n:
+                raise ValueError(f"Expected {n} values, got {count}")
+
+            tree = cls(path)
+            tree._build()
+        except Exception:
+            # A rejected value or an overflowing sum: leave no half-written file
+            if tree is not None:
+                tree.close()
+            os.remove(path)
+            raise
+        return tree
+
+    def _build(self):
+        """Fill the internal nodes from the leaves, walking the file backwards."""
+        tree = self.tree
+        for i in range(self.n - 1, 0, -1):
+            tree[i] = tree[2 * i] + tree[2 * i + 1]
+
+    def update(self, index, value):
+        """
+        Update value at index.
+
+        A value the typecode cannot hold raises TypeError or OverflowError
+        and leaves the file unchanged.
+        """
+        if self.readonly:
+            raise ValueError("Tree was opened read-only")
+        if not 0 <= index < self.n:
+            return
+
+        tree = self.tree
+        # Stage the new leaf-to-root path in a scratch array first, so a
+        # rejected value or an overflowing sum raises before any cell is written
+        i = index + self.n
+        path = [i]
+        staged = array(self.typecode, [value])
+        while i > 1:
+            staged.append(staged[-1] + tree[i ^ 1])
+            i >>= 1
+            path.append(i)
+
+        for i, value in zip(path, staged):
+            tree[i] = value
+
+    def query(self, left, right):
+        """Query sum in range [left, right]."""
+        if not 0 <= left <= right < self.n:
+            return 0
+
+        tree = self.tree
+        result = 0
+        left += self.n
+        right += self.n + 1
+        while left < right:
+            if left & 1:
+                result += tree[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                result += tree[right]
+            left >>= 1
+            right >>= 1
+        return result
+
+    def flush(self):
+        """Write dirty pages back to the file."""
+        if not self.readonly:
+            self._mmap.flush()
+
+    def close(self):
+        """Flush and unmap the file."""
+        if getattr(self, 'tree', None) is not None:
+            self.tree.release()
+            self.tree = None
+        if not self._mmap.closed:
+            self.flush()
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "counters.segtree")
+    arr = [1, 3, 5, 7, 9, 11]
+
+    print("Memory-Mapped Segment Tree Operations:")
+    print(f"Array: {arr}")
+    with MmapSegmentTree.create(path, iter(arr), n=len(arr)) as tree:
+        print(f"Sum of range [1, 3]: {tree.query(1, 3)}")  # 3 + 5 + 7 = 15
+        tree.update(2, 6)
+
+    print("\nReopening the file without a rebuild...")
+    with MmapSegmentTree(path, readonly=True) as tree:
+        print(f"Sum of range [1, 3]: {tree.query(1, 3)}")  # 3 + 6 + 7 = 16
+
+    os.remove(path)
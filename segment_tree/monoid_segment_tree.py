@@ -0,0 +1,165 @@
+"""
+Monoid Segment Tree Implementation
+
+A segment tree parameterized by an associative combine function and its
+identity element, so one class covers range sum, min, max, gcd, xor, and any
+other monoid. The common operators have built-in fast paths: the tree is built
+level by level with map() over C-implemented functions, and queries fold the
+O(log n) covering nodes with a C-level reducer, so no Python-level function is
+called per node. min and max are the exception when combining two values:
+calling the builtin costs more than a lambda, so the build and update compare
+inline instead.
+"""
+
+import math
+import operator
+from functools import partial, reduce
+
+
+# name -> (combine, identity, reducer over a non-empty list of node values)
+OPERATIONS = {
+    'sum': (operator.add, 0, sum),
+    'min': (min, float('inf'), min),
+    'max': (max, float('-inf'), max),
+    'gcd': (math.gcd, 0, partial(reduce, math.gcd)),
+    'xor': (operator.xor, 0, partial(reduce, operator.xor)),
+    'or': (operator.or_, 0, partial(reduce, operator.or_)),
+    'and': (operator.and_, -1, partial(reduce, operator.and_)),
+}
+
+# Passing the builtin function itself selects the same fast path as its name
+_OPERATION_NAMES = {combine: name for name, (combine, _, _) in OPERATIONS.items()}
+
+
+def resolve_operation(combine, identity=None):
+    """
+    Resolve combine and identity into (combine, identity, reducer).
+
+    combine may be an operation name, one of the built-in functions in
+    OPERATIONS, or a custom function, which then requires an identity.
+    """
+    if not callable(combine) or combine in _OPERATION_NAMES:
+        name = _OPERATION_NAMES.get(combine, combine)
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {combine!r}")
+        combine, default_identity, reducer = OPERATIONS[name]
+        if identity is None:
+            identity = default_identity
+        elif identity != default_identity:
+            # e.g. operator.add over strings: sum() would reject them
+            reducer = partial(reduce, combine)
+        return combine, identity, reducer
+
+    if identity is None:
+        raise ValueError("identity is required for a custom combine function")
+    return combine, identity, partial(reduce, combine)
+
+
+class MonoidSegmentTree:
+    """
+    Segment tree over an arbitrary monoid.
+
+    combine is either the name of a built-in operation ('sum', 'min', 'max',
+    'gcd', 'xor', 'or', 'and') or an associative function of two arguments.
+    Custom functions need an identity; it does not have to be commutative.
+    """
+
+    def __init__(self, arr, combine='sum', identity=None):
+        combine, identity, reducer = resolve_operation(combine, identity)
+        self.combine = combine
+        self.identity = identity
+        self._reducer = reducer
+
+        self.n = len(arr)
+        self.size = 1
+        while self.size < self.n:
+            self.size *= 2
+
+        # Leaves live at [size, size + n), padded with the identity
+        self.tree = [identity] * self.size
+        self.tree.extend(arr)
+        self.tree.extend([identity] * (self.size - self.n))
+        self._build()
+
+    def _build(self):
+        """Combine whole levels at once, from the leaves up, in O(n)."""
+        tree = self.tree
+        combine = self.combine
+        half = self.size >> 1
+        while half:
+            lefts = tree[2 * half:4 * half:2]
+            rights = tree[2 * half + 1:4 * half:2]
+            # Same results as the builtins, ties included
+            if combine is min:
+                tree[half:2 * half] = [b if b < a else a for a, b in zip(lefts, rights)]
+            elif combine is max:
+                tree[half:2 * half] = [b if b > a else a for a, b in zip(lefts, rights)]
+            else:
+                tree[half:2 * half] = map(combine, lefts, rights)
+            half >>= 1
+
+    def update(self, index, value):
+        """Update value at index."""
+        if not 0 <= index < self.n:
+            return
+
+        tree = self.tree
+        combine = self.combine
+        i = index + self.size
+        tree[i] = value
+        i >>= 1
+        if combine is min:
+            while i:
+                a = tree[2 * i]
+                b = tree[2 * i + 1]
+                tree[i] = b if b < a else a
+                i >>= 1
+        elif combine is max:
+            while i:
+                a = tree[2 * i]
+                b = tree[2 * i + 1]
+                tree[i] = b if b > a else a
+                i >>= 1
+        else:
+            while i:
+                tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+                i >>= 1
+
+    def query(self, left, right):
+        """Combine the values in range [left, right], in order."""
+        if not 0 <= left <= right < self.n:
+            return self.identity
+
+        tree = self.tree
+        left_nodes = []
+        right_nodes = []
+        left += self.size
+        right += self.size + 1
+        while left < right:
+            if left & 1:
+                left_nodes.append(tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                right_nodes.append(tree[right])
+            left >>= 1
+            right >>= 1
+
+        right_nodes.reverse()
+        return self._reducer(left_nodes + right_nodes)
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [12, 18, 7, 3, 24, 9]
+    print(f"Array: {arr}")
+
+    for name in ('sum', 'min', 'max', 'gcd', 'xor'):
+        seg_tree = MonoidSegmentTree(arr, name)
+        print(f"{name} of range [0, 2]: {seg_tree.query(0, 2)}")
+
+    # A custom, non-commutative monoid: string concatenation
+    words = MonoidSegmentTree(["seg", "ment", " ", "tree"], operator.add, "")
+    print(f"\nConcatenation of range [0, 3]: {words.query(0, 3)!r}")  # 'segment tree'
+    words.update(2, "-")
+    print(f"After updating index 2: {words.query(0, 3)!r}")  # 'segment-tree'
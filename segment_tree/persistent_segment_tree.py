@@ -0,0 +1,116 @@
+"""
+Persistent Segment Tree Implementation
+
+A range sum segment tree that keeps every version. Nodes are immutable
+(sum, left, right) tuples, so an update copies only the O(log n) nodes on the
+path to the changed leaf and shares everything else with the previous
+version. Each update returns a new version handle; any version can be queried
+in O(log n), and releasing a version lets the nodes only it references be
+reclaimed.
+"""
+
+class PersistentSegmentTree:
+    """Persistent segment tree for range sum queries over versions."""
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        root = self._build(arr, 0, self.n - 1) if self.n > 0 else None
+        # version handle -> root node
+        self._roots = {0: root}
+        self._next_version = 1
+        self.latest = 0
+
+    def _build(self, arr, start, end):
+        """Build the initial version."""
+        if start == end:
+            return (arr[start], None, None)
+
+        mid = (start + end) // 2
+        left = self._build(arr, start, mid)
+        right = self._build(arr, mid + 1, end)
+        return (left[0] + right[0], left, right)
+
+    def versions(self):
+        """Return the live version handles in creation order."""
+        return sorted(self._roots)
+
+    def update(self, version, index, value):
+        """
+        Set index to value on top of version and return the new version.
+
+        The given version is left untouched. Raises KeyError for a released
+        or unknown version.
+        """
+        root = self._roots[version]
+        if 0 <= index < self.n:
+            root = self._update(root, 0, self.n - 1, index, value)
+
+        new_version = self._next_version
+        self._next_version += 1
+        self._roots[new_version] = root
+        self.latest = new_version
+        return new_version
+
+    def _update(self, node, start, end, index, value):
+        """Copy the path to index and return the new subtree root."""
+        if start == end:
+            return (value, None, None)
+
+        _, left, right = node
+        mid = (start + end) // 2
+        if index <= mid:
+            left = self._update(left, start, mid, index, value)
+        else:
+            right = self._update(right, mid + 1, end, index, value)
+        return (left[0] + right[0], left, right)
+
+    def query(self, version, left, right):
+        """Query sum in range [left, right] as of version."""
+        root = self._roots[version]
+        if 0 <= left <= right < self.n:
+            return self._query(root, 0, self.n - 1, left, right)
+        return 0
+
+    def _query(self, node, start, end, left, right):
+        """Helper method for range query."""
+        # No overlap
+        if right < start or left > end:
+            return 0
+
+        # Complete overlap
+        if left <= start and end <= right:
+            return node[0]
+
+        # Partial overlap
+        mid = (start + end) // 2
+        return (self._query(node[1], start, mid, left, right) +
+                self._query(node[2], mid + 1, end, left, right))
+
+    def release(self, version):
+        """
+        Forget a version.
+
+        Nodes shared with other live versions stay alive; nodes referenced
+        only by this version are freed. Raises KeyError for an unknown version.
+        """
+        del self._roots[version]
+        if version == self.latest:
+            self.latest = max(self._roots) if self._roots else None
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+    tree = PersistentSegmentTree(arr)
+
+    print("Persistent Segment Tree Operations:")
+    print(f"Array: {arr}")
+    v1 = tree.update(0, 2, 6)
+    v2 = tree.update(v1, 0, 10)
+
+    print(f"Sum of [0, 5] at version 0: {tree.query(0, 0, 5)}")  # 36
+    print(f"Sum of [0, 5] at version {v1}: {tree.query(v1, 0, 5)}")  # 37
+    print(f"Sum of [0, 5] at version {v2}: {tree.query(v2, 0, 5)}")  # 46
+
+    tree.release(v1)
+    print(f"Live versions after releasing {v1}: {tree.versions()}")  # [0, 2]
@@ -6,11 +6,20 @@ It allows efficient range queries (like sum, min, max) and updates.
 """
 
 class SegmentTree:
-    """Segment Tree implementation for range sum queries."""
+    """
+    Segment Tree implementation for range sum queries.
+
+    Supports point updates as well as range add / range assign updates, which
+    are applied lazily so that every operation costs O(log n).
+    """
     
     def __init__(self, arr):
         self.n = len(arr)
         self.tree = [0] * (4 * self.n)
+        # Pending lazy tags: an assignment (None when absent) applied before
+        # an addition that is still owed to the node's children.
+        self.lazy_assign = [None] * (4 * self.n)
+        self.lazy_add = [0] * (4 * self.n)
         if self.n > 0:
             self._build(arr, 0, 0, self.n - 1)
     
@@ -30,6 +39,38 @@ class SegmentTree:
             # Internal node stores sum of children
             self.tree[node] = self.tree[left_child] + self.tree[right_child]
     
+    def _apply_assign(self, node, start, end, value):
+        """Assign value to every element covered by node."""
+        self.tree[node] = value * (end - start + 1)
+        self.lazy_assign[node] = value
+        self.lazy_add[node] = 0
+    
+    def _apply_add(self, node, start, end, delta):
+        """Add delta to every element covered by node."""
+        self.tree[node] += delta * (end - start + 1)
+        if self.lazy_assign[node] is not None:
+            self.lazy_assign[node] += delta
+        else:
+            self.lazy_add[node] += delta
+    
+    def _push(self, node, start, end):
+        """Push pending lazy tags of node down to its children."""
+        mid = (start + end) // 2
+        left_child = 2 * node + 1
+        right_child = 2 * node + 2
+        
+        if self.lazy_assign[node] is not None:
+            value = self.lazy_assign[node]
+            self._apply_assign(left_child, start, mid, value)
+            self._apply_assign(right_child, mid + 1, end, value)
+            self.lazy_assign[node] = None
+        
+        if self.lazy_add[node]:
+            delta = self.lazy_add[node]
+            self._apply_add(left_child, start, mid, delta)
+            self._apply_add(right_child, mid + 1, end, delta)
+            self.lazy_add[node] = 0
+    
     def update(self, index, value):
         """Update value at index."""
         if 0 <= index < self.n:
@@ -41,6 +82,7 @@ class SegmentTree:
             # Leaf node
             self.tree[node] = value
         else:
+            self._push(node, start, end)
             mid = (start + end) // 2
             left_child = 2 * node + 1
             right_child = 2 * node + 2
@@ -53,6 +95,40 @@ class SegmentTree:
             # Update internal node
             self.tree[node] = self.tree[left_child] + self.tree[right_child]
     
+    def range_add(self, left, right, delta):
+        """Add delta to every element in range [left, right]."""
+        if 0 <= left <= right < self.n:
+            self._range_update(0, 0, self.n - 1, left, right,
+                               self._apply_add, delta)
+    
+    def range_assign(self, left, right, value):
+        """Set every element in range [left, right] to value."""
+        if 0 <= left <= right < self.n:
+            self._range_update(0, 0, self.n - 1, left, right,
+                               self._apply_assign, value)
+    
+    def _range_update(self, node, start, end, left, right, apply, arg):
+        """Helper method for lazy range updates."""
+        # No overlap
+        if right < start or left > end:
+            return
+        
+        # Complete overlap: tag the node instead of descending
+        if left <= start and end <= right:
+            apply(node, start, end, arg)
+            return
+        
+        # Partial overlap
+        self._push(node, start, end)
+        mid = (start + end) // 2
+        left_child = 2 * node + 1
+        right_child = 2 * node + 2
+        
+        self._range_update(left_child, start, mid, left, right, apply, arg)
+        self._range_update(right_child, mid + 1, end, left, right, apply, arg)
+        
+        self.tree[node] = self.tree[left_child] + self.tree[right_child]
+    
     def query(self, left, right):
         """Query sum in range [left, right]."""
         if 0 <= left <= right < self.n:
@@ -70,6 +146,7 @@ class SegmentTree:
             return self.tree[node]
         
         # Partial overlap
+        self._push(node, start, end)
         mid = (start + end) // 2
         left_child = 2 * node + 1
         right_child = 2 * node + 2
@@ -78,6 +155,62 @@ class SegmentTree:
         right_sum = self._query(right_child, mid + 1, end, left, right)
         
         return left_sum + right_sum
+    
+    def find_first(self, left, predicate):
+        """
+        Find the smallest index i >= left with predicate(sum of [left, i]) true.
+        
+        predicate must be monotone: once true for some i it stays true for
+        every larger i. Descends the tree once, in O(log n). Returns -1 when
+        no such index exists.
+        """
+        if not 0 <= left < self.n:
+            return -1
+        index, _ = self._find_first(0, 0, self.n - 1, left, 0, predicate)
+        return index
+    
+    def _find_first(self, node, start, end, left, acc, predicate):
+        """Helper for find_first; returns (index or -1, sum accumulated so far)."""
+        # Entirely before left
+        if end < left:
+            return -1, acc
+        
+        # Entirely inside: skip the node unless the answer lies within it
+        if left <= start:
+            combined = acc + self.tree[node]
+            if not predicate(combined):
+                return -1, combined
+            if start == end:
+                return start, combined
+        
+        self._push(node, start, end)
+        mid = (start + end) // 2
+        index, acc = self._find_first(2 * node + 1, start, mid, left, acc, predicate)
+        if index != -1:
+            return index, acc
+        return self._find_first(2 * node + 2, mid + 1, end, left, acc, predicate)
+    
+    def prefix_lower_bound(self, k):
+        """
+        Find the smallest index whose prefix sum is at least k, in O(log n).
+        
+        Requires all values to be non-negative. Returns n when the total sum
+        is smaller than k.
+        """
+        if self.n == 0 or self.tree[0] < k:
+            return self.n
+        
+        node, start, end = 0, 0, self.n - 1
+        while start != end:
+            self._push(node, start, end)
+            mid = (start + end) // 2
+            left_child = 2 * node + 1
+            if self.tree[left_child] >= k:
+                node, end = left_child, mid
+            else:
+                k -= self.tree[left_child]
+                node, start = left_child + 1, mid + 1
+        return start
 
 
 class SegmentTreeMin:
@@ -146,6 +279,91 @@ class SegmentTreeMin:
                 self._update(right_child, mid + 1, end, index, value)
             
             self.tree[node] = min(self.tree[left_child], self.tree[right_child])
+    
+    def argmin(self, left, right):
+        """
+        Index of the minimum in range [left, right], in O(log n).
+        
+        Ties resolve to the leftmost index. Returns -1 for an invalid range.
+        """
+        if 0 <= left <= right < self.n:
+            return self._argmin(0, 0, self.n - 1, left, right)[1]
+        return -1
+    
+    def _argmin(self, node, start, end, left, right):
+        """Helper for argmin; returns (minimum, index) or (inf, -1)."""
+        if right < start or left > end:
+            return float('inf'), -1
+        
+        # Complete overlap: follow the minimum down to its leaf
+        if left <= start and end <= right:
+            target = self.tree[node]
+            while start != end:
+                mid = (start + end) // 2
+                if self.tree[2 * node + 1] == target:
+                    node, end = 2 * node + 1, mid
+                else:
+                    node, start = 2 * node + 2, mid + 1
+            return target, start
+        
+        mid = (start + end) // 2
+        left_min = self._argmin(2 * node + 1, start, mid, left, right)
+        right_min = self._argmin(2 * node + 2, mid + 1, end, left, right)
+        
+        return left_min if left_min[0] <= right_min[0] else right_min
+    
+    def find_first(self, left, predicate):
+        """
+        Find the smallest index i >= left with predicate(min of [left, i]) true.
+        
+        predicate must be monotone, e.g. lambda m: m < threshold. Descends
+        the tree once, in O(log n). Returns -1 when no such index exists.
+        """
+        if not 0 <= left < self.n:
+            return -1
+        index, _ = self._find_first(0, 0, self.n - 1, left, float('inf'), predicate)
+        return index
+    
+    def _find_first(self, node, start, end, left, acc, predicate):
+        """Helper for find_first; returns (index or -1, minimum so far)."""
+        if end < left:
+            return -1, acc
+        
+        if left <= start:
+            combined = min(acc, self.tree[node])
+            if not predicate(combined):
+                return -1, combined
+            if start == end:
+                return start, combined
+        
+        mid = (start + end) // 2
+        index, acc = self._find_first(2 * node + 1, start, mid, left, acc, predicate)
+        if index != -1:
+            return index, acc
+        return self._find_first(2 * node + 2, mid + 1, end, left, acc, predicate)
+    
+    def freeze(self):
+        """
+        Snapshot the current values into a SparseTable.
+        
+        Use it once an array stops changing: the table answers each query in
+        O(1) instead of O(log n), but it cannot be updated.
+        """
+        from sparse_table import SparseTable
+        
+        leaves = []
+        if self.n > 0:
+            self._collect_leaves(0, 0, self.n - 1, leaves)
+        return SparseTable(leaves, 'min')
+    
+    def _collect_leaves(self, node, start, end, leaves):
+        """Append the leaf values under node to leaves, left to right."""
+        if start == end:
+            leaves.append(self.tree[node])
+        else:
+            mid = (start + end) // 2
+            self._collect_leaves(2 * node + 1, start, mid, leaves)
+            self._collect_leaves(2 * node + 2, mid + 1, end, leaves)
 
 
 # Example usage
@@ -163,6 +381,15 @@ if __name__ == "__main__":
     seg_tree.update(2, 6)
     print(f"Sum of range [1, 3]: {seg_tree.query(1, 3)}")  # 3 + 6 + 7 = 16
     
+    print("\nAdding 2 to range [0, 2]...")
+    seg_tree.range_add(0, 2, 2)
+    print(f"Sum of range [0, 5]: {seg_tree.query(0, 5)}")  # 3 + 5 + 8 + 7 + 9 + 11 = 43
+    
+    print("\nAssigning 1 to range [3, 5]...")
+    seg_tree.range_assign(3, 5, 1)
+    print(f"Sum of range [0, 5]: {seg_tree.query(0, 5)}")  # 3 + 5 + 8 + 1 + 1 + 1 = 19
+    print(f"First index with prefix sum >= 10: {seg_tree.prefix_lower_bound(10)}")  # 2
+    
     # Range Min Segment Tree
     print("\n\nSegment Tree (Range Min) Operations:")
     arr2 = [4, 2, 6, 1, 8, 5]
@@ -171,7 +398,12 @@ if __name__ == "__main__":
     print(f"Array: {arr2}")
     print(f"Min of range [0, 2]: {seg_tree_min.query(0, 2)}")  # min(4, 2, 6) = 2
     print(f"Min of range [2, 5]: {seg_tree_min.query(2, 5)}")  # min(6, 1, 8, 5) = 1
+    print(f"Index of min in [2, 5]: {seg_tree_min.argmin(2, 5)}")  # 3
     
     print("\nUpdating index 3 to 9...")
     seg_tree_min.update(3, 9)
     print(f"Min of range [2, 5]: {seg_tree_min.query(2, 5)}")  # min(6, 9, 8, 5) = 5
+    
+    print("\nFreezing into a sparse table...")
+    frozen = seg_tree_min.freeze()
+    print(f"Min of range [2, 5]: {frozen.query(2, 5)}")  # 5
@@ -0,0 +1,210 @@
+"""
+Shared-Memory Segment Tree Implementation
+
+A range sum segment tree whose node array lives in a
+multiprocessing.shared_memory block, so one tree can serve a whole pool of
+worker processes: any process attaches by name and queries without copying.
+The layout is the bottom-up 2n array of IterativeSegmentTree behind a small
+header.
+
+Concurrency follows the seqlock pattern. There is a single writer, which
+bumps a sequence counter to an odd value before touching any node and back to
+an even value afterwards. Readers never lock: they read the counter, run the
+query, and retry if the counter was odd or changed in the meantime.
+
+Header layout (8-byte cells): sequence counter, n, typecode ('q' = 0, 'd' = 1),
+and the creator's resource tracker id.
+"""
+
+import os
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+
+_HEADER_CELLS = 4
+_HEADER_SIZE = 8 * _HEADER_CELLS
+_TYPECODES = ('q', 'd')
+
+
+def _tracker_id():
+    """
+    Identify this process's resource tracker by the inode of its pipe.
+
+    Processes started through multiprocessing inherit the tracker of their
+    parent and report the same id. Shared memory is only tracked on POSIX.
+    """
+    if os.name != 'posix':
+        return 0
+    return os.fstat(resource_tracker.getfd()).st_ino
+
+
+class SharedSegmentTree:
+    """Range sum segment tree in shared memory with lock-free readers."""
+
+    def __init__(self, name):
+        """Attach to a tree created by SharedSegmentTree.create() in any process."""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+            self._attach(shm, owner=False)
+            return
+
+        shm = shared_memory.SharedMemory(name=name)
+        self._attach(shm, owner=False)
+        # Only the creating process owns the block. A process with its own
+        # resource tracker must drop the registration made by attaching, or
+        # the tracker unlinks the block when this process exits. A process
+        # sharing the creator's tracker must not, as that would remove the
+        # creator's registration.
+        if self._header[3] != _tracker_id():
+            resource_tracker.unregister('/' + shm.name, 'shared_memory')
+
+    @classmethod
+    def create(cls, arr, name=None, typecode='q'):
+        """
+        Allocate a shared block, build the tree from arr, and return the writer.
+
+        The creating process owns the block and should call unlink() once
+        every worker is done with it. If arr holds a value the typecode
+        cannot hold, the block is freed and the error re-raised.
+        """
+        if typecode not in _TYPECODES:
+            raise ValueError("typecode must be 'q' or 'd'")
+
+        n = len(arr)
+        shm = shared_memory.SharedMemory(name=name, create=True,
+                                         size=_HEADER_SIZE + 16 * n)
+        tree = cls.__new__(cls)
+        header = shm.buf[:_HEADER_SIZE].cast('q')
+        header[1] = n
+        header[2] = _TYPECODES.index(typecode)
+        header[3] = _tracker_id()
+        header.release()
+        tree._attach(shm, owner=True)
+
+        nodes = tree.tree
+        try:
+            for i, value in enumerate(arr):
+                nodes[n + i] = value
+            for i in range(n - 1, 0, -1):
+                nodes[i] = nodes[2 * i] + nodes[2 * i + 1]
+        except Exception:
+            # A value the typecode cannot hold or an overflowing sum: free
+            # the block rather than leave it allocated until exit
+            tree.unlink()
+            raise
+        return tree
+
+    def _attach(self, shm, owner):
+        """Map the header and node array of shm."""
+        self._shm = shm
+        self.owner = owner
+        self.name = shm.name
+        self._header = shm.buf[:_HEADER_SIZE].cast('q')
+        self.n = self._header[1]
+        self.typecode = _TYPECODES[self._header[2]]
+        self.tree = shm.buf[_HEADER_SIZE:_HEADER_SIZE + 16 * self.n].cast(self.typecode)
+
+    @property
+    def sequence(self):
+        """Current seqlock counter; odd while a write is in progress."""
+        return self._header[0]
+
+    def update(self, index, value):
+        """
+        Update value at index.
+
+        Only one process may write at a time; readers are never blocked.
+        A value the typecode cannot hold raises TypeError or OverflowError
+        and leaves the tree unchanged.
+        """
+        if not 0 <= index < self.n:
+            return
+
+        tree = self.tree
+        # Stage the new leaf-to-root path in a scratch array first: a value
+        # the typecode cannot hold (a float in a 'q' tree, an overflowing
+        # sum) raises here, before any shared cell or the counter changes
+        i = index + self.n
+        path = [i]
+        staged = array(self.typecode, [value])
+        while i > 1:
+            staged.append(staged[-1] + tree[i ^ 1])
+            i >>= 1
+            path.append(i)
+
+        header = self._header
+        header[0] += 1  # odd: write in progress
+        try:
+            for i, value in zip(path, staged):
+                tree[i] = value
+        finally:
+            header[0] += 1  # even: tree is consistent again
+
+    def query(self, left, right):
+        """Query sum in range [left, right], retrying if a write overlapped."""
+        if not 0 <= left <= right < self.n:
+            return 0
+
+        header = self._header
+        tree = self.tree
+        n = self.n
+        while True:
+            start = header[0]
+            if start & 1:
+                continue
+
+            result = 0
+            lo = left + n
+            hi = right + n + 1
+            while lo < hi:
+                if lo & 1:
+                    result += tree[lo]
+                    lo += 1
+                if hi & 1:
+                    hi -= 1
+                    result += tree[hi]
+                lo >>= 1
+                hi >>= 1
+
+            if header[0] == start:
+                return result
+
+    def close(self):
+        """Detach this process from the shared block."""
+        if self.tree is not None:
+            self.tree.release()
+            self._header.release()
+            self.tree = None
+            self._shm.close()
+
+    def unlink(self):
+        """Free the shared block; only the creating process should call this."""
+        self.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+
+    print("Shared-Memory Segment Tree Operations:")
+    print(f"Array: {arr}")
+    with SharedSegmentTree.create(arr) as writer:
+        # A worker process would attach with the same name
+        with SharedSegmentTree(writer.name) as reader:
+            print(f"Sum of range [1, 3] (reader): {reader.query(1, 3)}")  # 15
+
+            print("\nWriter updates index 2 to 6...")
+            writer.update(2, 6)
+            print(f"Sum of range [1, 3] (reader): {reader.query(1, 3)}")  # 16
@@ -0,0 +1,99 @@
+"""
+Sliding Window Segment Tree Implementation
+
+A fixed-capacity circular buffer of the last N samples of a stream, backed by
+a MonoidSegmentTree. push() overwrites the oldest slot in O(log N), so the
+window moves without rebuilding anything, and rolling sum / min / max (or any
+other monoid) over any part of the window is an O(log N) query. Queries are
+addressed by offset within the window: 0 is the oldest retained sample and
+len(window) - 1 the newest.
+"""
+
+from monoid_segment_tree import MonoidSegmentTree, OPERATIONS, resolve_operation
+
+
+class SlidingWindowSegmentTree:
+    """Rolling aggregates over the last capacity samples of a stream."""
+
+    def __init__(self, capacity, combine='sum', identity=None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        combine, identity, reducer = resolve_operation(combine, identity)
+        self._tree = MonoidSegmentTree([identity] * capacity, combine, identity)
+        # The built-in operations (with their default identity) are
+        # commutative, so the root holds the whole window wherever it starts
+        self._commutative = any(reducer is r for _, _, r in OPERATIONS.values())
+        # Physical slot that the next push() writes to
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        """Number of samples currently in the window."""
+        return self._count
+
+    def push(self, value):
+        """
+        Append a sample, evicting the oldest one once the window is full.
+
+        Returns the evicted sample, or None while the window is filling up.
+        """
+        tree = self._tree
+        slot = self._head
+        evicted = None
+        if self._count == self.capacity:
+            evicted = tree.tree[tree.size + slot]
+        else:
+            self._count += 1
+
+        tree.update(slot, value)
+        self._head = slot + 1 if slot + 1 < self.capacity else 0
+        return evicted
+
+    def query(self, left=0, right=None):
+        """
+        Combine the samples at window offsets [left, right], oldest first.
+
+        right defaults to the newest sample. Returns the identity for an
+        invalid range.
+        """
+        if right is None:
+            right = self._count - 1
+        if not 0 <= left <= right < self._count:
+            return self._tree.identity
+
+        tree = self._tree
+        if self._commutative and left == 0 and right == self._count - 1:
+            return tree.tree[1]
+
+        oldest = self._head - self._count
+        start = (oldest + left) % self.capacity
+        end = (oldest + right) % self.capacity
+        if start <= end:
+            return tree.query(start, end)
+
+        # The range wraps around the end of the circular buffer
+        return tree.combine(tree.query(start, self.capacity - 1), tree.query(0, end))
+
+    def last(self, k):
+        """Combine the newest k samples (fewer if the window holds less)."""
+        k = min(k, self._count)
+        if k <= 0:
+            return self._tree.identity
+        return self.query(self._count - k, self._count - 1)
+
+
+# Example usage
+if __name__ == "__main__":
+    window = SlidingWindowSegmentTree(4, 'max')
+    samples = [5, 1, 7, 3, 2, 4]
+
+    print("Sliding Window Segment Tree (Rolling Max) Operations:")
+    for sample in samples:
+        window.push(sample)
+        print(f"push({sample}) -> max of window: {window.query()}")
+
+    # Window now holds [7, 3, 2, 4]
+    print(f"\nMax of the newest 2 samples: {window.last(2)}")  # 4
+    print(f"Max of offsets [1, 2]: {window.query(1, 2)}")  # 3
@@ -0,0 +1,95 @@
+"""
+Sparse Table Implementation
+
+A sparse table answers range minimum (or maximum) queries on a static array
+in O(1). Level k stores the answer for every window of length 2^k, so any
+range [left, right] is covered by two overlapping windows of the largest
+power of two that fits. Building takes O(n log n) time and memory; each level
+is produced with map() over the previous one, so the build runs at C speed.
+"""
+
+class SparseTable:
+    """Static range minimum / maximum queries in O(1)."""
+
+    def __init__(self, arr, op='min'):
+        if op not in ('min', 'max'):
+            raise ValueError(f"Unknown operation: {op!r}")
+
+        self.n = len(arr)
+        self.op = op
+        self.values = list(arr)
+        self.table = [self.values]
+        # Index tables for argquery(), built on first use
+        self._index_table = None
+
+        combine = min if op == 'min' else max
+        length = 1
+        while 2 * length <= self.n:
+            prev = self.table[-1]
+            # map() stops at the shorter input: n - 2 * length + 1 windows
+            self.table.append(list(map(combine, prev, prev[length:])))
+            length *= 2
+
+    def query(self, left, right):
+        """Query minimum (or maximum) in range [left, right]."""
+        if not 0 <= left <= right < self.n:
+            return float('inf') if self.op == 'min' else float('-inf')
+
+        k = (right - left + 1).bit_length() - 1
+        row = self.table[k]
+        a = row[left]
+        b = row[right - (1 << k) + 1]
+        if self.op == 'min':
+            return a if a <= b else b
+        return a if a >= b else b
+
+    def argquery(self, left, right):
+        """
+        Index of the minimum (or maximum) in range [left, right].
+
+        Ties resolve to the leftmost index. Returns -1 for an invalid range.
+        """
+        if not 0 <= left <= right < self.n:
+            return -1
+        if self._index_table is None:
+            self._build_index_table()
+
+        k = (right - left + 1).bit_length() - 1
+        row = self._index_table[k]
+        a = row[left]
+        b = row[right - (1 << k) + 1]
+        values = self.values
+        if self.op == 'min':
+            return a if values[a] <= values[b] else b
+        return a if values[a] >= values[b] else b
+
+    def _build_index_table(self):
+        """Build the per-level argmin / argmax indices."""
+        values = self.values
+        index_table = [list(range(self.n))]
+        length = 1
+        while 2 * length <= self.n:
+            prev = index_table[-1]
+            if self.op == 'min':
+                row = [a if values[a] <= values[b] else b
+                       for a, b in zip(prev, prev[length:])]
+            else:
+                row = [a if values[a] >= values[b] else b
+                       for a, b in zip(prev, prev[length:])]
+            index_table.append(row)
+            length *= 2
+        self._index_table = index_table
+
+
+# Example usage
+if __name__ == "__main__":
+    arr = [4, 2, 6, 1, 8, 5]
+    sparse_min = SparseTable(arr)
+    sparse_max = SparseTable(arr, 'max')
+
+    print("Sparse Table Operations:")
+    print(f"Array: {arr}")
+    print(f"Min of range [0, 2]: {sparse_min.query(0, 2)}")  # min(4, 2, 6) = 2
+    print(f"Min of range [2, 5]: {sparse_min.query(2, 5)}")  # min(6, 1, 8, 5) = 1
+    print(f"Index of min in [2, 5]: {sparse_min.argquery(2, 5)}")  # 3
+    print(f"Max of range [0, 3]: {sparse_max.query(0, 3)}")  # max(4, 2, 6, 1) = 6
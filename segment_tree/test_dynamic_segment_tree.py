@@ -0,0 +1,133 @@
+"""
+Tests for Dynamic Segment Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dynamic_segment_tree import DynamicSegmentTree
+
+
+def test_update_and_query():
+    tree = DynamicSegmentTree(0, 100)
+
+    tree.update(3, 5)
+    tree.update(50, 7)
+    tree.update(100, 1)
+
+    assert tree.query(0, 100) == 13
+    assert tree.query(4, 99) == 7
+    assert tree.query(3, 3) == 5
+    assert tree.query(51, 99) == 0
+
+    tree.update(50, 2)
+    assert tree.query(0, 100) == 8
+
+
+def test_add():
+    tree = DynamicSegmentTree(0, 100)
+
+    tree.add(10, 4)
+    tree.add(10, 6)
+    tree.add(20, -3)
+    assert tree.query(10, 10) == 10
+    assert tree.query(0, 100) == 7
+
+
+def test_huge_range():
+    tree = DynamicSegmentTree()
+    top = 2 ** 63 - 1
+
+    tree.update(0, 1)
+    tree.update(top, 2)
+    tree.update(1 << 40, 3)
+
+    assert tree.query(0, top) == 6
+    assert tree.query(1, top - 1) == 3
+    assert tree.query(top, top) == 2
+
+    # Memory scales with the number of updates, not the key range
+    assert len(tree) <= 3 * 64
+
+
+def test_negative_low_and_out_of_range():
+    tree = DynamicSegmentTree(-50, 50)
+
+    tree.update(-50, 4)
+    tree.update(51, 100)  # ignored
+    assert tree.query(-1000, 1000) == 4
+    assert tree.query(10, 5) == 0
+
+    try:
+        DynamicSegmentTree(5, 4)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_float_values():
+    tree = DynamicSegmentTree(0, 10, typecode='d')
+
+    tree.update(1, 0.5)
+    tree.add(2, 1.25)
+    assert tree.query(0, 10) == 1.75
+
+
+def test_matches_naive():
+    random.seed(7)
+    low, high = -(10 ** 12), 10 ** 12
+    keys = [random.randint(low, high) for _ in range(30)]
+    tree = DynamicSegmentTree(low, high)
+    values = {}
+
+    for _ in range(300):
+        key = random.choice(keys)
+        if random.random() < 0.5:
+            value = random.randint(-100, 100)
+            tree.update(key, value)
+            values[key] = value
+        else:
+            delta = random.randint(-100, 100)
+            tree.add(key, delta)
+            values[key] = values.get(key, 0) + delta
+
+        left = random.choice(keys)
+        right = random.choice(keys)
+        expected = sum(v for k, v in values.items() if left <= k <= right)
+        assert tree.query(left, right) == expected
+
+
+
+def test_rejected_values_leave_tree_unchanged():
+    tree = DynamicSegmentTree(0, 7)
+    tree.update(1, 2 ** 63 - 1)
+    for operation, value in ((tree.update, 1), (tree.add, 1), (tree.update, 0.5)):
+        try:
+            operation(0, value)
+            assert False, "expected the write to be rejected"
+        except (OverflowError, TypeError):
+            pass
+    assert tree.query(0, 0) == 0
+    assert tree.query(0, 1) == 2 ** 63 - 1
+    assert tree.query(0, 7) == 2 ** 63 - 1
+
+    try:
+        tree.add(1, 1)
+        assert False, "expected OverflowError"
+    except OverflowError:
+        pass
+    assert tree.query(1, 1) == 2 ** 63 - 1
+    assert tree.query(0, 7) == 2 ** 63 - 1
+
+
+if __name__ == "__main__":
+    test_update_and_query()
+    test_add()
+    test_huge_range()
+    test_negative_low_and_out_of_range()
+    test_float_values()
+    test_matches_naive()
+    test_rejected_values_leave_tree_unchanged()
+    print("All Dynamic Segment Tree tests passed!")
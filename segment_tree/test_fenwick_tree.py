@@ -0,0 +1,78 @@
+"""
+Tests for Fenwick Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fenwick_tree import FenwickTree
+from segment_tree import SegmentTree
+
+
+def test_prefix_and_range_sum():
+    arr = [1, 3, 5, 7, 9, 11]
+    fenwick = FenwickTree(arr)
+
+    assert fenwick.prefix_sum(0) == 1
+    assert fenwick.prefix_sum(3) == 16
+    assert fenwick.prefix_sum(5) == 36
+    assert fenwick.prefix_sum(-1) == 0
+    assert fenwick.range_sum(1, 3) == 15
+    assert fenwick.range_sum(2, 4) == 21
+    assert fenwick.range_sum(3, 1) == 0
+
+
+def test_add():
+    fenwick = FenwickTree([1, 3, 5, 7, 9, 11])
+
+    fenwick.add(2, 10)
+    assert fenwick.range_sum(2, 2) == 15
+    assert fenwick.prefix_sum(5) == 46
+
+
+def test_lower_bound():
+    fenwick = FenwickTree([1, 3, 5, 7, 9, 11])  # prefix sums 1 4 9 16 25 36
+
+    assert fenwick.lower_bound(0) == 0
+    assert fenwick.lower_bound(1) == 0
+    assert fenwick.lower_bound(2) == 1
+    assert fenwick.lower_bound(9) == 2
+    assert fenwick.lower_bound(10) == 3
+    assert fenwick.lower_bound(36) == 5
+    assert fenwick.lower_bound(37) == 6  # past the end
+
+
+def test_compatible_with_segment_tree():
+    random.seed(5)
+    arr = [random.randint(0, 100) for _ in range(50)]
+    fenwick = FenwickTree(arr)
+    seg_tree = SegmentTree(arr)
+
+    for _ in range(200):
+        index = random.randrange(len(arr))
+        value = random.randint(0, 100)
+        fenwick.update(index, value)
+        seg_tree.update(index, value)
+
+        left = random.randrange(len(arr))
+        right = random.randrange(len(arr))
+        assert fenwick.query(left, right) == seg_tree.query(left, right)
+
+
+def test_empty_array():
+    fenwick = FenwickTree([])
+
+    assert fenwick.query(0, 0) == 0
+    assert fenwick.prefix_sum(0) == 0
+    assert fenwick.lower_bound(1) == 0
+
+
+if __name__ == "__main__":
+    test_prefix_and_range_sum()
+    test_add()
+    test_lower_bound()
+    test_compatible_with_segment_tree()
+    test_empty_array()
+    print("All Fenwick Tree tests passed!")
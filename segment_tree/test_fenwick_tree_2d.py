@@ -0,0 +1,103 @@
+"""
+Tests for 2D Fenwick Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fenwick_tree_2d import FenwickTree2D
+
+
+def _naive_rect_sum(grid, x1, y1, x2, y2):
+    return sum(grid[x][y] for x in range(x1, x2 + 1) for y in range(y1, y2 + 1))
+
+
+def test_rect_sum():
+    grid = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9],
+    ]
+    fenwick = FenwickTree2D(3, 3, grid)
+
+    assert fenwick.rect_sum(0, 0, 2, 2) == 45
+    assert fenwick.rect_sum(0, 0, 1, 1) == 12
+    assert fenwick.rect_sum(1, 1, 2, 2) == 28
+    assert fenwick.rect_sum(2, 0, 2, 2) == 24
+    assert fenwick.rect_sum(2, 2, 1, 1) == 0
+    assert fenwick.prefix_sum(1, 2) == 21
+
+
+def test_update():
+    fenwick = FenwickTree2D(4, 5)
+
+    fenwick.update(1, 2, 3)
+    fenwick.update(3, 4, 7)
+    fenwick.update(1, 2, -1)
+    fenwick.update(4, 0, 100)  # out of range, ignored
+
+    assert fenwick.rect_sum(0, 0, 3, 4) == 9
+    assert fenwick.rect_sum(1, 2, 1, 2) == 2
+    assert fenwick.rect_sum(2, 0, 3, 3) == 0
+
+
+def test_non_square_and_float():
+    fenwick = FenwickTree2D(2, 4, [[0.5, 1.0, 1.5, 2.0], [2.5, 3.0, 3.5, 4.0]], typecode='d')
+
+    assert fenwick.rect_sum(0, 1, 1, 2) == 9.0
+    fenwick.update(1, 3, 0.25)
+    assert fenwick.rect_sum(1, 0, 1, 3) == 13.25
+
+
+def test_batched():
+    fenwick = FenwickTree2D(3, 3)
+
+    fenwick.update_many([0, 1, 2], [0, 1, 2], [1, 2, 3])
+    assert fenwick.rect_sum_many([0, 1, 0], [0, 1, 2], [2, 2, 0], [2, 2, 2]) == [6, 5, 0]
+
+    try:
+        fenwick.update_many([0], [0, 1], [1])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_grid_shape_mismatch():
+    for grid in ([[1, 2], [3]], [[1, 2], [3, 4, 5]], [[1, 2]], [[1, 2], [3, 4], [5, 6]]):
+        try:
+            FenwickTree2D(2, 2, grid)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+def test_matches_naive():
+    random.seed(13)
+    width, height = 11, 7
+    grid = [[random.randint(-10, 10) for _ in range(height)] for _ in range(width)]
+    fenwick = FenwickTree2D(width, height, grid)
+
+    for _ in range(200):
+        x = random.randrange(width)
+        y = random.randrange(height)
+        delta = random.randint(-10, 10)
+        grid[x][y] += delta
+        fenwick.update(x, y, delta)
+
+        x1 = random.randrange(width)
+        x2 = random.randrange(x1, width)
+        y1 = random.randrange(height)
+        y2 = random.randrange(y1, height)
+        assert fenwick.rect_sum(x1, y1, x2, y2) == _naive_rect_sum(grid, x1, y1, x2, y2)
+
+
+if __name__ == "__main__":
+    test_rect_sum()
+    test_update()
+    test_non_square_and_float()
+    test_batched()
+    test_grid_shape_mismatch()
+    test_matches_naive()
+    print("All 2D Fenwick Tree tests passed!")
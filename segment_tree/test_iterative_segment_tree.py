@@ -0,0 +1,254 @@
+"""
+Tests for Iterative Segment Tree implementation
+"""
+
+import sys
+import os
+import numbers
+import random
+from array import array
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from iterative_segment_tree import IterativeSegmentTree, IterativeSegmentTreeMin
+
+
+def test_sum_query():
+    arr = [1, 3, 5, 7, 9, 11]
+    seg_tree = IterativeSegmentTree(arr)
+
+    assert seg_tree.query(1, 3) == 15  # 3 + 5 + 7
+    assert seg_tree.query(0, 5) == 36
+    assert seg_tree.query(2, 4) == 21  # 5 + 7 + 9
+    assert seg_tree.query(4, 2) == 0  # invalid range
+
+
+def test_sum_update():
+    arr = [1, 3, 5, 7, 9, 11]
+    seg_tree = IterativeSegmentTree(arr)
+
+    seg_tree.update(2, 6)
+    assert seg_tree.query(1, 3) == 16  # 3 + 6 + 7
+    assert seg_tree.query(2, 2) == 6
+
+
+def test_float_values():
+    seg_tree = IterativeSegmentTree([1, 2, 3])
+    assert seg_tree.tree.typecode == 'q'
+
+    # Writing a float widens the integer storage
+    seg_tree.update(1, 2.5)
+    assert seg_tree.tree.typecode == 'd'
+    assert seg_tree.query(0, 2) == 6.5
+
+    seg_tree = IterativeSegmentTree([0.5, 1.5])
+    assert seg_tree.query(0, 1) == 2.0
+
+
+def test_large_integers():
+    def check(tree, arr, combine):
+        for left in range(len(arr)):
+            for right in range(left, len(arr)):
+                assert tree.query(left, right) == combine(arr[left:right + 1])
+
+    # Sums beyond 64 bits during the build
+    arr = [2 ** 62, 2 ** 62, 1]
+    seg_tree = IterativeSegmentTree(arr)
+    check(seg_tree, arr, sum)
+
+    # A leaf that fits but whose ancestors overflow partway up the path
+    arr = [1, 2, 3, 4, 5]
+    seg_tree = IterativeSegmentTree(arr)
+    seg_tree.update(0, 2 ** 63 - 1)
+    arr[0] = 2 ** 63 - 1
+    check(seg_tree, arr, sum)
+
+    seg_tree.update(3, 2 ** 64)
+    arr[3] = 2 ** 64
+    check(seg_tree, arr, sum)
+
+    # Batched updates overflowing after some nodes were already rewritten
+    arr = [1, 2, 3, 4, 5, 6]
+    seg_tree = IterativeSegmentTree(arr)
+    seg_tree.update_many([1, 4, 5], [7, 2 ** 63 - 1, 2 ** 63 - 1])
+    arr[1], arr[4], arr[5] = 7, 2 ** 63 - 1, 2 ** 63 - 1
+    check(seg_tree, arr, sum)
+
+    # Leaves beyond 64 bits in the min tree and in the input array
+    arr = [5, 2 ** 70, 3]
+    seg_tree_min = IterativeSegmentTreeMin(arr)
+    seg_tree_min.update(2, 2 ** 80)
+    arr[2] = 2 ** 80
+    seg_tree_min.update_many([0], [-2 ** 90])
+    arr[0] = -2 ** 90
+    check(seg_tree_min, arr, min)
+
+
+def test_min_query_and_update():
+    arr = [4, 2, 6, 1, 8, 5]
+    seg_tree_min = IterativeSegmentTreeMin(arr)
+
+    assert seg_tree_min.query(0, 2) == 2  # min(4, 2, 6)
+    assert seg_tree_min.query(2, 5) == 1  # min(6, 1, 8, 5)
+
+    seg_tree_min.update(3, 9)
+    assert seg_tree_min.query(2, 5) == 5  # min(6, 9, 8, 5)
+    assert seg_tree_min.query(0, 5) == 2
+
+
+def test_matches_naive():
+    random.seed(2)
+    for n in (1, 2, 7, 16, 33):
+        arr = [random.randint(-100, 100) for _ in range(n)]
+        sum_tree = IterativeSegmentTree(arr)
+        min_tree = IterativeSegmentTreeMin(arr)
+
+        for _ in range(100):
+            index = random.randrange(n)
+            value = random.randint(-100, 100)
+            arr[index] = value
+            sum_tree.update(index, value)
+            min_tree.update(index, value)
+
+            left = random.randrange(n)
+            right = random.randrange(left, n)
+            assert sum_tree.query(left, right) == sum(arr[left:right + 1])
+            assert min_tree.query(left, right) == min(arr[left:right + 1])
+
+
+def test_empty_array():
+    assert IterativeSegmentTree([]).query(0, 0) == 0
+    assert IterativeSegmentTreeMin([]).query(0, 0) == float('inf')
+
+
+def test_build_from_buffer():
+    # 8-byte int/float buffers (array.array, NumPy int64/float64) are copied
+    # byte for byte instead of element by element
+    seg_tree = IterativeSegmentTree(array('q', [1, 3, 5, 7]))
+    assert seg_tree.tree.typecode == 'q'
+    assert seg_tree.query(0, 3) == 16
+
+    seg_tree_min = IterativeSegmentTreeMin(array('d', [2.5, 0.5, 1.5]))
+    assert seg_tree_min.tree.typecode == 'd'
+    assert seg_tree_min.query(0, 2) == 0.5
+
+    # Other buffer formats fall back to the generic path
+    seg_tree = IterativeSegmentTree(array('i', [1, 2, 3]))
+    assert seg_tree.query(0, 2) == 6
+
+
+class Int32:
+    """An integer type that is not an int, like a NumPy integer scalar."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __index__(self):
+        return self.value
+
+
+numbers.Integral.register(Int32)
+
+
+def test_integral_values_keep_integer_storage():
+    arr = [Int32(2 ** 30), Int32(3), Int32(-1)]
+    seg_tree = IterativeSegmentTree(arr)
+    assert seg_tree.tree.typecode == 'q'
+    assert seg_tree.query(0, 2) == 2 ** 30 + 2
+
+    seg_tree_min = IterativeSegmentTreeMin(arr)
+    assert seg_tree_min.tree.typecode == 'q'
+    assert seg_tree_min.query(0, 2) == -1
+
+
+def test_numpy_integer_arrays():
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    # Neither array can be copied byte for byte
+    reversed_int64 = numpy.array([1, 2, 3, 2 ** 60 + 1], dtype=numpy.int64)[::-1]
+    int32 = numpy.array([1, 2, 3], dtype=numpy.int32)
+
+    seg_tree = IterativeSegmentTree(reversed_int64)
+    assert seg_tree.tree.typecode == 'q'
+    assert seg_tree.query(0, 0) == 2 ** 60 + 1
+    assert seg_tree.query(0, 3) == 2 ** 60 + 7
+
+    seg_tree = IterativeSegmentTree(int32)
+    assert seg_tree.tree.typecode == 'q'
+    result = seg_tree.query(0, 2)
+    assert result == 6 and isinstance(result, int)
+
+
+def test_query_many():
+    arr = [1, 3, 5, 7, 9, 11]
+    seg_tree = IterativeSegmentTree(arr)
+    seg_tree_min = IterativeSegmentTreeMin(arr)
+
+    lefts = [0, 1, 2, 4, 3]
+    rights = [5, 3, 2, 5, 1]
+    assert seg_tree.query_many(lefts, rights) == [36, 15, 5, 20, 0]
+    assert seg_tree_min.query_many(lefts, rights) == [1, 3, 5, 9, float('inf')]
+
+    try:
+        seg_tree.query_many([0, 1], [2])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_query_many_paths_match_query():
+    random.seed(5)
+    arr = [random.randint(-50, 50) for _ in range(100)]
+    trees = [IterativeSegmentTree(arr), IterativeSegmentTreeMin(arr),
+             IterativeSegmentTree([value + 0.5 for value in arr]),
+             IterativeSegmentTree(arr + [2 ** 70])]
+
+    # Small batches walk the tree; batches of n ranges or more use the
+    # prefix sums / sparse table path
+    for size in (3, 200):
+        lefts = [random.randrange(-5, 105) for _ in range(size)]
+        rights = [random.randrange(-5, 105) for _ in range(size)]
+        for tree in trees:
+            assert tree.query_many(lefts, rights) == [
+                tree.query(left, right) for left, right in zip(lefts, rights)]
+
+
+def test_update_many():
+    random.seed(4)
+    arr = [random.randint(-100, 100) for _ in range(45)]
+    sum_tree = IterativeSegmentTree(arr)
+    min_tree = IterativeSegmentTreeMin(arr)
+
+    for _ in range(20):
+        indices = [random.randrange(len(arr)) for _ in range(10)]
+        values = [random.randint(-100, 100) for _ in range(10)]
+        for index, value in zip(indices, values):
+            arr[index] = value
+        sum_tree.update_many(indices, values)
+        min_tree.update_many(indices, values)
+
+        lefts = list(range(len(arr)))
+        rights = [random.randrange(left, len(arr)) for left in lefts]
+        assert sum_tree.query_many(lefts, rights) == [
+            sum(arr[left:right + 1]) for left, right in zip(lefts, rights)]
+        assert min_tree.query_many(lefts, rights) == [
+            min(arr[left:right + 1]) for left, right in zip(lefts, rights)]
+
+
+if __name__ == "__main__":
+    test_sum_query()
+    test_sum_update()
+    test_float_values()
+    test_large_integers()
+    test_min_query_and_update()
+    test_matches_naive()
+    test_empty_array()
+    test_build_from_buffer()
+    test_integral_values_keep_integer_storage()
+    test_numpy_integer_arrays()
+    test_query_many()
+    test_query_many_paths_match_query()
+    test_update_many()
+    print("All Iterative Segment Tree tests passed!")
@@ -0,0 +1,95 @@
+"""
+Tests for Merge Sort Tree implementation
+"""
+
+import sys
+import os
+import numbers
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from merge_sort_tree import MergeSortTree
+
+
+def test_count_less():
+    tree = MergeSortTree([5, 1, 4, 2, 8, 3, 7])
+
+    assert tree.count_less(0, 4, 5) == 3  # 1, 4, 2
+    assert tree.count_less(0, 6, 1) == 0
+    assert tree.count_less(0, 6, 100) == 7
+    assert tree.count_less(4, 4, 9) == 1
+    assert tree.count_less_equal(0, 4, 5) == 4
+    assert tree.count_less(3, 1, 5) == 0
+
+
+def test_kth_smallest():
+    tree = MergeSortTree([5, 1, 4, 2, 8, 3, 7])
+
+    assert tree.kth_smallest(0, 6, 0) == 1
+    assert tree.kth_smallest(0, 6, 6) == 8
+    assert tree.kth_smallest(2, 6, 2) == 4  # sorted: 2 3 4 7 8
+    assert tree.kth_smallest(2, 6, 5) is None
+    assert tree.kth_smallest(6, 2, 0) is None
+
+
+def test_duplicates_and_floats():
+    tree = MergeSortTree([2.5, 1.0, 2.5, 2.5, 0.5])
+
+    assert tree.typecode == 'd'
+    assert tree.count_less(0, 4, 2.5) == 2
+    assert tree.kth_smallest(0, 3, 1) == 2.5
+    assert tree.kth_smallest(1, 4, 1) == 1.0
+
+
+def test_matches_naive():
+    random.seed(12)
+    for n in (1, 2, 9, 32, 50):
+        arr = [random.randint(-20, 20) for _ in range(n)]
+        tree = MergeSortTree(arr)
+
+        for _ in range(100):
+            left = random.randrange(n)
+            right = random.randrange(left, n)
+            window = sorted(arr[left:right + 1])
+            x = random.randint(-25, 25)
+            k = random.randrange(len(window))
+
+            assert tree.count_less(left, right, x) == sum(1 for v in window if v < x)
+            assert tree.kth_smallest(left, right, k) == window[k]
+
+
+class Int32:
+    """An integer type that is not an int, like a NumPy integer scalar."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __index__(self):
+        return self.value
+
+
+numbers.Integral.register(Int32)
+
+
+def test_integral_values_keep_integer_storage():
+    tree = MergeSortTree([Int32(2 ** 60 + 1), Int32(2 ** 60), Int32(3)])
+    assert tree.typecode == 'q'
+    assert tree.kth_smallest(0, 2, 2) == 2 ** 60 + 1
+    assert tree.count_less(0, 2, 2 ** 60 + 1) == 2
+
+
+def test_empty_array():
+    tree = MergeSortTree([])
+
+    assert tree.count_less(0, 0, 1) == 0
+    assert tree.kth_smallest(0, 0, 0) is None
+
+
+if __name__ == "__main__":
+    test_count_less()
+    test_kth_smallest()
+    test_duplicates_and_floats()
+    test_matches_naive()
+    test_integral_values_keep_integer_storage()
+    test_empty_array()
+    print("All Merge Sort Tree tests passed!")
@@ -0,0 +1,143 @@
+"""
+Tests for Memory-Mapped Segment Tree implementation
+"""
+
+import sys
+import os
+import random
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mmap_segment_tree import MmapSegmentTree
+
+
+def test_query_and_update():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        with MmapSegmentTree.create(path, [1, 3, 5, 7, 9, 11]) as tree:
+            assert tree.query(1, 3) == 15
+            assert tree.query(0, 5) == 36
+            assert tree.query(3, 1) == 0
+
+            tree.update(2, 6)
+            assert tree.query(1, 3) == 16
+
+
+def test_reopen_without_rebuild():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        with MmapSegmentTree.create(path, [1, 3, 5, 7, 9, 11]) as tree:
+            tree.update(0, 10)
+
+        size = os.path.getsize(path)
+        assert size == MmapSegmentTree.HEADER.size + 2 * 6 * 8
+
+        with MmapSegmentTree(path, readonly=True) as tree:
+            assert tree.n == 6
+            assert tree.query(0, 5) == 45
+            try:
+                tree.update(0, 1)
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+
+
+def test_streamed_build():
+    random.seed(10)
+    values = [random.randint(-1000, 1000) for _ in range(3 * MmapSegmentTree.CHUNK + 17)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        stream = (value for value in values)
+        with MmapSegmentTree.create(path, stream, n=len(values)) as tree:
+            for _ in range(50):
+                left = random.randrange(len(values))
+                right = random.randrange(left, len(values))
+                assert tree.query(left, right) == sum(values[left:right + 1])
+
+
+def test_float_cells():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        with MmapSegmentTree.create(path, [0.5, 1.5, 2.0], typecode='d') as tree:
+            assert tree.query(0, 2) == 4.0
+
+        with MmapSegmentTree(path) as tree:
+            assert tree.typecode == 'd'
+            assert tree.query(1, 2) == 3.5
+
+
+def test_invalid_input():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        try:
+            MmapSegmentTree.create(path, iter([1, 2]), n=3)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+        assert not os.path.exists(path)
+
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 64)
+        try:
+            MmapSegmentTree(path)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+def test_rejected_value_removes_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        try:
+            MmapSegmentTree.create(path, iter([1, 2.5, 3]), n=3)
+            assert False, "expected TypeError"
+        except TypeError:
+            pass
+        assert not os.path.exists(path)
+
+        # The leaves fit in int64 but their sum does not
+        try:
+            MmapSegmentTree.create(path, [2 ** 62, 2 ** 62])
+            assert False, "expected an overflow error"
+        except (OverflowError, ValueError):
+            pass
+        assert not os.path.exists(path)
+
+
+def test_rejected_update_leaves_file_unchanged():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        with MmapSegmentTree.create(path, [1, 2, 3, 4]) as tree:
+            for value in (2 ** 63 - 1, 2.5):
+                try:
+                    tree.update(0, value)
+                    assert False, "expected the update to be rejected"
+                except (OverflowError, TypeError):
+                    pass
+            assert tree.query(0, 0) == 1
+            assert tree.query(0, 1) == 3
+            assert tree.query(0, 3) == 10
+
+        with MmapSegmentTree(path) as tree:
+            assert [tree.query(i, i) for i in range(4)] == [1, 2, 3, 4]
+            assert tree.query(0, 3) == 10
+
+
+def test_empty_array():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.bin")
+        with MmapSegmentTree.create(path, []) as tree:
+            assert tree.query(0, 0) == 0
+
+
+if __name__ == "__main__":
+    test_query_and_update()
+    test_reopen_without_rebuild()
+    test_streamed_build()
+    test_float_cells()
+    test_invalid_input()
+    test_rejected_value_removes_file()
+    test_rejected_update_leaves_file_unchanged()
+    test_empty_array()
+    print("All Memory-Mapped Segment Tree tests passed!")
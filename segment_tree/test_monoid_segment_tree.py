@@ -0,0 +1,101 @@
+"""
+Tests for Monoid Segment Tree implementation
+"""
+
+import sys
+import os
+import math
+import operator
+import random
+from functools import reduce
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from monoid_segment_tree import MonoidSegmentTree, OPERATIONS
+
+
+def test_builtin_operations():
+    arr = [12, 18, 7, 3, 24, 9]
+
+    assert MonoidSegmentTree(arr, 'sum').query(1, 3) == 28
+    assert MonoidSegmentTree(arr, 'min').query(0, 2) == 7
+    assert MonoidSegmentTree(arr, 'max').query(2, 5) == 24
+    assert MonoidSegmentTree(arr, 'gcd').query(0, 1) == 6
+    assert MonoidSegmentTree(arr, 'xor').query(0, 5) == 12 ^ 18 ^ 7 ^ 3 ^ 24 ^ 9
+    assert MonoidSegmentTree(arr, 'or').query(3, 4) == 3 | 24
+    assert MonoidSegmentTree(arr, 'and').query(0, 1) == 12 & 18
+
+
+def test_builtin_function_selects_fast_path():
+    seg_tree = MonoidSegmentTree([4, 2, 6], min)
+    assert seg_tree.identity == float('inf')
+    assert seg_tree.query(0, 2) == 2
+
+    seg_tree = MonoidSegmentTree([8, 12], math.gcd)
+    assert seg_tree.query(0, 1) == 4
+
+
+def test_update():
+    arr = [4, 2, 6, 1, 8, 5]
+    seg_tree = MonoidSegmentTree(arr, 'min')
+
+    seg_tree.update(3, 9)
+    assert seg_tree.query(2, 5) == 5  # min(6, 9, 8, 5)
+    assert seg_tree.query(0, 5) == 2
+
+
+def test_custom_non_commutative_combine():
+    words = MonoidSegmentTree(["a", "b", "c", "d", "e"], operator.add, "")
+
+    assert words.query(0, 4) == "abcde"
+    assert words.query(1, 3) == "bcd"
+
+    words.update(2, "X")
+    assert words.query(0, 4) == "abXde"
+
+
+def test_custom_combine_requires_identity():
+    try:
+        MonoidSegmentTree([1, 2], lambda a, b: a * b)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    try:
+        MonoidSegmentTree([1, 2], 'product')
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_matches_naive():
+    random.seed(3)
+    for name, (combine, identity, _) in OPERATIONS.items():
+        for n in (1, 5, 16, 21):
+            arr = [random.randint(1, 1000) for _ in range(n)]
+            seg_tree = MonoidSegmentTree(arr, name)
+
+            for _ in range(50):
+                index = random.randrange(n)
+                arr[index] = random.randint(1, 1000)
+                seg_tree.update(index, arr[index])
+
+                left = random.randrange(n)
+                right = random.randrange(left, n)
+                expected = reduce(combine, arr[left:right + 1], identity)
+                assert seg_tree.query(left, right) == expected
+
+
+def test_empty_array_and_invalid_range():
+    assert MonoidSegmentTree([], 'sum').query(0, 0) == 0
+    assert MonoidSegmentTree([1, 2], 'max').query(1, 0) == float('-inf')
+
+
+if __name__ == "__main__":
+    test_builtin_operations()
+    test_builtin_function_selects_fast_path()
+    test_update()
+    test_custom_non_commutative_combine()
+    test_custom_combine_requires_identity()
+    test_matches_naive()
+    test_empty_array_and_invalid_range()
+    print("All Monoid Segment Tree tests passed!")
@@ -0,0 +1,101 @@
+"""
+Tests for Persistent Segment Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from persistent_segment_tree import PersistentSegmentTree
+
+
+def test_query_initial_version():
+    tree = PersistentSegmentTree([1, 3, 5, 7, 9, 11])
+
+    assert tree.query(0, 1, 3) == 15
+    assert tree.query(0, 0, 5) == 36
+    assert tree.query(0, 4, 2) == 0
+
+
+def test_updates_create_versions():
+    tree = PersistentSegmentTree([1, 3, 5, 7, 9, 11])
+
+    v1 = tree.update(0, 2, 6)
+    v2 = tree.update(v1, 0, 10)
+    v3 = tree.update(0, 5, 0)  # branch off the original version
+
+    assert tree.latest == v3
+    assert tree.query(0, 0, 5) == 36
+    assert tree.query(v1, 0, 5) == 37
+    assert tree.query(v2, 0, 5) == 46
+    assert tree.query(v3, 0, 5) == 25
+    assert tree.versions() == [0, v1, v2, v3]
+
+
+def test_structural_sharing():
+    tree = PersistentSegmentTree(list(range(16)))
+    v1 = tree.update(0, 0, 100)
+
+    old_root = tree._roots[0]
+    new_root = tree._roots[v1]
+    # Only the left half changed, so the right subtree is shared
+    assert old_root[2] is new_root[2]
+    assert old_root[1] is not new_root[1]
+
+
+def test_release():
+    tree = PersistentSegmentTree([1, 2, 3])
+    v1 = tree.update(0, 1, 5)
+    v2 = tree.update(v1, 2, 5)
+
+    tree.release(v1)
+    assert tree.versions() == [0, v2]
+    assert tree.query(v2, 0, 2) == 11
+
+    try:
+        tree.query(v1, 0, 2)
+        assert False, "expected KeyError"
+    except KeyError:
+        pass
+
+    tree.release(v2)
+    assert tree.latest == 0
+
+
+def test_matches_naive():
+    random.seed(8)
+    arr = [random.randint(0, 100) for _ in range(25)]
+    tree = PersistentSegmentTree(arr)
+    history = {0: list(arr)}
+
+    for _ in range(100):
+        base = random.choice(list(history))
+        index = random.randrange(len(arr))
+        value = random.randint(0, 100)
+        version = tree.update(base, index, value)
+        history[version] = list(history[base])
+        history[version][index] = value
+
+    for version, values in history.items():
+        left = random.randrange(len(arr))
+        right = random.randrange(left, len(arr))
+        assert tree.query(version, left, right) == sum(values[left:right + 1])
+
+
+def test_empty_array():
+    tree = PersistentSegmentTree([])
+
+    assert tree.query(0, 0, 0) == 0
+    version = tree.update(0, 0, 5)
+    assert tree.query(version, 0, 0) == 0
+
+
+if __name__ == "__main__":
+    test_query_initial_version()
+    test_updates_create_versions()
+    test_structural_sharing()
+    test_release()
+    test_matches_naive()
+    test_empty_array()
+    print("All Persistent Segment Tree tests passed!")
@@ -4,6 +4,7 @@ Tests for Segment Tree implementation
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from segment_tree import SegmentTree, SegmentTreeMin
@@ -62,6 +63,129 @@ def test_empty_array():
     assert seg_tree.query(0, 0) == 0
 
 
+def test_range_add():
+    arr = [1, 3, 5, 7, 9, 11]
+    seg_tree = SegmentTree(arr)
+    
+    seg_tree.range_add(1, 4, 2)
+    assert seg_tree.query(0, 5) == 44  # 36 + 4 * 2
+    assert seg_tree.query(1, 1) == 5
+    assert seg_tree.query(4, 5) == 22  # 11 + 11
+    assert seg_tree.query(0, 0) == 1
+
+
+def test_range_assign():
+    arr = [1, 3, 5, 7, 9, 11]
+    seg_tree = SegmentTree(arr)
+    
+    seg_tree.range_assign(0, 3, 4)
+    assert seg_tree.query(0, 5) == 36  # 4 * 4 + 9 + 11
+    assert seg_tree.query(2, 4) == 17  # 4 + 4 + 9
+    
+    # Assign after add discards the pending addition
+    seg_tree.range_add(0, 5, 1)
+    seg_tree.range_assign(1, 2, 0)
+    assert seg_tree.query(0, 5) == 32  # 5 + 0 + 0 + 5 + 10 + 12
+
+
+def test_range_updates_match_naive():
+    random.seed(1)
+    arr = [random.randint(-50, 50) for _ in range(37)]
+    seg_tree = SegmentTree(arr)
+    
+    for _ in range(300):
+        left = random.randrange(len(arr))
+        right = random.randrange(left, len(arr))
+        op = random.randrange(4)
+        
+        if op == 0:
+            delta = random.randint(-10, 10)
+            seg_tree.range_add(left, right, delta)
+            for i in range(left, right + 1):
+                arr[i] += delta
+        elif op == 1:
+            value = random.randint(-10, 10)
+            seg_tree.range_assign(left, right, value)
+            for i in range(left, right + 1):
+                arr[i] = value
+        elif op == 2:
+            value = random.randint(-10, 10)
+            seg_tree.update(left, value)
+            arr[left] = value
+        else:
+            assert seg_tree.query(left, right) == sum(arr[left:right + 1])
+
+
+def test_prefix_lower_bound():
+    seg_tree = SegmentTree([1, 3, 5, 7, 9, 11])  # prefix sums 1 4 9 16 25 36
+    
+    assert seg_tree.prefix_lower_bound(1) == 0
+    assert seg_tree.prefix_lower_bound(5) == 2
+    assert seg_tree.prefix_lower_bound(16) == 3
+    assert seg_tree.prefix_lower_bound(37) == 6  # past the end
+    
+    # Pending lazy tags are pushed while descending
+    seg_tree.range_assign(0, 5, 2)
+    assert seg_tree.prefix_lower_bound(7) == 3
+
+
+def test_find_first():
+    seg_tree = SegmentTree([1, 3, 5, 7, 9, 11])
+    
+    assert seg_tree.find_first(0, lambda total: total >= 9) == 2
+    assert seg_tree.find_first(2, lambda total: total >= 12) == 3  # 5 + 7
+    assert seg_tree.find_first(5, lambda total: total > 11) == -1
+    assert seg_tree.find_first(6, lambda total: True) == -1
+    
+    seg_tree_min = SegmentTreeMin([4, 2, 6, 1, 8, 5])
+    assert seg_tree_min.find_first(0, lambda m: m < 3) == 1
+    assert seg_tree_min.find_first(2, lambda m: m < 3) == 3
+    assert seg_tree_min.find_first(4, lambda m: m < 5) == -1
+
+
+def test_argmin():
+    seg_tree_min = SegmentTreeMin([4, 2, 6, 2, 8, 5])
+    
+    assert seg_tree_min.argmin(0, 5) == 1  # leftmost of the tied minimums
+    assert seg_tree_min.argmin(2, 5) == 3
+    assert seg_tree_min.argmin(4, 5) == 5
+    assert seg_tree_min.argmin(5, 4) == -1
+    
+    seg_tree_min.update(3, 0)
+    assert seg_tree_min.argmin(0, 5) == 3
+
+
+def test_descent_matches_naive():
+    random.seed(9)
+    arr = [random.randint(0, 20) for _ in range(41)]
+    seg_tree = SegmentTree(arr)
+    seg_tree_min = SegmentTreeMin(arr)
+    
+    for _ in range(200):
+        left = random.randrange(len(arr))
+        right = random.randrange(left, len(arr))
+        window = arr[left:right + 1]
+        assert seg_tree_min.argmin(left, right) == left + window.index(min(window))
+        
+        k = random.randint(0, sum(arr) + 5)
+        prefix, expected = 0, len(arr)
+        for i, value in enumerate(arr):
+            prefix += value
+            if prefix >= k:
+                expected = i
+                break
+        assert seg_tree.prefix_lower_bound(k) == expected
+        
+        threshold = random.randint(0, 60)
+        total, expected = 0, -1
+        for i in range(left, len(arr)):
+            total += arr[i]
+            if total >= threshold:
+                expected = i
+                break
+        assert seg_tree.find_first(left, lambda s: s >= threshold) == expected
+
+
 if __name__ == "__main__":
     test_segment_tree_sum_query()
     test_segment_tree_sum_update()
@@ -69,4 +193,11 @@ if __name__ == "__main__":
     test_segment_tree_min_update()
     test_single_element()
     test_empty_array()
+    test_range_add()
+    test_range_assign()
+    test_range_updates_match_naive()
+    test_prefix_lower_bound()
+    test_find_first()
+    test_argmin()
+    test_descent_matches_naive()
     print("All Segment Tree tests passed!")
@@ -0,0 +1,151 @@
+"""
+Tests for Shared-Memory Segment Tree implementation
+"""
+
+import sys
+import os
+import multiprocessing
+import random
+import subprocess
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from shared_segment_tree import SharedSegmentTree
+
+
+def _worker_query(name, ranges, results):
+    """Attach from another process and report query results."""
+    with SharedSegmentTree(name) as tree:
+        results.put([tree.query(left, right) for left, right in ranges])
+
+
+def test_create_and_query():
+    with SharedSegmentTree.create([1, 3, 5, 7, 9, 11]) as tree:
+        assert tree.n == 6
+        assert tree.query(1, 3) == 15
+        assert tree.query(0, 5) == 36
+        assert tree.query(3, 1) == 0
+
+
+def test_attached_reader_sees_updates():
+    with SharedSegmentTree.create([1, 3, 5, 7, 9, 11]) as writer:
+        with SharedSegmentTree(writer.name) as reader:
+            assert not reader.owner
+            assert reader.query(1, 3) == 15
+
+            writer.update(2, 6)
+            assert reader.query(1, 3) == 16
+            assert reader.sequence == 2  # one completed write
+
+
+def test_rejected_update_keeps_readers_working():
+    with SharedSegmentTree.create([1, 3, 5]) as writer:
+        with SharedSegmentTree(writer.name) as reader:
+            for value in (2.5, 2 ** 70):
+                try:
+                    writer.update(1, value)
+                    assert False, "expected the update to be rejected"
+                except (TypeError, OverflowError):
+                    pass
+                assert reader.sequence % 2 == 0
+
+            # A leaf that fits but a sum that overflows int64 is rejected too
+            try:
+                writer.update(0, 2 ** 63 - 1)
+                assert False, "expected OverflowError"
+            except OverflowError:
+                pass
+
+            assert reader.sequence % 2 == 0
+            assert reader.query(0, 2) == 9
+            writer.update(1, 4)
+            assert reader.query(0, 2) == 10
+
+
+def test_rejected_build_frees_block():
+    name = f"segtree_test_{os.getpid()}"
+    for arr in ([1, 2.5, 3], [2 ** 62, 2 ** 62]):
+        try:
+            SharedSegmentTree.create(arr, name=name)
+            assert False, "expected the build to be rejected"
+        except (TypeError, OverflowError, ValueError):
+            pass
+
+        try:
+            SharedSegmentTree(name).close()
+            assert False, "expected the block to be freed"
+        except FileNotFoundError:
+            pass
+
+
+def test_float_values():
+    with SharedSegmentTree.create([0.5, 1.5], typecode='d') as writer:
+        with SharedSegmentTree(writer.name) as reader:
+            assert reader.typecode == 'd'
+            assert reader.query(0, 1) == 2.0
+
+
+def test_other_process_can_attach():
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return
+    context = multiprocessing.get_context('fork')
+
+    random.seed(14)
+    arr = [random.randint(0, 100) for _ in range(50)]
+    ranges = [(0, 49), (10, 20), (49, 49)]
+    with SharedSegmentTree.create(arr) as writer:
+        writer.update(15, 1000)
+        arr[15] = 1000
+
+        results = context.Queue()
+        process = context.Process(target=_worker_query, args=(writer.name, ranges, results))
+        process.start()
+        answer = results.get(timeout=10)
+        process.join(timeout=10)
+
+        assert process.exitcode == 0
+        assert answer == [sum(arr[left:right + 1]) for left, right in ranges]
+
+
+def test_reader_in_creator_process_keeps_registration():
+    # The resource tracker reports a KeyError on stderr when the owner
+    # unlinks a block whose registration a reader already removed
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'shared_segment_tree.py')
+    result = subprocess.run([sys.executable, script], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0
+    assert 'KeyError' not in result.stderr
+    assert 'leaked' not in result.stderr
+
+
+def test_unrelated_process_does_not_unlink():
+    # A separately started interpreter has its own resource tracker, which
+    # must not unlink the block when that interpreter exits
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); "
+            "from shared_segment_tree import SharedSegmentTree; "
+            "tree = SharedSegmentTree(sys.argv[2]); print(tree.query(0, 2)); tree.close()")
+    with SharedSegmentTree.create([1, 3, 5]) as writer:
+        result = subprocess.run(
+            [sys.executable, '-c', code, os.path.dirname(os.path.abspath(__file__)), writer.name],
+            capture_output=True, text=True, timeout=60)
+        assert result.stdout.strip() == '9'
+        assert result.stderr == ''
+
+        with SharedSegmentTree(writer.name) as reader:
+            assert reader.query(0, 2) == 9
+
+
+def test_empty_array():
+    with SharedSegmentTree.create([]) as tree:
+        assert tree.query(0, 0) == 0
+
+
+if __name__ == "__main__":
+    test_create_and_query()
+    test_attached_reader_sees_updates()
+    test_rejected_update_keeps_readers_working()
+    test_rejected_build_frees_block()
+    test_float_values()
+    test_other_process_can_attach()
+    test_reader_in_creator_process_keeps_registration()
+    test_unrelated_process_does_not_unlink()
+    test_empty_array()
+    print("All Shared-Memory Segment Tree tests passed!")
@@ -0,0 +1,103 @@
+"""
+Tests for Sliding Window Segment Tree implementation
+"""
+
+import sys
+import os
+import operator
+import random
+from collections import deque
+from functools import reduce
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sliding_window_segment_tree import SlidingWindowSegmentTree
+
+
+def test_push_and_evict():
+    window = SlidingWindowSegmentTree(3)
+
+    assert window.push(1) is None
+    assert window.push(2) is None
+    assert window.push(3) is None
+    assert len(window) == 3
+    assert window.query() == 6
+
+    assert window.push(4) == 1  # evicts the oldest sample
+    assert len(window) == 3
+    assert window.query() == 9  # 2 + 3 + 4
+
+
+def test_relative_offsets():
+    window = SlidingWindowSegmentTree(4, 'min')
+    for sample in [5, 1, 7, 3, 2, 4]:
+        window.push(sample)
+
+    # Window holds [7, 3, 2, 4], wrapping around the buffer
+    assert window.query(0, 0) == 7
+    assert window.query(0, 1) == 3
+    assert window.query(1, 3) == 2
+    assert window.query(3, 3) == 4
+    assert window.last(1) == 4
+    assert window.last(10) == 2
+    assert window.query(2, 5) == float('inf')
+
+
+def test_partial_window():
+    window = SlidingWindowSegmentTree(5, 'max')
+    assert window.query() == float('-inf')
+    assert window.last(3) == float('-inf')
+
+    window.push(3)
+    window.push(8)
+    assert window.query() == 8
+    assert window.query(0, 0) == 3
+
+
+def test_non_commutative_order():
+    window = SlidingWindowSegmentTree(3, operator.add, "")
+    for sample in "abcde":
+        window.push(sample)
+
+    assert window.query() == "cde"
+    assert window.query(0, 1) == "cd"
+    assert window.last(2) == "de"
+
+
+def test_matches_naive():
+    random.seed(11)
+    for capacity in (1, 2, 5, 8, 13):
+        windows = {name: SlidingWindowSegmentTree(capacity, name)
+                   for name in ('sum', 'min', 'max')}
+        recent = deque(maxlen=capacity)
+
+        for _ in range(100):
+            sample = random.randint(-50, 50)
+            recent.append(sample)
+            for window in windows.values():
+                window.push(sample)
+
+            left = random.randrange(len(recent))
+            right = random.randrange(left, len(recent))
+            values = list(recent)[left:right + 1]
+            assert windows['sum'].query(left, right) == sum(values)
+            assert windows['min'].query(left, right) == min(values)
+            assert windows['max'].query(left, right) == max(values)
+            assert windows['sum'].query() == reduce(operator.add, recent)
+
+
+def test_invalid_capacity():
+    try:
+        SlidingWindowSegmentTree(0)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_push_and_evict()
+    test_relative_offsets()
+    test_partial_window()
+    test_non_commutative_order()
+    test_matches_naive()
+    test_invalid_capacity()
+    print("All Sliding Window Segment Tree tests passed!")
@@ -0,0 +1,89 @@
+"""
+Tests for Sparse Table implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sparse_table import SparseTable
+from segment_tree import SegmentTreeMin
+from iterative_segment_tree import IterativeSegmentTreeMin
+
+
+def test_min_query():
+    sparse = SparseTable([4, 2, 6, 1, 8, 5])
+
+    assert sparse.query(0, 2) == 2  # min(4, 2, 6)
+    assert sparse.query(2, 5) == 1  # min(6, 1, 8, 5)
+    assert sparse.query(4, 4) == 8
+    assert sparse.query(3, 2) == float('inf')
+
+
+def test_max_query():
+    sparse = SparseTable([4, 2, 6, 1, 8, 5], 'max')
+
+    assert sparse.query(0, 3) == 6
+    assert sparse.query(3, 5) == 8
+    assert sparse.query(6, 6) == float('-inf')
+
+
+def test_argquery():
+    arr = [4, 1, 6, 1, 8, 8]
+    sparse_min = SparseTable(arr)
+    sparse_max = SparseTable(arr, 'max')
+
+    assert sparse_min.argquery(0, 5) == 1  # leftmost of the tied minimums
+    assert sparse_min.argquery(2, 5) == 3
+    assert sparse_max.argquery(0, 5) == 4
+    assert sparse_max.argquery(0, 2) == 2
+    assert sparse_min.argquery(5, 1) == -1
+
+
+def test_matches_naive():
+    random.seed(6)
+    for n in (1, 2, 3, 8, 13, 64, 100):
+        arr = [random.randint(-20, 20) for _ in range(n)]
+        sparse_min = SparseTable(arr)
+        sparse_max = SparseTable(arr, 'max')
+
+        for left in range(n):
+            for right in range(left, n):
+                window = arr[left:right + 1]
+                assert sparse_min.query(left, right) == min(window)
+                assert sparse_max.query(left, right) == max(window)
+                assert sparse_min.argquery(left, right) == left + window.index(min(window))
+                assert sparse_max.argquery(left, right) == left + window.index(max(window))
+
+
+def test_unknown_operation():
+    try:
+        SparseTable([1, 2], 'sum')
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_freeze():
+    arr = [4, 2, 6, 1, 8, 5]
+    for cls in (SegmentTreeMin, IterativeSegmentTreeMin):
+        seg_tree_min = cls(arr)
+        seg_tree_min.update(3, 9)
+        frozen = seg_tree_min.freeze()
+
+        assert isinstance(frozen, SparseTable)
+        assert frozen.query(2, 5) == 5  # min(6, 9, 8, 5)
+        assert frozen.argquery(0, 5) == 1
+
+    assert SegmentTreeMin([]).freeze().query(0, 0) == float('inf')
+
+
+if __name__ == "__main__":
+    test_min_query()
+    test_max_query()
+    test_argquery()
+    test_matches_naive()
+    test_unknown_operation()
+    test_freeze()
+    print("All Sparse Table tests passed!")
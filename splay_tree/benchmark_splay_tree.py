@@ -0,0 +1,61 @@
+"""
+Benchmarks for the Splay Tree implementation
+
+Run with:
+    python splay_tree/benchmark_splay_tree.py
+"""
+
+import sys
+import os
+import random
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'avl_tree'))
+
+from splay_tree import SplayTree
+from avl_tree import AVLTree
+
+
+def _zipf_lookups(keys, count, s):
+    """Draw count lookups where the i-th hottest key has weight 1 / i**s."""
+    hot = list(keys)
+    random.shuffle(hot)  # hot keys are spread over the key range
+    weights = [1 / rank ** s for rank in range(1, len(hot) + 1)]
+    return random.choices(hot, weights=weights, k=count), hot
+
+
+def _ops_per_second(func, values):
+    """Apply func to every value and return the throughput."""
+    start = time.perf_counter()
+    for value in values:
+        func(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def bench_zipf(n=100_000, lookups=200_000, exponents=(0.0, 0.8, 1.2, 1.5)):
+    """Compare search throughput of AVLTree and SplayTree under Zipfian access."""
+    random.seed(0)
+    keys = random.sample(range(10 * n), n)
+    sorted_keys = sorted(keys)
+
+    print(f"\nZipfian lookups, n={n}, {lookups} lookups (search ops/sec)")
+    for s in exponents:
+        workload, hot = _zipf_lookups(keys, lookups, s)
+        top = set(hot[:n // 100])
+        share = sum(key in top for key in workload) / lookups
+
+        avl = AVLTree.from_sorted(sorted_keys)
+        splay = SplayTree()
+        for key in keys:
+            splay.insert(key)
+
+        avl_rate = _ops_per_second(avl.search, workload)
+        splay_rate = _ops_per_second(splay.search, workload)
+        label = "uniform" if s == 0 else f"s={s}"
+        print(f"  {label:<8} top 1% of keys = {share:4.0%} of lookups:"
+              f"  AVLTree {avl_rate:10,.0f}  SplayTree {splay_rate:10,.0f}"
+              f"  ({splay_rate / avl_rate:4.1f}x)")
+
+
+if __name__ == "__main__":
+    bench_zipf()
@@ -0,0 +1,224 @@
+"""
+Splay Tree Implementation
+
+A splay tree is a self-adjusting binary search tree: every access moves the
+accessed value to the root with a sequence of rotations (a "splay"), halving
+the depth of the nodes along the way. No balance information is stored, yet
+all operations run in O(log n) amortized time, and frequently accessed values
+stay near the root, so skewed access patterns are much cheaper than the
+worst case.
+
+This version splays top-down in a single pass, without recursion or parent
+pointers.
+"""
+
+class TreeNode:
+    """Node in a splay tree."""
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+
+
+class SplayTree:
+    """Top-down splay tree with the usual insert/search/delete operations."""
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _splay(self, node, value):
+        """
+        Splay the subtree rooted at node around value and return the new root.
+
+        The new root holds value if it is present, otherwise the last node on
+        the search path for value. Nodes passed on the way down are hung onto
+        a left tree (all smaller) and a right tree (all larger), which are
+        reassembled under the new root at the end.
+        """
+        if node is None:
+            return None
+
+        header = TreeNode(None)
+        left_max = right_min = header  # header.right / header.left collect the two trees
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    break
+                if value < node.left.value:
+                    # Zig-zig: rotate right first
+                    child = node.left
+                    node.left = child.right
+                    child.right = node
+                    node = child
+                    if node.left is None:
+                        break
+                # Link node into the right tree
+                right_min.left = node
+                right_min = node
+                node = node.left
+            elif value > node.value:
+                if node.right is None:
+                    break
+                if value > node.right.value:
+                    # Zag-zag: rotate left first
+                    child = node.right
+                    node.right = child.left
+                    child.left = node
+                    node = child
+                    if node.right is None:
+                        break
+                # Link node into the left tree
+                left_max.right = node
+                left_max = node
+                node = node.right
+            else:
+                break
+
+        # Reassemble
+        left_max.right = node.left
+        right_min.left = node.right
+        node.left = header.right
+        node.right = header.left
+        return node
+
+    def insert(self, value):
+        """Insert a value and splay it to the root; duplicates are ignored."""
+        if self.root is None:
+            self.root = TreeNode(value)
+            self.size = 1
+            return
+
+        root = self._splay(self.root, value)
+        if root.value == value:
+            self.root = root
+            return
+
+        # The splayed root is value's neighbour: split around it
+        node = TreeNode(value)
+        if value < root.value:
+            node.left = root.left
+            node.right = root
+            root.left = None
+        else:
+            node.right = root.right
+            node.left = root
+            root.right = None
+        self.root = node
+        self.size += 1
+
+    def search(self, value):
+        """Search for a value, splaying it (or its neighbour) to the root."""
+        self.root = self._splay(self.root, value)
+        return self.root is not None and self.root.value == value
+
+    def delete(self, value):
+        """Delete a value from the tree. Returns True if the value was found."""
+        root = self._splay(self.root, value)
+        self.root = root
+        if root is None or root.value != value:
+            return False
+
+        if root.left is None:
+            self.root = root.right
+        else:
+            # Every value on the left is smaller, so splaying for value brings
+            # the left subtree's maximum up with no right child
+            self.root = self._splay(root.left, value)
+            self.root.right = root.right
+        self.size -= 1
+        return True
+
+    def find_min(self):
+        """Find the minimum value and splay it to the root."""
+        if self.root is None:
+            return None
+        node = self.root
+        while node.left:
+            node = node.left
+        self.root = self._splay(self.root, node.value)
+        return self.root.value
+
+    def find_max(self):
+        """Find the maximum value and splay it to the root."""
+        if self.root is None:
+            return None
+        node = self.root
+        while node.right:
+            node = node.right
+        self.root = self._splay(self.root, node.value)
+        return self.root.value
+
+    def inorder_traversal(self):
+        """
+        Inorder traversal (Left -> Root -> Right).
+        Returns sorted list of values.
+        """
+        result = []
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current.value)
+            current = current.right
+        return result
+
+    def height(self):
+        """Calculate the height of the tree."""
+        height = 0
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            next_level = []
+            for node in level:
+                if node.left:
+                    next_level.append(node.left)
+                if node.right:
+                    next_level.append(node.right)
+            level = next_level
+        return height
+
+    def is_valid_bst(self):
+        """Check if the tree is a valid BST."""
+        stack = [(self.root, float('-inf'), float('inf'))]
+        while stack:
+            node, min_val, max_val = stack.pop()
+            if not node:
+                continue
+
+            if node.value <= min_val or node.value >= max_val:
+                return False
+
+            stack.append((node.left, min_val, node.value))
+            stack.append((node.right, node.value, max_val))
+        return True
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = SplayTree()
+
+    values = [50, 30, 70, 20, 40, 60, 80]
+    for val in values:
+        tree.insert(val)
+
+    print("Splay Tree Operations:")
+    print(f"Inorder traversal (sorted): {tree.inorder_traversal()}")
+    print(f"Search 40: {tree.search(40)}")
+    print(f"Root after searching 40: {tree.root.value}")  # 40 moved to the root
+    print(f"Search 100: {tree.search(100)}")
+    print(f"Min value: {tree.find_min()}")
+    print(f"Max value: {tree.find_max()}")
+    print(f"Is valid BST: {tree.is_valid_bst()}")
+
+    print(f"\nDeleting 30...")
+    tree.delete(30)
+    print(f"Inorder traversal: {tree.inorder_traversal()}")
+    print(f"Size: {len(tree)}")
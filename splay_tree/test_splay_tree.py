@@ -0,0 +1,112 @@
+"""
+Tests for Splay Tree implementation
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from splay_tree import SplayTree
+
+
+def test_insert_and_search():
+    tree = SplayTree()
+    for val in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(val)
+
+    assert tree.search(40) == True
+    assert tree.root.value == 40  # accessed value moves to the root
+    assert tree.search(45) == False
+    assert tree.root.value in (40, 50)  # a neighbour of the missing value
+    assert tree.is_valid_bst() == True
+
+
+def test_duplicates_ignored():
+    tree = SplayTree()
+    for val in [5, 3, 5, 3]:
+        tree.insert(val)
+    assert len(tree) == 2
+    assert tree.inorder_traversal() == [3, 5]
+
+
+def test_delete():
+    tree = SplayTree()
+    for val in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(val)
+
+    assert tree.delete(50) == True
+    assert tree.delete(20) == True
+    assert tree.delete(99) == False
+    assert tree.inorder_traversal() == [30, 40, 60, 70, 80]
+    assert len(tree) == 5
+    assert tree.is_valid_bst() == True
+
+    for val in [30, 40, 60, 70, 80]:
+        tree.delete(val)
+    assert tree.root is None
+    assert tree.delete(30) == False
+
+
+def test_empty_tree():
+    tree = SplayTree()
+    assert tree.search(1) == False
+    assert tree.inorder_traversal() == []
+    assert tree.find_min() is None
+    assert tree.find_max() is None
+    assert tree.height() == 0
+
+
+def test_min_max():
+    tree = SplayTree()
+    for val in [8, 3, 10, 1, 6]:
+        tree.insert(val)
+    assert tree.find_min() == 1
+    assert tree.root.value == 1
+    assert tree.find_max() == 10
+    assert tree.root.value == 10
+
+
+def test_sorted_access_is_iterative():
+    # Sorted inserts build a path; splaying over it must not recurse
+    tree = SplayTree()
+    n = sys.getrecursionlimit() * 2
+    for val in range(n):
+        tree.insert(val)
+
+    assert tree.search(0) == True
+    assert tree.height() < n  # splaying the deepest node roughly halved the path
+    assert tree.inorder_traversal() == list(range(n))
+
+
+def test_random_operations_match_set():
+    random.seed(25)
+    tree = SplayTree()
+    values = set()
+
+    for _ in range(5000):
+        val = random.randrange(500)
+        op = random.random()
+        if op < 0.4:
+            tree.insert(val)
+            values.add(val)
+        elif op < 0.7:
+            assert tree.delete(val) == (val in values)
+            values.discard(val)
+        else:
+            assert tree.search(val) == (val in values)
+
+    assert len(tree) == len(values)
+    assert tree.inorder_traversal() == sorted(values)
+    assert tree.is_valid_bst() == True
+
+
+if __name__ == "__main__":
+    test_insert_and_search()
+    test_duplicates_ignored()
+    test_delete()
+    test_empty_tree()
+    test_min_max()
+    test_sorted_access_is_iterative()
+    test_random_operations_match_set()
+    print("All Splay Tree tests passed!")